@@ -48,6 +48,34 @@ class Settings(BaseSettings):
         default=False,
         description="Verify SSL certificates (set False for Emulator)",
     )
+    cosmos_max_connections: int = Field(
+        default=200,
+        description="Size of the HTTP connection pool shared by every Cosmos DB request",
+        ge=1,
+        le=1000,
+    )
+    cosmos_keepalive_seconds: int = Field(
+        default=300,
+        description="How long idle pooled Cosmos DB connections are kept open",
+        ge=1,
+        le=3600,
+    )
+    cosmos_throttle_retries: int = Field(
+        default=9,
+        description="Times the SDK retries a throttled (429) Cosmos DB request",
+        ge=1,
+        le=30,
+    )
+    cosmos_throttle_max_wait_seconds: int = Field(
+        default=30,
+        description="Total time the SDK may spend waiting out 429s on one request",
+        ge=1,
+        le=300,
+    )
+    cosmos_warmup: bool = Field(
+        default=False,
+        description="Open the Cosmos DB connection pool in the background at startup",
+    )
 
     # ==========================================================================
     # API Security
@@ -10,18 +10,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
+import aiohttp
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.cosmos.aio import CosmosClient
 from azure.cosmos.exceptions import CosmosHttpResponseError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from azure.cosmos.aio import ContainerProxy, DatabaseProxy
 
     from config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Readiness probes arrive every few seconds per pod; one database read answers
+# all of them within this window.
+HEALTH_CHECK_TTL_SECONDS = 3.0
+
 
 class CosmosClientManager:
     """
@@ -39,8 +48,10 @@ class CosmosClientManager:
     _database: DatabaseProxy | None = None
     _settings: Settings | None = None
     _credential: Any = None
+    _session: aiohttp.ClientSession | None = None
     _initialized: bool = False
     _init_lock: asyncio.Lock | None = None
+    _health_cache: tuple[dict[str, str], float] | None = None
 
     def __new__(cls) -> CosmosClientManager:
         if cls._instance is None:
@@ -116,10 +127,24 @@ class CosmosClientManager:
                 credential = settings.cosmos_key.get_secret_value()
                 logger.info("Using account key authentication")
 
+            # One explicitly sized, long keep-alive pool for every repository,
+            # instead of the transport's default session.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=settings.cosmos_max_connections,
+                    limit_per_host=settings.cosmos_max_connections,
+                    keepalive_timeout=settings.cosmos_keepalive_seconds,
+                ),
+            )
             self._client = CosmosClient(
                 url=settings.cosmos_endpoint,
                 credential=credential,
                 connection_verify=settings.cosmos_ssl_verify,
+                transport=AioHttpTransport(session=self._session, session_owner=False),
+                # The SDK waits out 429s itself, honouring x-ms-retry-after-ms;
+                # these bound how long a request may do so before it fails.
+                retry_throttle_total=settings.cosmos_throttle_retries,
+                retry_throttle_backoff_max=settings.cosmos_throttle_max_wait_seconds,
             )
             self._database = self._client.get_database_client(settings.cosmos_database)
             self._initialized = True
@@ -138,16 +163,41 @@ class CosmosClientManager:
         await self._ensure_initialized()
 
     async def close(self) -> None:
-        """Close the Cosmos DB client connection and AAD credential if used."""
+        """Close the Cosmos DB client, its connection pool, and AAD credential if used."""
         if self._client is not None:
             await self._client.close()
             self._client = None
             self._database = None
             self._initialized = False
+            self._health_cache = None
             logger.info("Cosmos DB client closed")
         if self._credential is not None:
             await self._credential.close()
             self._credential = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def warm_up(self, container_names: Iterable[str]) -> None:
+        """
+        Connect and prime the connection pool ahead of the first request.
+
+        Reading each container's properties opens pooled connections and fills
+        the SDK's container-properties cache. Failures are only logged; the
+        next data access connects lazily as usual.
+
+        Args:
+            container_names: Containers the application will query.
+        """
+        try:
+            await self._ensure_initialized()
+            await asyncio.gather(
+                *(self.database.get_container_client(name).read() for name in container_names)
+            )
+        except Exception:
+            logger.exception("Cosmos DB warm-up failed; connecting on first request instead")
+            return
+        logger.info("Cosmos DB connection pool warmed up")
 
     @property
     def client(self) -> CosmosClient:
@@ -182,6 +232,9 @@ class CosmosClientManager:
         """
         Perform a health check on the Cosmos DB connection.
 
+        The database read is cached for HEALTH_CHECK_TTL_SECONDS, so frequent
+        probes cost at most one round trip per window.
+
         Returns:
             Health status dictionary.
         """
@@ -191,12 +244,19 @@ class CosmosClientManager:
         if not self.is_connected:
             return {"cosmos": "not_connected"}
 
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and cached[1] > now:
+            return dict(cached[0])
+
         try:
             await self.database.read()
-            return {"cosmos": "healthy"}
+            result = {"cosmos": "healthy"}
         except CosmosHttpResponseError as e:
             logger.exception("Cosmos DB health check failed")
-            return {"cosmos": "unhealthy", "error": str(e)}
+            result = {"cosmos": "unhealthy", "error": str(e)}
+        self._health_cache = (result, now + HEALTH_CHECK_TTL_SECONDS)
+        return dict(result)
 
 
 # Global singleton instance
@@ -73,6 +73,10 @@ CONTAINERS = {
                     {"path": "/merchant", "order": "ascending"},
                     {"path": "/createdAt", "order": "descending"},
                 ],
+                [
+                    {"path": "/clusterId", "order": "ascending"},
+                    {"path": "/createdAt", "order": "descending"},
+                ],
             ],
             "vectorIndexes": [
                 {"path": "/contentVector", "type": "diskANN"},
@@ -98,6 +102,9 @@ CONTAINERS = {
             "automatic": True,
             "includedPaths": [
                 {"path": "/*"},
+                # Keep member ticket IDs indexed so "which cluster holds this
+                # ticket" is an index lookup; the rest of each member is not.
+                {"path": "/members/[]/ticketId/?"},
             ],
             "excludedPaths": [
                 {"path": "/members/*"},
@@ -109,6 +116,11 @@ CONTAINERS = {
                     {"path": "/status", "order": "ascending"},
                     {"path": "/createdAt", "order": "descending"},
                 ],
+                # Candidate search pre-filter: customer equality + time window
+                [
+                    {"path": "/customerId", "order": "ascending"},
+                    {"path": "/updatedAt", "order": "ascending"},
+                ],
             ],
             "vectorIndexes": [
                 {"path": "/centroidVector", "type": "diskANN"},
@@ -139,6 +151,27 @@ CONTAINERS = {
                 {"path": "/originalStates/*"},
                 {"path": "/_etag/?"},
             ],
+            "compositeIndexes": [
+                [
+                    {"path": "/status", "order": "ascending"},
+                    {"path": "/performedAt", "order": "descending"},
+                ],
+                [
+                    {"path": "/clusterId", "order": "ascending"},
+                    {"path": "/performedAt", "order": "descending"},
+                ],
+                [
+                    {"path": "/primaryTicketId", "order": "ascending"},
+                    {"path": "/performedAt", "order": "descending"},
+                ],
+                # Merged-ID and revert-conflict lookups: two equalities, then
+                # the performedAt range
+                [
+                    {"path": "/primaryTicketId", "order": "ascending"},
+                    {"path": "/status", "order": "ascending"},
+                    {"path": "/performedAt", "order": "ascending"},
+                ],
+            ],
         },
         "vector_embedding_policy": None,
     },
@@ -7,14 +7,17 @@ Provides consistent error responses across the API.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import orjson
 from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from fastapi import FastAPI
 
 logger = logging.getLogger(__name__)
@@ -89,24 +92,39 @@ class RevertConflictError(DedupTicketsError):
 # Exception Handlers
 # =============================================================================
 
+# Pre-encoded bodies for errors whose only variable fields are message/path.
+# Filled with %-formatting on bytes so no dict is built or fully serialized.
+_HTTP_ERROR_TMPL = b'{"error":"HTTP_ERROR","message":%b,"path":%b}'
+_NOT_FOUND_TMPL = b'{"error":"NOT_FOUND","message":"Resource not found","path":%b}'
+_CONFLICT_TMPL = b'{"error":"CONFLICT","message":"Resource conflict","path":%b}'
+_RATE_LIMITED_TMPL = (
+    b'{"error":"RATE_LIMITED","message":"Too many requests, please retry later","path":%b}'
+)
+_DATABASE_ERROR_TMPL = b'{"error":"DATABASE_ERROR","message":"Database operation failed","path":%b}'
+_INTERNAL_ERROR_TMPL = (
+    b'{"error":"INTERNAL_ERROR","message":"An unexpected error occurred","path":%b}'
+)
+_RETRY_AFTER_HEADERS = {"Retry-After": "1"}
+
 
 async def deduptickets_exception_handler(
     request: Request,
     exc: DedupTicketsError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle DedupTickets custom exceptions."""
+    path = request.scope["path"]
     logger.warning(
         "Application error: %s - %s (path: %s)",
         exc.error_code,
         exc.message,
-        request.url.path,
+        path,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.error_code,
             "message": exc.message,
-            "path": request.url.path,
+            "path": path,
         },
     )
 
@@ -114,32 +132,33 @@ async def deduptickets_exception_handler(
 async def http_exception_handler(
     request: Request,
     exc: HTTPException,
-) -> JSONResponse:
+) -> Response:
     """Handle FastAPI HTTP exceptions."""
-    return JSONResponse(
+    path = request.scope["path"]
+    return Response(
+        content=_HTTP_ERROR_TMPL % (orjson.dumps(exc.detail), orjson.dumps(path)),
         status_code=exc.status_code,
-        content={
-            "error": "HTTP_ERROR",
-            "message": exc.detail,
-            "path": request.url.path,
-        },
         headers=exc.headers,
+        media_type="application/json",
     )
 
 
 async def validation_exception_handler(
     request: Request,
     exc: ValidationError,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
-    logger.warning("Validation error on %s: %s", request.url.path, exc.errors())
-    return JSONResponse(
+    path = request.scope["path"]
+    # errors() walks the whole validation tree; build it once for log and body
+    errors = exc.errors()
+    logger.warning("Validation error on %s: %s", path, errors)
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "VALIDATION_ERROR",
             "message": "Request validation failed",
-            "details": exc.errors(),
-            "path": request.url.path,
+            "details": errors,
+            "path": path,
         },
     )
 
@@ -147,84 +166,80 @@ async def validation_exception_handler(
 async def cosmos_not_found_handler(
     request: Request,
     _exc: CosmosResourceNotFoundError,
-) -> JSONResponse:
+) -> Response:
     """Handle Cosmos DB not found errors."""
-    logger.warning("Cosmos resource not found: %s", request.url.path)
-    return JSONResponse(
+    path = request.scope["path"]
+    logger.warning("Cosmos resource not found: %s", path)
+    return Response(
+        content=_NOT_FOUND_TMPL % orjson.dumps(path),
         status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": "NOT_FOUND",
-            "message": "Resource not found",
-            "path": request.url.path,
-        },
+        media_type="application/json",
     )
 
 
 async def cosmos_error_handler(
     request: Request,
     exc: CosmosHttpResponseError,
-) -> JSONResponse:
+) -> Response:
     """Handle Cosmos DB HTTP errors."""
+    path = request.scope["path"]
     logger.error(
         "Cosmos DB error: status=%s, message=%s, path=%s",
         exc.status_code,
         exc.message,
-        request.url.path,
+        path,
     )
 
     # Map Cosmos status codes to HTTP
+    encoded_path = orjson.dumps(path)
     if exc.status_code == 409:
-        return JSONResponse(
+        return Response(
+            content=_CONFLICT_TMPL % encoded_path,
             status_code=status.HTTP_409_CONFLICT,
-            content={
-                "error": "CONFLICT",
-                "message": "Resource conflict",
-                "path": request.url.path,
-            },
+            media_type="application/json",
         )
 
     if exc.status_code == 429:
-        return JSONResponse(
+        return Response(
+            content=_RATE_LIMITED_TMPL % encoded_path,
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "error": "RATE_LIMITED",
-                "message": "Too many requests, please retry later",
-                "path": request.url.path,
-            },
-            headers={"Retry-After": "1"},
+            headers=_RETRY_AFTER_HEADERS,
+            media_type="application/json",
         )
 
-    return JSONResponse(
+    return Response(
+        content=_DATABASE_ERROR_TMPL % encoded_path,
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        content={
-            "error": "DATABASE_ERROR",
-            "message": "Database operation failed",
-            "path": request.url.path,
-        },
+        media_type="application/json",
     )
 
 
 async def generic_exception_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> Response:
     """Handle unexpected exceptions."""
-    logger.exception("Unexpected error on %s: %s", request.url.path, exc)
-    return JSONResponse(
+    path = request.scope["path"]
+    logger.exception("Unexpected error on %s: %s", path, exc)
+    return Response(
+        content=_INTERNAL_ERROR_TMPL % orjson.dumps(path),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "INTERNAL_ERROR",
-            "message": "An unexpected error occurred",
-            "path": request.url.path,
-        },
+        media_type="application/json",
     )
 
 
+# (exception type, handler) pairs registered by register_exception_handlers
+_HANDLERS: tuple[tuple[type[Exception], Callable[[Request, Any], Awaitable[Response]]], ...] = (
+    (DedupTicketsError, deduptickets_exception_handler),
+    (HTTPException, http_exception_handler),
+    (ValidationError, validation_exception_handler),
+    (CosmosResourceNotFoundError, cosmos_not_found_handler),
+    (CosmosHttpResponseError, cosmos_error_handler),
+    (Exception, generic_exception_handler),
+)
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with the FastAPI app."""
-    app.add_exception_handler(DedupTicketsError, deduptickets_exception_handler)  # type: ignore[arg-type]
-    app.add_exception_handler(HTTPException, http_exception_handler)  # type: ignore[arg-type]
-    app.add_exception_handler(ValidationError, validation_exception_handler)  # type: ignore[arg-type]
-    app.add_exception_handler(CosmosResourceNotFoundError, cosmos_not_found_handler)  # type: ignore[arg-type]
-    app.add_exception_handler(CosmosHttpResponseError, cosmos_error_handler)  # type: ignore[arg-type]
-    app.add_exception_handler(Exception, generic_exception_handler)  # type: ignore[arg-type]
+    for exc_type, handler in _HANDLERS:
+        app.add_exception_handler(exc_type, handler)
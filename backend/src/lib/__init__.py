@@ -1,12 +1,20 @@
 """
 Utility libraries for deduptickets.
 
-Contains reusable utilities for embedding generation, etc.
+Contains reusable utilities for embedding generation, partition keys,
+queue-backed logging, etc.
 """
 
+from lib.clock import utc_now
 from lib.embedding import EmbeddingService, build_dedup_text
+from lib.log_queue import LogQueue
+from lib.partition import build_partition_key, partition_key_for
 
 __all__ = [
     "EmbeddingService",
+    "LogQueue",
     "build_dedup_text",
+    "build_partition_key",
+    "partition_key_for",
+    "utc_now",
 ]
@@ -0,0 +1,23 @@
+"""
+Clock helpers.
+
+Single source of timezone-aware UTC timestamps for models and routes.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from pydantic import TypeAdapter
+
+_DATETIME_ADAPTER: TypeAdapter[datetime] = TypeAdapter(datetime)
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def to_json_timestamp(value: datetime) -> str:
+    """Render a datetime exactly as model_dump(mode="json") stores it in documents."""
+    return str(_DATETIME_ADAPTER.dump_python(value, mode="json"))
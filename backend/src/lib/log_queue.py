@@ -0,0 +1,128 @@
+"""
+Queue-backed logging.
+
+Moves the root logger's handlers behind a QueueListener thread so log
+calls on the request path only enqueue a record instead of taking the
+handler lock and writing to the stream.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Upper bound on buffered records; beyond this, records are dropped rather
+# than blocking the event loop.
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+
+# How long stop() waits for the listener to make room for its sentinel before
+# discarding a buffered record instead
+SENTINEL_PUT_TIMEOUT_SECONDS = 1.0
+
+
+class DropOnFullQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record without blocking; drop it if the queue is full."""
+        with contextlib.suppress(queue.Full):
+            self.queue.put_nowait(record)
+
+
+class BoundedQueueListener(QueueListener):
+    """QueueListener whose stop() still gets its sentinel into a full queue."""
+
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord | None],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        """Keep a typed handle on the bounded queue for enqueue_sentinel()."""
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._bounded_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        """Wait briefly for room, then discard the oldest records to fit the sentinel."""
+        try:
+            self._bounded_queue.put(None, timeout=SENTINEL_PUT_TIMEOUT_SECONDS)
+        except queue.Full:
+            while True:
+                with contextlib.suppress(queue.Empty):
+                    self._bounded_queue.get_nowait()
+                with contextlib.suppress(queue.Full):
+                    self._bounded_queue.put_nowait(None)
+                    return
+
+
+class LogQueue:
+    """
+    Owns the QueueListener that serves a logger's real handlers.
+
+    start() swaps the logger's handlers for a single DropOnFullQueueHandler;
+    stop() flushes the queue and restores the original handlers, even when
+    the queue is full at shutdown.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        logger_name: str | None = None,
+    ) -> None:
+        """
+        Initialize the log queue.
+
+        Args:
+            max_size: Maximum buffered records before dropping.
+            logger_name: Logger whose handlers are queued (root by default).
+        """
+        self._max_size = max_size
+        self._logger_name = logger_name
+        self._listener: BoundedQueueListener | None = None
+        self._queue_handler: QueueHandler | None = None
+        self._handlers: list[logging.Handler] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the listener thread is active."""
+        return self._listener is not None
+
+    def start(self) -> None:
+        """Route logger output through the queue. No-op if running or no handlers."""
+        target_logger = logging.getLogger(self._logger_name)
+        if self._listener is not None or not target_logger.handlers:
+            return
+
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=self._max_size)
+        self._handlers = list(target_logger.handlers)
+        for handler in self._handlers:
+            target_logger.removeHandler(handler)
+
+        self._queue_handler = DropOnFullQueueHandler(log_queue)
+        target_logger.addHandler(self._queue_handler)
+
+        self._listener = BoundedQueueListener(
+            log_queue, *self._handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Flush pending records and restore the original handlers."""
+        if self._listener is None:
+            return
+
+        # Detach the queue handler first so no new records compete with the
+        # sentinel, and restore the original handlers even if stopping fails.
+        target_logger = logging.getLogger(self._logger_name)
+        if self._queue_handler is not None:
+            target_logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        try:
+            self._listener.stop()
+        finally:
+            self._listener = None
+            for handler in self._handlers:
+                target_logger.addHandler(handler)
+            self._handlers = []
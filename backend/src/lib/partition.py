@@ -0,0 +1,83 @@
+"""
+Partition key helpers.
+
+All containers partition by calendar month: pk = {YYYY-MM}.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+@lru_cache(maxsize=256)
+def partition_key_for(year: int, month: int) -> str:
+    """
+    Build the partition key for a calendar month.
+
+    Uses integer formatting instead of strftime and caches the result,
+    so every write in the same month reuses one interned string.
+
+    Args:
+        year: Four-digit year.
+        month: Month number (1-12).
+
+    Returns:
+        Partition key in YYYY-MM format.
+    """
+    return f"{year:04d}-{month:02d}"
+
+
+def build_partition_key(timestamp: datetime) -> str:
+    """
+    Build partition key from timestamp.
+
+    Format: {YYYY-MM}
+    """
+    return partition_key_for(timestamp.year, timestamp.month)
+
+
+@lru_cache(maxsize=64)
+def partition_key_window(year: int, month: int, months: int) -> tuple[str, ...]:
+    """
+    Build the keys for a month and the months before it, newest first.
+
+    Cached per (month, span), so callers covering the same window share
+    one tuple.
+
+    Args:
+        year: Four-digit year of the newest month.
+        month: Newest month number (1-12).
+        months: Total number of months to cover.
+
+    Returns:
+        Tuple of YYYY-MM keys, newest first.
+    """
+    keys: list[str] = []
+    for _ in range(months):
+        keys.append(partition_key_for(year, month))
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return tuple(keys)
+
+
+def partition_keys_between(start: datetime, end: datetime) -> list[str]:
+    """
+    Build the partition keys covering a timestamp range, newest first.
+
+    Args:
+        start: Start of the range.
+        end: End of the range.
+
+    Returns:
+        One YYYY-MM key per calendar month from end back to start
+        (empty if start is after end).
+    """
+    months = (end.year - start.year) * 12 + end.month - start.month + 1
+    if months <= 0:
+        return []
+    return list(partition_key_window(end.year, end.month, months))
@@ -6,28 +6,48 @@ Initializes Cosmos DB connection, registers routers, and provides health endpoin
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import pathlib
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from config import get_settings
 from cosmos.client import CosmosClientManager
+from cosmos.setup import CONTAINERS
 from exceptions import register_exception_handlers
+from lib.log_queue import LogQueue
 from routes import clusters, health, merges, tickets
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from fastapi import APIRouter
+
 logger = logging.getLogger(__name__)
 
+# Keeps handler I/O off the event loop while the app is running
+_log_queue = LogQueue()
+
 FRONTEND_DIR = pathlib.Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
 
+# (router, prefix, tags) registered in order by create_app
+_ROUTERS: tuple[tuple[APIRouter, str, list[str]], ...] = (
+    (health.router, "", ["Health"]),
+    (tickets.router, "/api/v1/tickets", ["Tickets"]),
+    (clusters.router, "/api/v1/clusters", ["Clusters"]),
+    (merges.router, "/api/v1/merges", ["Merges"]),
+)
+
+# Paths the SPA fallback must not shadow
+_SPA_BLOCKED_PREFIXES = ("api/", "assets/", "health/")
+_SPA_BLOCKED_EXACT_PATHS = frozenset({"api", "docs", "redoc", "openapi.json", "health", "assets"})
+
 
 def _configure_logging(log_level: str) -> None:
     """Configure application logging level from settings."""
@@ -55,26 +75,39 @@ def _configure_logging(log_level: str) -> None:
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Manage application lifespan.
 
-    - Startup: Configure Cosmos DB settings (no network call).
-    - Shutdown: Close Cosmos DB connection pool if connected.
+    - Startup: Route logging through a queue; configure Cosmos DB settings (no network call
+      unless COSMOS_WARMUP starts a background pool warm-up).
+    - Shutdown: Close Cosmos DB connection pool if connected; flush queued logs.
     """
-    settings = get_settings()
+    # Settings were loaded once by create_app; reuse them instead of re-resolving
+    settings = app.state.settings
+    _log_queue.start()
 
     # Startup — store settings only, connect lazily on first request
     logger.info("Starting DedupTickets API...")
     cosmos_manager = CosmosClientManager()
     cosmos_manager.configure(settings)
 
+    # Optionally open the pool in the background; startup never waits on it
+    warmup: asyncio.Task[None] | None = None
+    if settings.cosmos_warmup:
+        warmup = asyncio.create_task(cosmos_manager.warm_up(CONTAINERS))
+
     yield
 
     # Shutdown
     logger.info("Shutting down DedupTickets API...")
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
     await cosmos_manager.close()
     logger.info("Cosmos DB client closed")
+    _log_queue.stop()
 
 
 def create_app() -> FastAPI:
@@ -95,7 +128,9 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
     )
+    app.state.settings = settings
 
     # CORS middleware
     app.add_middleware(
@@ -107,10 +142,8 @@ def create_app() -> FastAPI:
     )
 
     # Register routers
-    app.include_router(health.router, tags=["Health"])
-    app.include_router(tickets.router, prefix="/api/v1/tickets", tags=["Tickets"])
-    app.include_router(clusters.router, prefix="/api/v1/clusters", tags=["Clusters"])
-    app.include_router(merges.router, prefix="/api/v1/merges", tags=["Merges"])
+    for router, prefix, tags in _ROUTERS:
+        app.include_router(router, prefix=prefix, tags=[*tags])
 
     # Register exception handlers
     register_exception_handlers(app)
@@ -124,11 +157,8 @@ def create_app() -> FastAPI:
         @app.get("/{full_path:path}")
         async def serve_spa(full_path: str) -> FileResponse:
             normalized_path = full_path.lstrip("/")
-            blocked_prefixes = ("api/", "assets/", "health/")
-            blocked_exact_paths = {"api", "docs", "redoc", "openapi.json", "health", "assets"}
-
-            if normalized_path in blocked_exact_paths or normalized_path.startswith(
-                blocked_prefixes
+            if normalized_path in _SPA_BLOCKED_EXACT_PATHS or normalized_path.startswith(
+                _SPA_BLOCKED_PREFIXES
             ):
                 raise HTTPException(status_code=404, detail="Not Found")
 
@@ -6,14 +6,16 @@ Represents a proposed grouping of related/duplicate tickets.
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
 from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from pydantic.alias_generators import to_camel
 
+from lib.clock import utc_now
+
 
 class ClusterStatus(StrEnum):
     """Cluster status enumeration."""
@@ -26,13 +28,13 @@ class ClusterStatus(StrEnum):
 
 
 class ClusterMember(BaseModel):
-    """Reference to a ticket in the cluster."""
+    """Reference to a ticket in the cluster (immutable once added)."""
 
-    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True, frozen=True)
 
     ticket_id: UUID
     ticket_number: str
-    added_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    added_at: datetime = Field(default_factory=utc_now)
     summary: str | None = Field(default=None, max_length=500)
     category: str | None = None
     subcategory: str | None = None
@@ -40,6 +42,10 @@ class ClusterMember(BaseModel):
     confidence_score: float | None = Field(default=None, ge=0.0, le=1.0)
 
 
+# Fields never written back to Cosmos DB
+_COSMOS_EXCLUDE = {"etag"}
+
+
 class Cluster(BaseModel):
     """
     Cluster entity representing a proposed grouping of related tickets.
@@ -59,8 +65,8 @@ class Cluster(BaseModel):
     ticket_count: int = Field(ge=1, description="Number of tickets in cluster")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     expires_at: datetime | None = Field(default=None, description="Auto-expire if not actioned")
 
     # Ownership
@@ -92,17 +98,20 @@ class Cluster(BaseModel):
 
     def to_cosmos_document(self) -> dict[str, Any]:
         """Convert to Cosmos DB document format (camelCase)."""
-        doc = self.model_dump(mode="json", by_alias=True)
-        doc["id"] = str(self.id)
-        # _etag is server-managed; never send it back
-        doc.pop("_etag", None)
-        return doc
+        # mode="json" already renders UUIDs (including id) as strings.
+        # _etag is server-managed; exclude it at dump time rather than popping.
+        return self.model_dump(mode="json", by_alias=True, exclude=_COSMOS_EXCLUDE)
 
     @classmethod
     def from_cosmos_document(cls, doc: dict[str, Any]) -> Cluster:
         """Create from Cosmos DB document."""
         return cls.model_validate(doc)
 
+    @classmethod
+    def from_cosmos_documents(cls, docs: list[dict[str, Any]]) -> list[Cluster]:
+        """Create many from Cosmos DB documents in a single list validation."""
+        return _CLUSTER_LIST_ADAPTER.validate_python(docs)
+
     def add_member(
         self,
         ticket_id: UUID,
@@ -131,19 +140,51 @@ class Cluster(BaseModel):
             )
         )
         self.ticket_count = len(self.members)
-        self.updated_at = datetime.now(UTC)
+        self.updated_at = utc_now()
 
     def remove_member(self, ticket_id: UUID) -> bool:
         """Remove a ticket from the cluster. Returns True if removed."""
-        original_count = len(self.members)
-        self.members = [m for m in self.members if m.ticket_id != ticket_id]
-        if len(self.members) < original_count:
-            self.ticket_count = len(self.members)
-            self.updated_at = datetime.now(UTC)
-            return True
-        return False
+        # Delete in place at the first match instead of rebuilding the list
+        index = self.member_index(ticket_id)
+        if index is None:
+            return False
+        del self.members[index]
+        self.ticket_count = len(self.members)
+        self.updated_at = utc_now()
+        return True
+
+    def member_index(self, ticket_id: UUID) -> int | None:
+        """Position of the ticket in members, or None if it is not a member."""
+        for index, member in enumerate(self.members):
+            if member.ticket_id == ticket_id:
+                return index
+        return None
+
+    def split_on_primary(self, primary_ticket_id: UUID) -> tuple[bool, list[UUID]]:
+        """
+        Split member ticket IDs around a primary in a single pass.
+
+        Returns:
+            (primary is a member, IDs of all other members in order).
+        """
+        found = False
+        others: list[UUID] = []
+        for member in self.members:
+            if member.ticket_id == primary_ticket_id:
+                found = True
+            else:
+                others.append(member.ticket_id)
+        return found, others
+
+    def has_member(self, ticket_id: UUID) -> bool:
+        """Check membership, stopping at the first match without building ticket_ids."""
+        return any(member.ticket_id == ticket_id for member in self.members)
 
     @property
     def ticket_ids(self) -> list[UUID]:
         """Get list of ticket IDs in the cluster (convenience property)."""
         return [m.ticket_id for m in self.members]
+
+
+# Compiled once; shares one validator across every document in a batch
+_CLUSTER_LIST_ADAPTER: TypeAdapter[list[Cluster]] = TypeAdapter(list[Cluster])
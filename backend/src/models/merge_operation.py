@@ -11,8 +11,11 @@ from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 from pydantic.alias_generators import to_camel
+from pydantic.dataclasses import dataclass
+
+from lib.clock import utc_now
 
 
 class MergeBehavior(StrEnum):
@@ -31,15 +34,21 @@ class MergeStatus(StrEnum):
     REVERTED = "reverted"
 
 
-class TicketSnapshot(BaseModel):
+# A slotted dataclass rather than a BaseModel: a merge holds one per ticket, and
+# none needs a __dict__ or fields-set bookkeeping. It still validates and dumps
+# as a camelCase object inside MergeOperation.
+@dataclass(
+    config=ConfigDict(alias_generator=to_camel, populate_by_name=True),
+    frozen=True,
+    slots=True,
+)
+class TicketSnapshot:
     """
     Complete ticket snapshot for revert capability.
 
-    Stores the full ticket state before merge per FR-012.
+    Stores the full ticket state before merge per FR-012. Immutable once captured.
     """
 
-    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
-
     ticket_id: UUID
     snapshot: dict[str, Any] = Field(description="Full ticket document at merge time")
 
@@ -73,7 +82,7 @@ class MergeOperation(BaseModel):
 
     # Actor and timestamps
     performed_by: str = Field(description="Actor identity")
-    performed_at: datetime = Field(default_factory=datetime.utcnow)
+    performed_at: datetime = Field(default_factory=utc_now)
 
     # Revert tracking
     revert_deadline: datetime | None = Field(default=None, description="Deadline for revert")
@@ -87,17 +96,27 @@ class MergeOperation(BaseModel):
         description="Full ticket snapshots for revert capability",
     )
 
+    # Lazy get_snapshot index: (source list, its length, ticket_id -> snapshot)
+    _snapshot_cache: tuple[list[TicketSnapshot], int, dict[UUID, dict[str, Any]]] | None = (
+        PrivateAttr(default=None)
+    )
+
     def to_cosmos_document(self) -> dict[str, Any]:
         """Convert to Cosmos DB document format (camelCase)."""
-        doc = self.model_dump(mode="json", by_alias=True)
-        doc["id"] = str(self.id)
-        return doc
+        # mode="json" already renders UUIDs (including id) as strings.
+        # Unset revert fields are omitted; no query filters on them being null.
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
 
     @classmethod
     def from_cosmos_document(cls, doc: dict[str, Any]) -> MergeOperation:
         """Create from Cosmos DB document."""
         return cls.model_validate(doc)
 
+    @classmethod
+    def from_cosmos_documents(cls, docs: list[dict[str, Any]]) -> list[MergeOperation]:
+        """Create many from Cosmos DB documents in a single list validation."""
+        return _MERGE_LIST_ADAPTER.validate_python(docs)
+
     def revert(self, actor_id: str, reason: str | None = None) -> None:
         """Mark the merge as reverted."""
         if self.status == MergeStatus.REVERTED:
@@ -105,12 +124,26 @@ class MergeOperation(BaseModel):
             raise ValueError(msg)
         self.status = MergeStatus.REVERTED
         self.reverted_by = actor_id
-        self.reverted_at = datetime.utcnow()
+        self.reverted_at = utc_now()
         self.revert_reason = reason
 
     def get_snapshot(self, ticket_id: UUID) -> dict[str, Any] | None:
         """Get the original snapshot for a ticket."""
-        for state in self.original_states:
-            if state.ticket_id == ticket_id:
-                return state.snapshot
-        return None
+        return self._get_snapshot_index().get(ticket_id)
+
+    def _get_snapshot_index(self) -> dict[UUID, dict[str, Any]]:
+        """
+        Return the ticket_id -> snapshot index, building it on first use.
+
+        Rebuilt if original_states is reassigned or grows; first entry wins.
+        """
+        states = self.original_states
+        cache = self._snapshot_cache
+        if cache is None or cache[0] is not states or cache[1] != len(states):
+            index = {state.ticket_id: state.snapshot for state in reversed(states)}
+            cache = self._snapshot_cache = (states, len(states), index)
+        return cache[2]
+
+
+# Compiled once; shares one validator across every document in a batch
+_MERGE_LIST_ADAPTER: TypeAdapter[list[MergeOperation]] = TypeAdapter(list[MergeOperation])
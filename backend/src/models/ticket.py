@@ -11,9 +11,11 @@ from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from pydantic.alias_generators import to_camel
 
+from lib.partition import build_partition_key
+
 
 class TicketStatus(StrEnum):
     """Ticket status enumeration."""
@@ -34,6 +36,10 @@ class TicketPriority(StrEnum):
     URGENT = "urgent"
 
 
+# Dumped separately so to_cosmos_document can pass it through untouched
+_RAW_METADATA_EXCLUDE = {"raw_metadata"}
+
+
 class Ticket(BaseModel):
     """
     Ticket entity representing a support ticket.
@@ -100,8 +106,11 @@ class Ticket(BaseModel):
 
     def to_cosmos_document(self) -> dict[str, Any]:
         """Convert to Cosmos DB document format (camelCase)."""
-        doc = self.model_dump(mode="json", by_alias=True)
-        doc["id"] = str(self.id)
+        # mode="json" already renders UUIDs (including id) as strings.
+        # raw_metadata arrives as parsed JSON (API payload or Cosmos document), so
+        # it is attached by reference instead of being walked and copied on every write.
+        doc = self.model_dump(mode="json", by_alias=True, exclude=_RAW_METADATA_EXCLUDE)
+        doc["rawMetadata"] = self.raw_metadata
         return doc
 
     @classmethod
@@ -109,7 +118,16 @@ class Ticket(BaseModel):
         """Create from Cosmos DB document."""
         return cls.model_validate(doc)
 
+    @classmethod
+    def from_cosmos_documents(cls, docs: list[dict[str, Any]]) -> list[Ticket]:
+        """Create many from Cosmos DB documents in a single list validation."""
+        return _TICKET_LIST_ADAPTER.validate_python(docs)
+
     @staticmethod
     def generate_partition_key(created_at: datetime) -> str:
         """Generate partition key from created_at date."""
-        return created_at.strftime("%Y-%m")
+        return build_partition_key(created_at)
+
+
+# Compiled once; shares one validator across every document in a batch
+_TICKET_LIST_ADAPTER: TypeAdapter[list[Ticket]] = TypeAdapter(list[Ticket])
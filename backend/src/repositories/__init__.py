@@ -8,7 +8,7 @@ Provides data access patterns with Cosmos DB best practices:
 - Entity-specific repositories with domain logic
 """
 
-from repositories.base import BaseRepository
+from repositories.base import BaseRepository, PartitionedRepository
 from repositories.cluster import ClusterRepository
 from repositories.merge import MergeRepository
 from repositories.ticket import TicketRepository
@@ -17,5 +17,6 @@ __all__ = [
     "BaseRepository",
     "ClusterRepository",
     "MergeRepository",
+    "PartitionedRepository",
     "TicketRepository",
 ]
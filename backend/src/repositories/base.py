@@ -9,14 +9,27 @@ Provides common CRUD operations with Cosmos DB best practices:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, TypeVar, cast
-
-from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar, cast
+
+import orjson
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosBatchOperationError,
+    CosmosHttpResponseError,
+    CosmosResourceNotFoundError,
+)
 from pydantic import BaseModel
 
+from exceptions import InvalidOperationError
+from lib.partition import build_partition_key
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+    from datetime import datetime
     from uuid import UUID
 
     from azure.cosmos.aio import ContainerProxy
@@ -26,6 +39,18 @@ logger = logging.getLogger(__name__)
 # Generic type for domain models
 T = TypeVar("T", bound=BaseModel)
 
+# Document ID as the caller holds it
+K = TypeVar("K", "UUID", str)
+
+# Cosmos DB transactional batches accept at most 100 operations
+MAX_BATCH_OPERATIONS = 100
+
+# Cosmos DB rejects batch requests over 2 MB; keep headroom for the envelope
+MAX_BATCH_BYTES = 1_900_000
+
+# Upper bound on batch requests in flight for one bulk write
+MAX_CONCURRENT_BATCHES = 16
+
 
 class BaseRepository[T: BaseModel](ABC):
     """
@@ -61,13 +86,35 @@ class BaseRepository[T: BaseModel](ABC):
         """Convert Cosmos DB document to domain model."""
         ...
 
-    async def create(self, entity: T, _partition_key: str) -> T:
+    def _from_documents(self, docs: list[dict[str, Any]]) -> list[T]:
+        """
+        Convert a batch of Cosmos DB documents to domain models.
+
+        Subclasses may override to validate the whole batch in one call.
+        """
+        return [self._from_document(doc) for doc in docs]
+
+    def _from_write_response(self, entity: T, _result: dict[str, Any]) -> T:
+        """
+        Return the written entity when Cosmos sent no document back.
+
+        Subclasses whose models carry server-set metadata (such as an ETag)
+        override this to copy it from the response headers, so skipping the
+        body never costs them that metadata.
+        """
+        return entity
+
+    async def create(self, entity: T, _partition_key: str, *, return_content: bool = True) -> T:
         """
         Create a new document in the container.
 
         Args:
             entity: Domain model to create.
             partition_key: Partition key value.
+            return_content: When False, Cosmos sends no document back and the
+                input entity is returned without being re-validated; only
+                metadata that _from_write_response() copies from the response
+                headers is added.
 
         Returns:
             Created entity with any server-generated fields.
@@ -82,9 +129,12 @@ class BaseRepository[T: BaseModel](ABC):
             result = await self._container.create_item(
                 body=document,
                 enable_automatic_id_generation=False,
+                no_response=not return_content,
             )
-            logger.info("Created document %s in %s", result["id"], self._container_name)
-            return self._from_document(result)
+            logger.info("Created document %s in %s", document["id"], self._container_name)
+            if return_content:
+                return self._from_document(result)
+            return self._from_write_response(entity, result)
         except CosmosHttpResponseError:
             logger.exception("Failed to create document in %s", self._container_name)
             raise
@@ -116,13 +166,53 @@ class BaseRepository[T: BaseModel](ABC):
             logger.exception("Failed to read document %s from %s", str_id, self._container_name)
             raise
 
-    async def update(self, entity: T, _partition_key: str) -> T:
+    async def get_many(self, item_ids: Sequence[K], partition_key: str) -> dict[K, T]:
+        """
+        Get several documents by ID in one batched point read (readMany).
+
+        Costs about one point read per found document, where a
+        ``WHERE c.id IN (...)`` query would be billed as a scan.
+
+        Args:
+            item_ids: Document IDs.
+            partition_key: Partition key value shared by all documents.
+
+        Returns:
+            Domain models keyed by the IDs as passed in, so callers holding
+            UUIDs look them up without formatting each one again; missing
+            documents are omitted.
+        """
+        if not item_ids:
+            return {}
+
+        # Each ID is formatted once, here, for the request and the lookup back
+        keys = {str(item_id): item_id for item_id in item_ids}
+        try:
+            docs = await self._container.read_items(
+                items=[(str_id, partition_key) for str_id in keys],
+            )
+        except CosmosHttpResponseError:
+            logger.exception(
+                "Failed to read %d documents from %s", len(item_ids), self._container_name
+            )
+            raise
+        found = list(docs)
+        return {
+            keys[doc["id"]]: entity
+            for doc, entity in zip(found, self._from_documents(found), strict=True)
+        }
+
+    async def update(self, entity: T, _partition_key: str, *, return_content: bool = True) -> T:
         """
         Update (upsert) a document.
 
         Args:
             entity: Domain model with updated values.
             partition_key: Partition key value.
+            return_content: When False, Cosmos sends no document back and the
+                input entity is returned without being re-validated; only
+                metadata that _from_write_response() copies from the response
+                headers is added.
 
         Returns:
             Updated entity.
@@ -134,13 +224,223 @@ class BaseRepository[T: BaseModel](ABC):
         logger.debug("Updating document %s in %s", document.get("id"), self._container_name)
 
         try:
-            result = await self._container.upsert_item(body=document)
-            logger.info("Updated document %s in %s", result["id"], self._container_name)
-            return self._from_document(result)
+            result = await self._container.upsert_item(
+                body=document, no_response=not return_content
+            )
+            logger.info("Updated document %s in %s", document["id"], self._container_name)
+            if return_content:
+                return self._from_document(result)
+            return self._from_write_response(entity, result)
         except CosmosHttpResponseError:
             logger.exception("Failed to update document in %s", self._container_name)
             raise
 
+    async def patch(
+        self,
+        item_id: UUID | str,
+        partition_key: str,
+        operations: list[dict[str, Any]],
+        *,
+        filter_predicate: str | None = None,
+        etag: str | None = None,
+    ) -> T | None:
+        """
+        Apply a partial document update (JSON Patch) without reading first.
+
+        One round trip, charged by the properties touched rather than the
+        whole document.
+
+        Args:
+            item_id: Document ID.
+            partition_key: Partition key value.
+            operations: Patch operations (at most 10 per request).
+            filter_predicate: Optional condition ("FROM c WHERE ...") the stored
+                document must satisfy for the patch to apply.
+            etag: Optional ETag the stored document must still carry (if-match),
+                for callers that already hold the entity they are changing.
+
+        Returns:
+            Patched domain model, or None if the document does not exist.
+
+        Raises:
+            CosmosAccessConditionFailedError: If filter_predicate or etag did not match.
+            CosmosHttpResponseError: If the patch fails.
+        """
+        str_id = str(item_id)
+        logger.debug("Patching document %s in %s", str_id, self._container_name)
+
+        patch_kwargs: dict[str, Any] = {}
+        if filter_predicate is not None:
+            patch_kwargs["filter_predicate"] = filter_predicate
+        if etag is not None:
+            patch_kwargs["etag"] = etag
+            patch_kwargs["match_condition"] = MatchConditions.IfNotModified
+
+        try:
+            result = await self._container.patch_item(
+                item=str_id,
+                partition_key=partition_key,
+                patch_operations=operations,
+                **patch_kwargs,
+            )
+        except CosmosResourceNotFoundError:
+            logger.debug("Document %s not found for patch in %s", str_id, self._container_name)
+            return None
+        except CosmosAccessConditionFailedError:
+            logger.debug("Patch precondition failed for %s in %s", str_id, self._container_name)
+            raise
+        except CosmosHttpResponseError:
+            logger.exception("Failed to patch document %s in %s", str_id, self._container_name)
+            raise
+        logger.info("Patched document %s in %s", str_id, self._container_name)
+        return self._from_document(result)
+
+    def _chunk_documents(self, documents: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """
+        Split documents into batches within the operation and payload limits.
+
+        A batch closes at MAX_BATCH_OPERATIONS documents or when the next
+        document would push its serialized size past MAX_BATCH_BYTES.
+        """
+        chunks: list[list[dict[str, Any]]] = []
+        current: list[dict[str, Any]] = []
+        current_bytes = 0
+        for document in documents:
+            size = len(orjson.dumps(document))
+            if current and (
+                len(current) == MAX_BATCH_OPERATIONS or current_bytes + size > MAX_BATCH_BYTES
+            ):
+                chunks.append(current)
+                current, current_bytes = [], 0
+            current.append(document)
+            current_bytes += size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _execute_batches(
+        self, operation: str, entities: Sequence[T], partition_key: str
+    ) -> None:
+        """
+        Write entities that share a partition key as transactional batches.
+
+        Batches are sent concurrently, at most MAX_CONCURRENT_BATCHES at a
+        time. Each batch is atomic; the call as a whole is not.
+        """
+        chunks = self._chunk_documents([self._to_document(entity) for entity in entities])
+        await self._send_batches(
+            operation,
+            [[(operation, (document,)) for document in chunk] for chunk in chunks],
+            partition_key,
+        )
+        logger.info(
+            "Batch %s of %d documents in %s (partition %s)",
+            operation,
+            len(entities),
+            self._container_name,
+            partition_key,
+        )
+
+    async def _send_batches(
+        self,
+        operation: str,
+        batches: list[list[tuple[str, tuple[Any, ...]]]],
+        partition_key: str,
+    ) -> None:
+        """Send prepared batch operations, at most MAX_CONCURRENT_BATCHES at a time."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+        async def run(batch: list[tuple[str, tuple[Any, ...]]]) -> None:
+            async with semaphore:
+                try:
+                    await self._container.execute_item_batch(
+                        batch_operations=batch,
+                        partition_key=partition_key,
+                    )
+                except (CosmosBatchOperationError, CosmosHttpResponseError):
+                    logger.exception(
+                        "Batch %s of %d documents failed in %s",
+                        operation,
+                        len(batch),
+                        self._container_name,
+                    )
+                    raise
+
+        await asyncio.gather(*(run(batch) for batch in batches))
+
+    async def create_many(self, entities: Sequence[T], partition_key: str) -> None:
+        """
+        Create documents that share a partition key in transactional batches.
+
+        Same batching as upsert_many(), but a document that already exists
+        fails its batch instead of being overwritten.
+
+        Args:
+            entities: Domain models to create.
+            partition_key: Partition key shared by every entity.
+
+        Raises:
+            CosmosHttpResponseError: If a batch request fails.
+            CosmosBatchOperationError: If an operation inside a batch fails.
+        """
+        await self._execute_batches("create", entities, partition_key)
+
+    async def upsert_many(self, entities: Sequence[T], partition_key: str) -> None:
+        """
+        Upsert documents that share a partition key in transactional batches.
+
+        One round trip per batch of up to MAX_BATCH_OPERATIONS documents
+        (and MAX_BATCH_BYTES of payload) instead of one per document; each
+        batch is applied atomically, and batches run concurrently.
+
+        Args:
+            entities: Domain models to upsert.
+            partition_key: Partition key shared by every entity.
+
+        Raises:
+            CosmosHttpResponseError: If a batch request fails.
+            CosmosBatchOperationError: If an operation inside a batch fails.
+        """
+        await self._execute_batches("upsert", entities, partition_key)
+
+    async def patch_many(
+        self,
+        patches: Sequence[tuple[UUID | str, list[dict[str, Any]]]],
+        partition_key: str,
+    ) -> None:
+        """
+        Patch documents that share a partition key in transactional batches.
+
+        Same batching as upsert_many(), but each operation carries only the
+        changed properties instead of the whole document, so neither a read
+        nor a full rewrite is needed per document.
+
+        Args:
+            patches: (document ID, patch operations) pairs, at most 10
+                operations per document.
+            partition_key: Partition key shared by every document.
+
+        Raises:
+            CosmosHttpResponseError: If a batch request fails.
+            CosmosBatchOperationError: If an operation inside a batch fails,
+                including a patch of a document that does not exist.
+        """
+        operations = [("patch", (str(item_id), ops)) for item_id, ops in patches]
+        await self._send_batches(
+            "patch",
+            [
+                operations[i : i + MAX_BATCH_OPERATIONS]
+                for i in range(0, len(operations), MAX_BATCH_OPERATIONS)
+            ],
+            partition_key,
+        )
+        logger.info(
+            "Batch patch of %d documents in %s (partition %s)",
+            len(operations),
+            self._container_name,
+            partition_key,
+        )
+
     async def delete(self, item_id: UUID | str, partition_key: str) -> bool:
         """
         Delete a document.
@@ -169,6 +469,28 @@ class BaseRepository[T: BaseModel](ABC):
             logger.exception("Failed to delete document %s from %s", str_id, self._container_name)
             raise
 
+    def _build_query_kwargs(
+        self,
+        query: str,
+        parameters: list[dict[str, Any]] | None,
+        partition_key: str | None,
+        max_item_count: int,
+        offset: int,
+    ) -> dict[str, Any]:
+        """Build query_items kwargs, adding OFFSET/LIMIT if not already in query."""
+        optimized_query = query
+        if "OFFSET" not in query.upper() and "LIMIT" not in query.upper():
+            optimized_query = f"{query} OFFSET {offset} LIMIT {max_item_count}"
+
+        query_kwargs: dict[str, Any] = {
+            "query": optimized_query,
+            "parameters": parameters or [],
+            "max_item_count": max_item_count,
+        }
+        if partition_key is not None:
+            query_kwargs["partition_key"] = partition_key
+        return query_kwargs
+
     async def query(
         self,
         query: str,
@@ -186,35 +508,159 @@ class BaseRepository[T: BaseModel](ABC):
             parameters: Query parameters.
             partition_key: Optional partition key for scoped query.
             max_item_count: Maximum items to return (LIMIT).
-            offset: Number of items to skip (OFFSET).
+            offset: Number of items to skip (OFFSET). Cosmos reads every
+                skipped row, so keep offsets small; use query_page() to page
+                deep result sets.
 
         Returns:
             List of domain models matching the query.
         """
         logger.debug("Executing query on %s: %s", self._container_name, query[:100])
 
-        # Add OFFSET/LIMIT if not already in query
-        optimized_query = query
-        if "OFFSET" not in query.upper() and "LIMIT" not in query.upper():
-            optimized_query = f"{query} OFFSET {offset} LIMIT {max_item_count}"
-
+        query_kwargs = self._build_query_kwargs(
+            query, parameters, partition_key, max_item_count, offset
+        )
         try:
-            query_kwargs: dict[str, Any] = {
-                "query": optimized_query,
-                "parameters": parameters or [],
-                "max_item_count": max_item_count,
-            }
-            if partition_key is not None:
-                query_kwargs["partition_key"] = partition_key
-
             items = self._container.query_items(**query_kwargs)
-            results = [self._from_document(item) async for item in items]
+            results = self._from_documents([item async for item in items])
             logger.debug("Query returned %d items from %s", len(results), self._container_name)
             return results
         except CosmosHttpResponseError:
             logger.exception("Query failed on %s", self._container_name)
             raise
 
+    async def query_page(
+        self,
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        partition_key: str | None = None,
+        *,
+        max_item_count: int = 100,
+        continuation: str | None = None,
+    ) -> tuple[list[T], str | None]:
+        """
+        Execute a SQL query and return one page plus a continuation token.
+
+        Unlike OFFSET, which Cosmos implements by reading and discarding the
+        skipped rows, resuming from a continuation token costs the same for
+        every page. Prefer this over query(offset=...) for deep pagination.
+
+        Args:
+            query: Cosmos DB SQL query string (without OFFSET/LIMIT).
+            parameters: Query parameters.
+            partition_key: Optional partition key for scoped query.
+            max_item_count: Page size.
+            continuation: Token returned with the previous page, or None for
+                the first page.
+
+        Returns:
+            Tuple of (domain models on this page, token for the next page or
+            None when there are no more results).
+
+        Raises:
+            InvalidOperationError: If Cosmos rejects the continuation token.
+            CosmosHttpResponseError: If the query fails otherwise.
+        """
+        logger.debug("Executing paged query on %s: %s", self._container_name, query[:100])
+
+        query_kwargs: dict[str, Any] = {
+            "query": query,
+            "parameters": parameters or [],
+            "max_item_count": max_item_count,
+        }
+        if partition_key is not None:
+            query_kwargs["partition_key"] = partition_key
+        try:
+            # The SDK types by_page() as a plain AsyncIterator, but the pager it
+            # returns also carries continuation_token.
+            pager: Any = self._container.query_items(**query_kwargs).by_page(continuation)
+            try:
+                page = await anext(pager)
+            except StopAsyncIteration:
+                return [], None
+            results = self._from_documents([item async for item in page])
+        except CosmosHttpResponseError as exc:
+            # Tokens come from clients; a malformed, tampered or expired one is
+            # their bad input, not a database outage
+            if continuation is not None and exc.status_code == 400:
+                logger.warning(
+                    "Rejected continuation token on %s: %s", self._container_name, exc.message
+                )
+                msg = "Invalid continuation token"
+                raise InvalidOperationError(msg) from exc
+            logger.exception("Paged query failed on %s", self._container_name)
+            raise
+        logger.debug("Paged query returned %d items from %s", len(results), self._container_name)
+        return results, pager.continuation_token
+
+    async def iter_query(
+        self,
+        query: str,
+        parameters: list[dict[str, Any]] | None = None,
+        partition_key: str | None = None,
+        *,
+        max_item_count: int = 100,
+        offset: int = 0,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Execute a SQL query and yield results one at a time.
+
+        Streaming counterpart of query(): only the current page is held in
+        memory, so callers walking large result sets never buffer them whole.
+
+        Args:
+            query: Cosmos DB SQL query string.
+            parameters: Query parameters.
+            partition_key: Optional partition key for scoped query.
+            max_item_count: Maximum items to return (LIMIT), also the page size.
+            offset: Number of items to skip (OFFSET).
+
+        Yields:
+            Domain models matching the query.
+        """
+        logger.debug("Streaming query on %s: %s", self._container_name, query[:100])
+
+        query_kwargs = self._build_query_kwargs(
+            query, parameters, partition_key, max_item_count, offset
+        )
+        try:
+            async for item in self._container.query_items(**query_kwargs):
+                yield self._from_document(item)
+        except CosmosHttpResponseError:
+            logger.exception("Streaming query failed on %s", self._container_name)
+            raise
+
+    def _build_projection_kwargs(
+        self,
+        fields: list[str],
+        where_clause: str | None,
+        parameters: list[dict[str, Any]] | None,
+        partition_key: str | None,
+        max_item_count: int,
+        offset: int,
+        order_by: str | None,
+    ) -> dict[str, Any]:
+        """Build query_items kwargs for a projected SELECT."""
+        projection = ", ".join(f"c.{field}" for field in fields)
+        query = f"SELECT {projection} FROM c"  # noqa: S608  # nosec B608
+
+        if where_clause:
+            query = f"{query} WHERE {where_clause}"
+
+        if order_by:
+            query = f"{query} ORDER BY {order_by}"
+
+        query = f"{query} OFFSET {offset} LIMIT {max_item_count}"
+
+        query_kwargs: dict[str, Any] = {
+            "query": query,
+            "parameters": parameters or [],
+            "max_item_count": max_item_count,
+        }
+        if partition_key is not None:
+            query_kwargs["partition_key"] = partition_key
+        return query_kwargs
+
     async def query_with_projection(
         self,
         fields: list[str],
@@ -244,29 +690,16 @@ class BaseRepository[T: BaseModel](ABC):
         Returns:
             List of dictionaries with only projected fields.
         """
-        # Build SELECT projection
-        projection = ", ".join(f"c.{field}" for field in fields)
-        query = f"SELECT {projection} FROM c"  # noqa: S608  # nosec B608
-
-        if where_clause:
-            query = f"{query} WHERE {where_clause}"
-
-        if order_by:
-            query = f"{query} ORDER BY {order_by}"
-
-        query = f"{query} OFFSET {offset} LIMIT {max_item_count}"
-
-        logger.debug("Executing projected query on %s: %s", self._container_name, query[:100])
+        query_kwargs = self._build_projection_kwargs(
+            fields, where_clause, parameters, partition_key, max_item_count, offset, order_by
+        )
+        logger.debug(
+            "Executing projected query on %s: %s",
+            self._container_name,
+            query_kwargs["query"][:100],
+        )
 
         try:
-            query_kwargs: dict[str, Any] = {
-                "query": query,
-                "parameters": parameters or [],
-                "max_item_count": max_item_count,
-            }
-            if partition_key is not None:
-                query_kwargs["partition_key"] = partition_key
-
             items = self._container.query_items(**query_kwargs)
             results = [item async for item in items]
             logger.debug(
@@ -279,6 +712,41 @@ class BaseRepository[T: BaseModel](ABC):
             logger.exception("Projected query failed on %s", self._container_name)
             raise
 
+    async def iter_query_with_projection(
+        self,
+        fields: list[str],
+        where_clause: str | None = None,
+        parameters: list[dict[str, Any]] | None = None,
+        partition_key: str | None = None,
+        *,
+        max_item_count: int = 100,
+        offset: int = 0,
+        order_by: str | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Execute a projected query and yield rows one at a time.
+
+        Streaming counterpart of query_with_projection(); arguments are the same.
+
+        Yields:
+            Dictionaries with only projected fields.
+        """
+        query_kwargs = self._build_projection_kwargs(
+            fields, where_clause, parameters, partition_key, max_item_count, offset, order_by
+        )
+        logger.debug(
+            "Streaming projected query on %s: %s",
+            self._container_name,
+            query_kwargs["query"][:100],
+        )
+
+        try:
+            async for item in self._container.query_items(**query_kwargs):
+                yield item
+        except CosmosHttpResponseError:
+            logger.exception("Streaming projected query failed on %s", self._container_name)
+            raise
+
     async def count(
         self,
         query: str | None = None,
@@ -309,8 +777,59 @@ class BaseRepository[T: BaseModel](ABC):
                 query_kwargs["partition_key"] = partition_key
 
             items = self._container.query_items(**query_kwargs)
-            result = [item async for item in items]
-            return cast("int", result[0]) if result else 0
+            # COUNT yields a single value; take it instead of collecting a list
+            async for value in items:
+                return cast("int", value)
+            return 0
         except CosmosHttpResponseError:
             logger.exception("Count query failed on %s", self._container_name)
             raise
+
+
+class CosmosDocumentModel(Protocol):
+    """Domain model that converts itself to and from Cosmos DB documents."""
+
+    def to_cosmos_document(self) -> dict[str, Any]: ...
+
+    @classmethod
+    def from_cosmos_document(cls, doc: dict[str, Any]) -> Any: ...
+
+    @classmethod
+    def from_cosmos_documents(cls, docs: list[dict[str, Any]]) -> list[Any]: ...
+
+
+class PartitionedRepository[T: BaseModel](BaseRepository[T]):
+    """
+    Repository for one model in one container partitioned by month.
+
+    Subclasses set MODEL and CONTAINER_NAME and carry only their queries;
+    construction, document conversion and partition keys are shared here.
+    """
+
+    CONTAINER_NAME: ClassVar[str]
+    MODEL: ClassVar[type[CosmosDocumentModel]]
+
+    def __init__(self, container: ContainerProxy) -> None:
+        """Initialize the repository on its container."""
+        super().__init__(container, self.CONTAINER_NAME)
+
+    def _to_document(self, entity: T) -> dict[str, Any]:
+        """Convert the model to its Cosmos DB document."""
+        return cast("CosmosDocumentModel", entity).to_cosmos_document()
+
+    def _from_document(self, doc: dict[str, Any]) -> T:
+        """Convert a Cosmos DB document to the model."""
+        return cast("T", self.MODEL.from_cosmos_document(doc))
+
+    def _from_documents(self, docs: list[dict[str, Any]]) -> list[T]:
+        """Convert a batch of Cosmos DB documents in one validation."""
+        return cast("list[T]", self.MODEL.from_cosmos_documents(docs))
+
+    @staticmethod
+    def build_partition_key(timestamp: datetime) -> str:
+        """
+        Build partition key from timestamp.
+
+        Format: {YYYY-MM}
+        """
+        return build_partition_key(timestamp)
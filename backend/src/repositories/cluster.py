@@ -6,54 +6,158 @@ Handles cluster CRUD and queries with partition key: pk = {year-month}
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from datetime import UTC, datetime
+import time
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
-from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.core import MatchConditions
+from azure.cosmos import CosmosDict
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosHttpResponseError
 
+from lib.clock import to_json_timestamp, utc_now
+from lib.partition import partition_keys_between
 from models.cluster import Cluster, ClusterMember, ClusterStatus
-from repositories.base import BaseRepository
+from repositories.base import PartitionedRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
     from uuid import UUID
 
-    from azure.cosmos.aio import ContainerProxy
-
 logger = logging.getLogger(__name__)
 
-
-class ClusterRepository(BaseRepository[Cluster]):
+# Writes attempted by update_with_retry() before an ETag conflict is raised
+MAX_ETAG_RETRIES = 3
+
+# Date ranges covering more months than this run as one cross-partition
+# query instead of one concurrent query per month
+MAX_DATE_RANGE_PARTITIONS = 6
+
+# The pending-review badge is polled by every open dashboard. Counts are kept
+# per process for a few seconds so repeated polls don't each run a COUNT
+# query; the single-document writes on ClusterRepository (create, update,
+# patch and the ETag-guarded replace) clear them, and other workers catch up
+# within the TTL.
+PENDING_COUNT_TTL_SECONDS = 5.0
+_pending_count_cache: dict[str | None, tuple[int, float]] = {}
+
+
+def clear_pending_count_cache() -> None:
+    """Drop every cached pending-review count held by this process."""
+    _pending_count_cache.clear()
+
+
+def _build_candidate_query(*, filter_by_customer: bool) -> str:
+    """
+    Build the vector-search candidate query for one filter combination.
+
+    The customer + updatedAt pre-filter uses the (customerId, updatedAt)
+    composite index in cosmos.setup.
+    """
+    where_clauses = ["c.customerId = @customerId"] if filter_by_customer else []
+    where_clauses += [
+        "c.updatedAt >= @minUpdatedAt",
+        "c.openCount > 0",
+        "c.ticketCount < @maxMembers",
+    ]
+    where_str = " AND ".join(where_clauses)
+    return (
+        "SELECT TOP @topK "  # noqa: S608  # nosec B608
+        "c.id, c.customerId, c.openCount, c.category, c.subcategory, "
+        "c.updatedAt, c.ticketCount, c.status, c.pk, "
+        "VectorDistance(c.centroidVector, @queryVector) AS similarityScore "
+        "FROM c "
+        f"WHERE {where_str} "
+        "ORDER BY VectorDistance(c.centroidVector, @queryVector)"
+    )
+
+
+# Every document field except the member list and the centroid vector
+# (1536 floats), which list views never read.
+_SUMMARY_PROJECTION = ", ".join(
+    f"c.{field.alias}"
+    for name, field in Cluster.model_fields.items()
+    if name not in {"members", "centroid_vector"}
+)
+
+# Only two query shapes exist; build them once so every ingest sends the
+# same SQL text instead of re-joining clauses per call.
+_CANDIDATE_QUERY_BY_CUSTOMER = _build_candidate_query(filter_by_customer=True)
+_CANDIDATE_QUERY_ALL_CUSTOMERS = _build_candidate_query(filter_by_customer=False)
+
+_STATUS_WHERE = "c.status = @status"
+# Served by the (status, createdAt DESC) composite index in cosmos.setup
+_BY_STATUS_FROM = f"FROM c WHERE {_STATUS_WHERE} ORDER BY c.createdAt DESC"
+_BY_STATUS_QUERY = f"SELECT * {_BY_STATUS_FROM}"
+_BY_STATUS_SUMMARY_QUERY = f"SELECT {_SUMMARY_PROJECTION} {_BY_STATUS_FROM}"
+_DATE_RANGE_QUERY = (
+    "SELECT * FROM c WHERE c.createdAt >= @start_date AND c.createdAt <= @end_date "
+    "ORDER BY c.createdAt DESC"
+)
+# Shared by every pending count (the SDK only reads it)
+_PENDING_PARAMETERS: list[dict[str, Any]] = [
+    {"name": "@status", "value": ClusterStatus.PENDING.value}
+]
+# Matches against the indexed /members/[]/ticketId/? path (see cosmos.setup)
+_WITH_TICKET_QUERY = (
+    "SELECT * FROM c WHERE EXISTS(SELECT VALUE m FROM m IN c.members WHERE m.ticketId = @ticket_id)"
+)
+
+
+class ClusterRepository(PartitionedRepository[Cluster]):
     """Repository for cluster operations."""
 
     CONTAINER_NAME = "clusters"
+    MODEL = Cluster
 
-    def __init__(self, container: ContainerProxy) -> None:
-        """Initialize cluster repository."""
-        super().__init__(container, self.CONTAINER_NAME)
+    def _from_write_response(self, entity: Cluster, result: dict[str, Any]) -> Cluster:
+        """Take the new ETag from the response headers instead of a returned body."""
+        if isinstance(result, CosmosDict):
+            entity.etag = result.get_response_headers().get("etag")
+        return entity
 
-    def _to_document(self, entity: Cluster) -> dict[str, Any]:
-        """Convert Cluster model to Cosmos DB document."""
-        return entity.to_cosmos_document()
-
-    def _from_document(self, doc: dict[str, Any]) -> Cluster:
-        """Convert Cosmos DB document to Cluster model."""
-        return Cluster.from_cosmos_document(doc)
+    async def create(
+        self, entity: Cluster, _partition_key: str, *, return_content: bool = True
+    ) -> Cluster:
+        """Create a cluster; new clusters start pending, so cached counts are dropped."""
+        created = await super().create(entity, _partition_key, return_content=return_content)
+        clear_pending_count_cache()
+        return created
 
-    @staticmethod
-    def build_partition_key(timestamp: datetime) -> str:
-        """
-        Build partition key from timestamp.
+    async def update(
+        self, entity: Cluster, _partition_key: str, *, return_content: bool = True
+    ) -> Cluster:
+        """Update a cluster; its status may have changed, so cached counts are dropped."""
+        updated = await super().update(entity, _partition_key, return_content=return_content)
+        clear_pending_count_cache()
+        return updated
 
-        Format: {YYYY-MM}
-        """
-        return timestamp.strftime("%Y-%m")
+    async def patch(
+        self,
+        item_id: UUID | str,
+        partition_key: str,
+        operations: list[dict[str, Any]],
+        *,
+        filter_predicate: str | None = None,
+        etag: str | None = None,
+    ) -> Cluster | None:
+        """Patch a cluster; its status may have changed, so cached counts are dropped."""
+        patched = await super().patch(
+            item_id, partition_key, operations, filter_predicate=filter_predicate, etag=etag
+        )
+        clear_pending_count_cache()
+        return patched
 
     async def get_pending_clusters(
         self,
         partition_key: str,
         *,
         limit: int = 100,
+        offset: int = 0,
+        summary_only: bool = False,
     ) -> list[Cluster]:
         """
         Get clusters pending review.
@@ -61,33 +165,42 @@ class ClusterRepository(BaseRepository[Cluster]):
         Args:
             partition_key: Partition key for scoped query.
             limit: Maximum clusters to return.
+            offset: Number of clusters to skip.
+            summary_only: When True, skip loading members and centroid vectors.
 
         Returns:
             List of pending clusters.
         """
-        query = """
-            SELECT * FROM c
-            WHERE c.status = @status
-            ORDER BY c.createdAt DESC
-        """
-        parameters = [{"name": "@status", "value": ClusterStatus.PENDING.value}]
-        return await self.query(query, parameters, partition_key, max_item_count=limit)
+        return await self.get_by_status(
+            ClusterStatus.PENDING,
+            partition_key,
+            limit=limit,
+            offset=offset,
+            summary_only=summary_only,
+        )
 
     async def get_pending_review_count(self, partition_key: str | None = None) -> int:
         """
         Get count of clusters pending review.
 
+        The count is cached per process. Writes through this process clear
+        the cache, but a count cached here may lag writes made by other
+        workers by up to PENDING_COUNT_TTL_SECONDS.
+
         Args:
             partition_key: Optional partition key for scoped count.
 
         Returns:
-            Count of pending clusters.
+            Count of pending clusters (at most PENDING_COUNT_TTL_SECONDS old).
         """
-        return await self.count(
-            "c.status = @status",
-            [{"name": "@status", "value": ClusterStatus.PENDING.value}],
-            partition_key,
-        )
+        now = time.monotonic()
+        cached = _pending_count_cache.get(partition_key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        count = await self.count(_STATUS_WHERE, _PENDING_PARAMETERS, partition_key)
+        _pending_count_cache[partition_key] = (count, now + PENDING_COUNT_TTL_SECONDS)
+        return count
 
     async def get_by_status(
         self,
@@ -95,6 +208,8 @@ class ClusterRepository(BaseRepository[Cluster]):
         partition_key: str | None = None,
         *,
         limit: int = 100,
+        offset: int = 0,
+        summary_only: bool = False,
     ) -> list[Cluster]:
         """
         Get clusters by status.
@@ -103,13 +218,65 @@ class ClusterRepository(BaseRepository[Cluster]):
             status: Cluster status to filter by.
             partition_key: Optional partition key for scoped query.
             limit: Maximum clusters to return.
+            offset: Number of clusters to skip.
+            summary_only: When True, skip loading members and centroid vectors.
 
         Returns:
             List of clusters with the specified status.
         """
-        query = "SELECT * FROM c WHERE c.status = @status ORDER BY c.createdAt DESC"
+        query = _BY_STATUS_SUMMARY_QUERY if summary_only else _BY_STATUS_QUERY
+        parameters = [{"name": "@status", "value": status.value}]
+        return await self.query(
+            query, parameters, partition_key, max_item_count=limit, offset=offset
+        )
+
+    async def get_by_status_page(
+        self,
+        status: ClusterStatus,
+        partition_key: str | None = None,
+        *,
+        limit: int = 100,
+        continuation: str | None = None,
+        summary_only: bool = False,
+    ) -> tuple[list[Cluster], str | None]:
+        """
+        Get one page of clusters by status, resuming from a continuation token.
+
+        Args:
+            status: Cluster status to filter by.
+            partition_key: Optional partition key for scoped query.
+            limit: Page size.
+            continuation: Token from the previous page, or None for the first.
+            summary_only: When True, skip loading members and centroid vectors.
+
+        Returns:
+            Tuple of (clusters on this page, token for the next page or None).
+
+        Raises:
+            InvalidOperationError: If Cosmos rejects the continuation token.
+        """
+        query = _BY_STATUS_SUMMARY_QUERY if summary_only else _BY_STATUS_QUERY
         parameters = [{"name": "@status", "value": status.value}]
-        return await self.query(query, parameters, partition_key, max_item_count=limit)
+        return await self.query_page(
+            query, parameters, partition_key, max_item_count=limit, continuation=continuation
+        )
+
+    async def count_by_status(self, status: ClusterStatus, partition_key: str | None = None) -> int:
+        """
+        Count clusters with a status using a server-side COUNT.
+
+        Args:
+            status: Cluster status to filter by.
+            partition_key: Optional partition key for scoped count.
+
+        Returns:
+            Number of clusters with the status.
+        """
+        if status == ClusterStatus.PENDING:
+            return await self.get_pending_review_count(partition_key)
+        return await self.count(
+            _STATUS_WHERE, [{"name": "@status", "value": status.value}], partition_key
+        )
 
     async def get_clusters_with_ticket(
         self,
@@ -126,13 +293,8 @@ class ClusterRepository(BaseRepository[Cluster]):
         Returns:
             List of clusters containing the ticket.
         """
-        query = (
-            "SELECT * FROM c WHERE EXISTS("
-            "SELECT VALUE m FROM m IN c.members "
-            "WHERE m.ticketId = @ticket_id)"
-        )
         parameters = [{"name": "@ticket_id", "value": str(ticket_id)}]
-        return await self.query(query, parameters, partition_key)
+        return await self.query(_WITH_TICKET_QUERY, parameters, partition_key)
 
     async def update_status(
         self,
@@ -156,18 +318,18 @@ class ClusterRepository(BaseRepository[Cluster]):
         Returns:
             Updated cluster or None if not found.
         """
-        cluster = await self.get_by_id(cluster_id, partition_key)
-        if not cluster:
-            return None
-
-        cluster.status = status
-        cluster.updated_at = datetime.now(UTC)
-
+        # Only a few scalar fields change, so patch them in place rather than
+        # reading the whole document and writing it back.
+        operations: list[dict[str, Any]] = [
+            {"op": "set", "path": "/status", "value": status.value},
+            {"op": "set", "path": "/updatedAt", "value": to_json_timestamp(utc_now())},
+        ]
         if status == ClusterStatus.DISMISSED:
-            cluster.dismissed_by = dismissed_by
-            cluster.dismissal_reason = dismissal_reason
-
-        return await self.update(cluster, partition_key)
+            operations += [
+                {"op": "set", "path": "/dismissedBy", "value": dismissed_by},
+                {"op": "set", "path": "/dismissalReason", "value": dismissal_reason},
+            ]
+        return await self.patch(cluster_id, partition_key, operations)
 
     async def add_ticket(
         self,
@@ -186,6 +348,9 @@ class ClusterRepository(BaseRepository[Cluster]):
         """
         Add a ticket to a cluster.
 
+        Appends the member with a conditional patch; the cluster is only read
+        when the condition fails (already a member, or at capacity).
+
         Args:
             cluster_id: Cluster ID.
             ticket_id: Ticket ID to add.
@@ -200,56 +365,110 @@ class ClusterRepository(BaseRepository[Cluster]):
         Returns:
             Updated cluster or None if not found.
         """
+        member = ClusterMember(
+            ticket_id=ticket_id,
+            ticket_number=ticket_number,
+            summary=summary,
+            category=category,
+            subcategory=subcategory,
+            created_at=created_at,
+            confidence_score=confidence_score,
+        )
+        operations: list[dict[str, Any]] = [
+            {
+                "op": "add",
+                "path": "/members/-",
+                "value": member.model_dump(mode="json", by_alias=True),
+            },
+            {"op": "incr", "path": "/ticketCount", "value": 1},
+            {"op": "set", "path": "/updatedAt", "value": to_json_timestamp(member.added_at)},
+        ]
+        # ticket_id is a UUID, so inlining it in the predicate is safe
+        filter_predicate = (
+            f'FROM c WHERE NOT ARRAY_CONTAINS(c.members, {{"ticketId": "{ticket_id}"}}, true) '
+            f"AND ARRAY_LENGTH(c.members) < {int(max_members)}"
+        )
+        try:
+            return await self.patch(
+                cluster_id, partition_key, operations, filter_predicate=filter_predicate
+            )
+        except CosmosAccessConditionFailedError:
+            pass
+
         cluster = await self.get_by_id(cluster_id, partition_key)
-        if not cluster:
-            return None
+        if not cluster or cluster.has_member(ticket_id):
+            return cluster
 
-        if ticket_id not in cluster.ticket_ids:
-            if len(cluster.members) >= max_members:
+        def append(fresh: Cluster) -> None:
+            if fresh.has_member(ticket_id):
+                return
+            if len(fresh.members) >= max_members:
                 msg = f"Cluster member limit ({max_members}) reached"
                 raise ValueError(msg)
-            cluster.members.append(
-                ClusterMember(
-                    ticket_id=ticket_id,
-                    ticket_number=ticket_number,
-                    summary=summary,
-                    category=category,
-                    subcategory=subcategory,
-                    created_at=created_at,
-                    confidence_score=confidence_score,
-                )
-            )
-            cluster.ticket_count = len(cluster.members)
-            cluster.updated_at = datetime.now(UTC)
-            return await self.update(cluster, partition_key)
+            fresh.members.append(member)
+            fresh.ticket_count = len(fresh.members)
+            fresh.updated_at = utc_now()
 
-        return cluster
+        # Membership changed between the patch and the read; append to the
+        # fresh copy under its ETag
+        return await self.update_with_retry(cluster_id, partition_key, append, current=cluster)
 
     async def remove_ticket(
         self,
         cluster_id: UUID,
         ticket_id: UUID,
         partition_key: str,
+        *,
+        current: Cluster | None = None,
     ) -> Cluster | None:
         """
         Remove a ticket from a cluster.
 
+        The read locates the member; the removal itself is a patch guarded on
+        that member still being at the same position.
+
         Args:
             cluster_id: Cluster ID.
             ticket_id: Ticket ID to remove.
             partition_key: Partition key value.
+            current: Copy of the cluster the caller already read. Used to
+                locate the member instead of reading it again; the guarded
+                patch still catches it being stale.
 
         Returns:
             Updated cluster or None if not found.
         """
-        cluster = await self.get_by_id(cluster_id, partition_key)
+        cluster = current or await self.get_by_id(cluster_id, partition_key)
         if not cluster:
             return None
 
-        if cluster.remove_member(ticket_id):
-            return await self.update(cluster, partition_key)
+        index = cluster.member_index(ticket_id)
+        if index is None:
+            return cluster
+
+        operations: list[dict[str, Any]] = [
+            {"op": "remove", "path": f"/members/{index}"},
+            {"op": "incr", "path": "/ticketCount", "value": -1},
+            {"op": "set", "path": "/updatedAt", "value": to_json_timestamp(utc_now())},
+        ]
+        filter_predicate = f'FROM c WHERE c.members[{index}].ticketId = "{ticket_id}"'
+        try:
+            return await self.patch(
+                cluster_id, partition_key, operations, filter_predicate=filter_predicate
+            )
+        except CosmosAccessConditionFailedError:
+            pass
 
-        return cluster
+        # Members shifted since the read; remove from a fresh copy under its ETag
+        cluster = await self.get_by_id(cluster_id, partition_key)
+        if cluster is None or not cluster.has_member(ticket_id):
+            return cluster
+        return await self.update_with_retry(
+            cluster_id,
+            partition_key,
+            lambda fresh: fresh.remove_member(ticket_id),
+            current=cluster,
+        )
 
     async def get_by_date_range(
         self,
@@ -269,20 +488,28 @@ class ClusterRepository(BaseRepository[Cluster]):
         Returns:
             List of clusters within the date range.
         """
-        # Build partition key for the date range (may span multiple months)
-        partition_key = self.build_partition_key(end_date)
-
-        query = """
-            SELECT * FROM c
-            WHERE c.createdAt >= @start_date
-            AND c.createdAt <= @end_date
-            ORDER BY c.createdAt DESC
-        """
-        parameters = [
-            {"name": "@start_date", "value": start_date.isoformat()},
-            {"name": "@end_date", "value": end_date.isoformat()},
+        # The range may span months. Each covered partition gets its own
+        # scoped query, run concurrently, rather than one cross-partition
+        # query; each returns its newest `limit` and the sorted pages are
+        # merged newest-first here. Long ranges fall back to a single
+        # cross-partition query so the fan-out stays bounded.
+        partition_keys = partition_keys_between(start_date, end_date)
+        parameters: list[dict[str, Any]] = [
+            {"name": "@start_date", "value": to_json_timestamp(start_date)},
+            {"name": "@end_date", "value": to_json_timestamp(end_date)},
         ]
-        return await self.query(query, parameters, partition_key, max_item_count=limit)
+        if len(partition_keys) > MAX_DATE_RANGE_PARTITIONS:
+            return await self.query(_DATE_RANGE_QUERY, parameters, max_item_count=limit)
+        pages = await asyncio.gather(
+            *(
+                self.query(_DATE_RANGE_QUERY, parameters, pk, max_item_count=limit)
+                for pk in partition_keys
+            )
+        )
+        if len(pages) == 1:
+            return pages[0]
+        merged = heapq.merge(*pages, key=lambda c: c.created_at, reverse=True)
+        return list(islice(merged, limit))
 
     async def find_cluster_candidates(
         self,
@@ -315,52 +542,46 @@ class ClusterRepository(BaseRepository[Cluster]):
             List of dicts with cluster fields + similarityScore, merged
             across partitions, sorted by similarityScore descending.
         """
-        # Build WHERE clauses conditionally
-        where_clauses = []
         parameters: list[dict[str, Any]] = [
             {"name": "@topK", "value": top_k},
             {"name": "@queryVector", "value": query_vector},
             {"name": "@minUpdatedAt", "value": min_updated_at},
             {"name": "@maxMembers", "value": max_members},
         ]
-
         if filter_by_customer:
-            where_clauses.append("c.customerId = @customerId")
+            query = _CANDIDATE_QUERY_BY_CUSTOMER
             parameters.append({"name": "@customerId", "value": customer_id})
+        else:
+            query = _CANDIDATE_QUERY_ALL_CUSTOMERS
 
-        where_clauses.append("c.updatedAt >= @minUpdatedAt")
-        where_clauses.append("c.openCount > 0")
-        where_clauses.append("c.ticketCount < @maxMembers")
-
-        where_str = " AND ".join(where_clauses)
-
-        query = (
-            "SELECT TOP @topK "  # noqa: S608  # nosec B608
-            "c.id, c.customerId, c.openCount, c.category, c.subcategory, "
-            "c.updatedAt, c.ticketCount, c.status, c.pk, "
-            "VectorDistance(c.centroidVector, @queryVector) AS similarityScore "
-            "FROM c "
-            f"WHERE {where_str} "
-            "ORDER BY VectorDistance(c.centroidVector, @queryVector)"
+        # Partitions are independent, so overlap their round trips
+        per_partition = await asyncio.gather(
+            *(self._search_partition(query, parameters, pk) for pk in partition_keys)
         )
-
-        all_results: list[dict[str, Any]] = []
-        for pk in partition_keys:
-            try:
-                items = self._container.query_items(
-                    query=query,
-                    parameters=parameters,
-                    partition_key=pk,
-                )
-                results = [item async for item in items]
-                all_results.extend(results)
-            except CosmosHttpResponseError:
-                logger.exception("Vector search failed for partition %s", pk)
+        all_results = [item for results in per_partition for item in results]
 
         # Sort merged results by similarity descending, take top_k
         all_results.sort(key=lambda x: x.get("similarityScore", 0), reverse=True)
         return all_results[:top_k]
 
+    async def _search_partition(
+        self,
+        query: str,
+        parameters: list[dict[str, Any]],
+        partition_key: str,
+    ) -> list[dict[str, Any]]:
+        """Run a candidate query in one partition; a failure yields no candidates."""
+        try:
+            items = self._container.query_items(
+                query=query,
+                parameters=parameters,
+                partition_key=partition_key,
+            )
+            return [item async for item in items]
+        except CosmosHttpResponseError:
+            logger.exception("Vector search failed for partition %s", partition_key)
+            return []
+
     async def update_cluster_with_etag(
         self,
         cluster: Cluster,
@@ -368,8 +589,8 @@ class ClusterRepository(BaseRepository[Cluster]):
         """
         Update a cluster with ETag-based optimistic concurrency.
 
-        Uses replace_item with if_match to prevent lost updates
-        during concurrent centroid vector modifications.
+        Uses replace_item guarded on the cluster's ETag to prevent lost
+        updates during concurrent centroid vector modifications.
 
         Args:
             cluster: Cluster model with updated fields. Must have etag set.
@@ -381,9 +602,60 @@ class ClusterRepository(BaseRepository[Cluster]):
             CosmosHttpResponseError: On ETag conflict (412) or other errors.
         """
         document = self._to_document(cluster)
+        # The JSON-mode dump already stringified the id; reuse it.
         result = await self._container.replace_item(
-            item=str(cluster.id),
+            item=document["id"],
             body=document,
-            if_match=cluster.etag,
+            etag=cluster.etag,
+            match_condition=MatchConditions.IfNotModified,
         )
+        clear_pending_count_cache()
         return self._from_document(result)
+
+    async def update_with_retry(
+        self,
+        cluster_id: UUID,
+        partition_key: str,
+        mutator: Callable[[Cluster], object],
+        *,
+        current: Cluster | None = None,
+        max_attempts: int = MAX_ETAG_RETRIES,
+    ) -> Cluster | None:
+        """
+        Read-modify-write a cluster, guarded on its ETag.
+
+        The mutator is applied to the latest copy and written back with
+        update_cluster_with_etag(). On a 412 the cluster is re-read and the
+        mutator re-applied, so concurrent writers never lose each other's
+        changes. Errors raised by the mutator propagate unchanged.
+
+        Args:
+            cluster_id: Cluster ID.
+            partition_key: Partition key value.
+            mutator: Applies the change in place to the cluster it is given.
+            current: Copy of the cluster the caller already read, used for
+                the first attempt instead of reading it again.
+            max_attempts: Writes to try before giving up on conflicts.
+
+        Returns:
+            Updated cluster, or None if the cluster does not exist.
+
+        Raises:
+            CosmosHttpResponseError: On a conflict after max_attempts writes,
+                or any other write error.
+        """
+        cluster = current or await self.get_by_id(cluster_id, partition_key)
+        for attempt in range(1, max_attempts + 1):
+            if cluster is None:
+                return None
+            mutator(cluster)
+            try:
+                return await self.update_cluster_with_etag(cluster)
+            except CosmosHttpResponseError as exc:
+                if exc.status_code != 412 or attempt == max_attempts:
+                    raise
+                logger.warning(
+                    "ETag conflict on cluster %s (attempt %d), retrying", cluster_id, attempt
+                )
+            cluster = await self.get_by_id(cluster_id, partition_key)
+        return None
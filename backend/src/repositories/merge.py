@@ -7,44 +7,86 @@ Handles merge CRUD and queries with partition key: pk = {year-month}
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from pydantic import TypeAdapter
+
+from lib.clock import to_json_timestamp, utc_now
 from models.merge_operation import MergeOperation, MergeStatus
-from repositories.base import BaseRepository
+from repositories.base import PartitionedRepository
 
 if TYPE_CHECKING:
-    from azure.cosmos.aio import ContainerProxy
+    from collections.abc import AsyncGenerator
+    from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-
-class MergeRepository(BaseRepository[MergeOperation]):
+# UUID strings are parsed by pydantic-core in one call rather than UUID(str) per id
+_UUID_LIST_ADAPTER: TypeAdapter[list[UUID]] = TypeAdapter(list[UUID])
+
+# Every document field except the per-ticket revert snapshots, which listing
+# views never read and which dominate document size on wide merges.
+_SUMMARY_PROJECTION = ", ".join(
+    f"c.{field.alias}"
+    for name, field in MergeOperation.model_fields.items()
+    if name != "original_states"
+)
+
+# Queries are built once at import, on one line: identical text on every call
+# and no indentation shipped with each request. Each filter + ORDER BY shape
+# has a matching composite index in cosmos.setup (noted per query); keep them
+# in step when a query changes.
+# (primaryTicketId, performedAt DESC)
+_BY_PRIMARY_QUERY = (
+    "SELECT * FROM c WHERE c.primaryTicketId = @primary_id ORDER BY c.performedAt DESC"
+)
+# Single-property ORDER BY: the default range index on performedAt
+_RECENT_SUMMARY_QUERY = f"SELECT {_SUMMARY_PROJECTION} FROM c ORDER BY c.performedAt DESC"  # noqa: S608  # nosec B608
+# (status, performedAt DESC)
+_REVERTIBLE_WHERE = "c.status = @status AND c.revertDeadline > @now"
+_REVERTIBLE_FROM = f"FROM c WHERE {_REVERTIBLE_WHERE} ORDER BY c.performedAt DESC"
+_REVERTIBLE_QUERY = f"SELECT * {_REVERTIBLE_FROM}"
+_REVERTIBLE_SUMMARY_QUERY = f"SELECT {_SUMMARY_PROJECTION} {_REVERTIBLE_FROM}"
+# (primaryTicketId, status, performedAt) serves both of these. The JOIN
+# flattens secondaryTicketIds server-side into one stream of ID strings.
+_MERGED_IDS_QUERY = (
+    "SELECT VALUE t FROM c JOIN t IN c.secondaryTicketIds "
+    "WHERE c.primaryTicketId = @primary_id AND c.status = @status"
+)
+_CONFLICT_QUERY = (
+    "SELECT * FROM c WHERE c.primaryTicketId = @primary_id AND c.status = @status "
+    "AND c.performedAt > @performed_at AND c.id != @merge_id"
+)
+_BY_USER_WHERE = "c.performedBy = @user_id"
+# (clusterId, performedAt DESC)
+_BY_CLUSTER_QUERY = "SELECT * FROM c WHERE c.clusterId = @cluster_id ORDER BY c.performedAt DESC"
+# (status, performedAt DESC)
+_PENDING_QUERY = "SELECT * FROM c WHERE c.status = @status ORDER BY c.performedAt DESC"
+
+# Fixed status parameters, shared by every call (the SDK only reads them)
+_COMPLETED_STATUS_PARAM: dict[str, Any] = {"name": "@status", "value": MergeStatus.COMPLETED.value}
+_PENDING_PARAMETERS: list[dict[str, Any]] = [
+    {"name": "@status", "value": MergeStatus.PENDING.value}
+]
+
+
+def _revertible_parameters() -> list[dict[str, Any]]:
+    """
+    Parameters for _REVERTIBLE_WHERE, evaluated at the current time.
+
+    Timestamps are compared as strings, so bounds are rendered exactly as
+    stored ("...Z", not isoformat()'s "+00:00").
+    """
+    return [_COMPLETED_STATUS_PARAM, {"name": "@now", "value": to_json_timestamp(utc_now())}]
+
+
+class MergeRepository(PartitionedRepository[MergeOperation]):
     """Repository for merge operation records."""
 
     CONTAINER_NAME = "merges"
-
-    def __init__(self, container: ContainerProxy) -> None:
-        """Initialize merge repository."""
-        super().__init__(container, self.CONTAINER_NAME)
-
-    def _to_document(self, entity: MergeOperation) -> dict[str, Any]:
-        """Convert MergeOperation model to Cosmos DB document."""
-        return entity.to_cosmos_document()
-
-    def _from_document(self, doc: dict[str, Any]) -> MergeOperation:
-        """Convert Cosmos DB document to MergeOperation model."""
-        return MergeOperation.from_cosmos_document(doc)
-
-    @staticmethod
-    def build_partition_key(timestamp: datetime) -> str:
-        """
-        Build partition key from timestamp.
-
-        Format: {YYYY-MM}
-        """
-        return timestamp.strftime("%Y-%m")
+    MODEL = MergeOperation
 
     async def get_by_cluster_id(
         self,
@@ -61,9 +103,8 @@ class MergeRepository(BaseRepository[MergeOperation]):
         Returns:
             List of merge operations.
         """
-        query = "SELECT * FROM c WHERE c.clusterId = @cluster_id ORDER BY c.performedAt DESC"
         parameters = [{"name": "@cluster_id", "value": str(cluster_id)}]
-        return await self.query(query, parameters, partition_key)
+        return await self.query(_BY_CLUSTER_QUERY, parameters, partition_key)
 
     async def get_by_primary_ticket_id(
         self,
@@ -80,19 +121,66 @@ class MergeRepository(BaseRepository[MergeOperation]):
         Returns:
             List of merge operations.
         """
-        query = """
-            SELECT * FROM c
-            WHERE c.primaryTicketId = @primary_id
-            ORDER BY c.performedAt DESC
-        """
         parameters = [{"name": "@primary_id", "value": str(primary_ticket_id)}]
-        return await self.query(query, parameters, partition_key)
+        return await self.query(_BY_PRIMARY_QUERY, parameters, partition_key)
+
+    async def get_recent_merges(
+        self,
+        partition_key: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[MergeOperation]:
+        """
+        Get the most recent merge operations without their ticket snapshots.
+
+        Args:
+            partition_key: Partition key for scoped query.
+            limit: Maximum operations to return.
+            offset: Number of operations to skip.
+
+        Returns:
+            Merge operations, newest first, with empty original_states.
+        """
+        return await self.query(
+            _RECENT_SUMMARY_QUERY, partition_key=partition_key, max_item_count=limit, offset=offset
+        )
+
+    async def get_recent_merges_page(
+        self,
+        partition_key: str,
+        *,
+        limit: int = 100,
+        continuation: str | None = None,
+    ) -> tuple[list[MergeOperation], str | None]:
+        """
+        Get one page of recent merges (no snapshots) from a continuation token.
+
+        Args:
+            partition_key: Partition key for scoped query.
+            limit: Page size.
+            continuation: Token from the previous page, or None for the first.
+
+        Returns:
+            Tuple of (merges on this page, token for the next page or None).
+
+        Raises:
+            InvalidOperationError: If Cosmos rejects the continuation token.
+        """
+        return await self.query_page(
+            _RECENT_SUMMARY_QUERY,
+            partition_key=partition_key,
+            max_item_count=limit,
+            continuation=continuation,
+        )
 
     async def get_revertible_merges(
         self,
         partition_key: str,
         *,
         limit: int = 100,
+        offset: int = 0,
+        include_snapshots: bool = True,
     ) -> list[MergeOperation]:
         """
         Get merge operations that can still be reverted.
@@ -100,21 +188,65 @@ class MergeRepository(BaseRepository[MergeOperation]):
         Args:
             partition_key: Partition key for scoped query.
             limit: Maximum operations to return.
+            offset: Number of operations to skip.
+            include_snapshots: When False, skip loading original_states.
 
         Returns:
             List of revertible merge operations.
         """
-        query = """
-            SELECT * FROM c
-            WHERE c.status = @status
-            AND c.revertDeadline > @now
-            ORDER BY c.performedAt DESC
+        query = _REVERTIBLE_QUERY if include_snapshots else _REVERTIBLE_SUMMARY_QUERY
+        return await self.query(
+            query, _revertible_parameters(), partition_key, max_item_count=limit, offset=offset
+        )
+
+    async def get_revertible_merges_page(
+        self,
+        partition_key: str,
+        *,
+        limit: int = 100,
+        continuation: str | None = None,
+        include_snapshots: bool = True,
+    ) -> tuple[list[MergeOperation], str | None]:
         """
-        parameters = [
-            {"name": "@status", "value": MergeStatus.COMPLETED.value},
-            {"name": "@now", "value": datetime.now(UTC).isoformat()},
-        ]
-        return await self.query(query, parameters, partition_key, max_item_count=limit)
+        Get one page of revertible merges from a continuation token.
+
+        The revert-window cutoff is re-evaluated for each page.
+
+        Args:
+            partition_key: Partition key for scoped query.
+            limit: Page size.
+            continuation: Token from the previous page, or None for the first.
+            include_snapshots: When False, skip loading original_states.
+
+        Returns:
+            Tuple of (merges on this page, token for the next page or None).
+
+        Raises:
+            InvalidOperationError: If Cosmos rejects the continuation token.
+        """
+        query = _REVERTIBLE_QUERY if include_snapshots else _REVERTIBLE_SUMMARY_QUERY
+        return await self.query_page(
+            query,
+            _revertible_parameters(),
+            partition_key,
+            max_item_count=limit,
+            continuation=continuation,
+        )
+
+    async def count_merges(self, partition_key: str, *, revertible_only: bool = False) -> int:
+        """
+        Count merge operations with a server-side COUNT, for pagination totals.
+
+        Args:
+            partition_key: Partition key for scoped count.
+            revertible_only: Count only merges that can still be reverted.
+
+        Returns:
+            Number of matching merge operations.
+        """
+        if revertible_only:
+            return await self.count(_REVERTIBLE_WHERE, _revertible_parameters(), partition_key)
+        return await self.count(partition_key=partition_key)
 
     async def get_pending_merges(
         self,
@@ -132,9 +264,9 @@ class MergeRepository(BaseRepository[MergeOperation]):
         Returns:
             List of pending merge operations.
         """
-        query = "SELECT * FROM c WHERE c.status = @status ORDER BY c.performedAt DESC"
-        parameters = [{"name": "@status", "value": MergeStatus.PENDING.value}]
-        return await self.query(query, parameters, partition_key, max_item_count=limit)
+        return await self.query(
+            _PENDING_QUERY, _PENDING_PARAMETERS, partition_key, max_item_count=limit
+        )
 
     async def update_status(
         self,
@@ -160,18 +292,22 @@ class MergeRepository(BaseRepository[MergeOperation]):
         Returns:
             Updated merge operation or None if not found.
         """
-        merge = await self.get_by_id(merge_id, partition_key)
-        if not merge:
-            return None
-
-        merge.status = status
-
+        # Patch the status fields in place; no read of the snapshot-heavy
+        # document first.
+        operations: list[dict[str, Any]] = [
+            {"op": "set", "path": "/status", "value": status.value},
+        ]
         if status == MergeStatus.REVERTED:
-            merge.reverted_by = reverted_by
-            merge.reverted_at = reverted_at or datetime.now(UTC)
-            merge.revert_reason = revert_reason
-
-        return await self.update(merge, partition_key)
+            operations += [
+                {"op": "set", "path": "/revertedBy", "value": reverted_by},
+                {
+                    "op": "set",
+                    "path": "/revertedAt",
+                    "value": to_json_timestamp(reverted_at or utc_now()),
+                },
+                {"op": "set", "path": "/revertReason", "value": revert_reason},
+            ]
+        return await self.patch(merge_id, partition_key, operations)
 
     async def get_merged_ticket_ids(
         self,
@@ -187,34 +323,27 @@ class MergeRepository(BaseRepository[MergeOperation]):
 
         Returns:
             List of merged ticket IDs.
-        """
-        query = """
-            SELECT VALUE c.secondaryTicketIds
-            FROM c
-            WHERE c.primaryTicketId = @primary_id
-            AND c.status = @status
+
+        Raises:
+            CosmosHttpResponseError: If the query fails.
         """
         parameters: list[dict[str, object]] = [
             {"name": "@primary_id", "value": str(primary_ticket_id)},
-            {"name": "@status", "value": MergeStatus.COMPLETED.value},
+            _COMPLETED_STATUS_PARAM,
         ]
 
         try:
             items = self._container.query_items(
-                query=query,
+                query=_MERGED_IDS_QUERY,
                 parameters=parameters,
                 partition_key=partition_key,
             )
-            results = [item async for item in items]
-        except Exception:
+            raw_ids = [ticket_id async for ticket_id in items]
+        except CosmosHttpResponseError:
             logger.exception("get_merged_ticket_ids query failed for %s", primary_ticket_id)
-            return []
-        # Flatten the list of lists
-        all_ids: list[UUID] = []
-        for ticket_list in results:
-            if isinstance(ticket_list, list):
-                all_ids.extend(UUID(tid) for tid in ticket_list)
-        return all_ids
+            raise
+        # Already flat; parse every ID in a single validation
+        return _UUID_LIST_ADAPTER.validate_python(raw_ids)
 
     async def get_merge_count_by_user(
         self,
@@ -232,9 +361,7 @@ class MergeRepository(BaseRepository[MergeOperation]):
             Count of merges.
         """
         return await self.count(
-            "c.performedBy = @user_id",
-            [{"name": "@user_id", "value": user_id}],
-            partition_key,
+            _BY_USER_WHERE, [{"name": "@user_id", "value": user_id}], partition_key
         )
 
     async def check_revert_conflicts(
@@ -255,20 +382,31 @@ class MergeRepository(BaseRepository[MergeOperation]):
         merge = await self.get_by_id(merge_id, partition_key)
         if not merge:
             return []
+        return [m async for m in self.iter_revert_conflicts(merge, partition_key)]
+
+    def iter_revert_conflicts(
+        self,
+        merge: MergeOperation,
+        partition_key: str,
+    ) -> AsyncGenerator[MergeOperation, None]:
+        """
+        Stream the completed merges that would conflict with reverting a merge.
+
+        Takes the merge the caller already holds, so it is not read again,
+        and yields conflicts as they arrive instead of buffering them.
+
+        Args:
+            merge: Merge operation being checked.
+            partition_key: Partition key for scoped query.
 
-        # Find any completed merges that happened after this one
-        # involving the same primary ticket
-        query = """
-            SELECT * FROM c
-            WHERE c.primaryTicketId = @primary_id
-            AND c.status = @status
-            AND c.performedAt > @performed_at
-            AND c.id != @merge_id
+        Yields:
+            Conflicting merge operations.
         """
+        # Any completed merge after this one involving the same primary ticket
         parameters = [
             {"name": "@primary_id", "value": str(merge.primary_ticket_id)},
-            {"name": "@status", "value": MergeStatus.COMPLETED.value},
-            {"name": "@performed_at", "value": merge.performed_at.isoformat()},
-            {"name": "@merge_id", "value": str(merge_id)},
+            _COMPLETED_STATUS_PARAM,
+            {"name": "@performed_at", "value": to_json_timestamp(merge.performed_at)},
+            {"name": "@merge_id", "value": str(merge.id)},
         ]
-        return await self.query(query, parameters, partition_key)
+        return self.iter_query(_CONFLICT_QUERY, parameters, partition_key)
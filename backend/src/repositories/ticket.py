@@ -7,83 +7,106 @@ Handles ticket CRUD and queries with partition key: pk = {year-month}
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from azure.cosmos.exceptions import CosmosAccessConditionFailedError, CosmosHttpResponseError
+
+from lib.clock import to_json_timestamp, utc_now
 from models.ticket import Ticket
-from repositories.base import BaseRepository
+from repositories.base import PartitionedRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from datetime import datetime
     from uuid import UUID
 
-    from azure.cosmos.aio import ContainerProxy
-
 logger = logging.getLogger(__name__)
 
+# Queries are built once at import, as in the cluster and merge repositories.
+_BY_TICKET_NUMBER_QUERY = "SELECT * FROM c WHERE c.ticketNumber = @ticket_number"
+_TICKET_NUMBER_EXISTS_QUERY = "SELECT TOP 1 VALUE c.id FROM c WHERE c.ticketNumber = @ticket_number"
+_BY_CLUSTER_QUERY = "SELECT * FROM c WHERE c.clusterId = @cluster_id"
+# Served by the (clusterId, createdAt DESC) composite index in cosmos.setup
+_UNASSIGNED_QUERY = "SELECT * FROM c WHERE c.clusterId = null ORDER BY c.createdAt DESC"
+
 
-class TicketRepository(BaseRepository[Ticket]):
+class TicketRepository(PartitionedRepository[Ticket]):
     """Repository for ticket operations."""
 
     CONTAINER_NAME = "tickets"
+    MODEL = Ticket
 
-    def __init__(self, container: ContainerProxy) -> None:
-        """Initialize ticket repository."""
-        super().__init__(container, self.CONTAINER_NAME)
-
-    def _to_document(self, entity: Ticket) -> dict[str, Any]:
-        """Convert Ticket model to Cosmos DB document."""
-        return entity.to_cosmos_document()
+    async def get_by_ticket_number(self, ticket_number: str, partition_key: str) -> Ticket | None:
+        """
+        Get a ticket by its ticket number.
 
-    def _from_document(self, doc: dict[str, Any]) -> Ticket:
-        """Convert Cosmos DB document to Ticket model."""
-        return Ticket.from_cosmos_document(doc)
+        Args:
+            ticket_number: Unique ticket identifier.
+            partition_key: Partition key value.
 
-    @staticmethod
-    def build_partition_key(timestamp: datetime) -> str:
+        Returns:
+            Ticket if found, None otherwise.
         """
-        Build partition key from timestamp.
+        parameters: list[dict[str, Any]] = [{"name": "@ticket_number", "value": ticket_number}]
+        results = await self.query(
+            _BY_TICKET_NUMBER_QUERY, parameters, partition_key, max_item_count=1
+        )
+        return results[0] if results else None
 
-        Format: {YYYY-MM}
+    async def ticket_number_exists(self, ticket_number: str, partition_key: str) -> bool:
         """
-        return timestamp.strftime("%Y-%m")
+        Check whether a ticket number is already stored in a partition.
 
-    async def get_by_ticket_number(self, ticket_number: str, partition_key: str) -> Ticket | None:
-        """
-        Get a ticket by its ticket number.
+        Projects only the id, so the duplicate check on ingest never transfers
+        the stored document (and its embedding vector).
 
         Args:
             ticket_number: Unique ticket identifier.
             partition_key: Partition key value.
 
         Returns:
-            Ticket if found, None otherwise.
+            True if a ticket with this number exists.
         """
-        query = "SELECT * FROM c WHERE c.ticketNumber = @ticket_number"
-        parameters = [{"name": "@ticket_number", "value": ticket_number}]
-
-        results = await self.query(query, parameters, partition_key, max_item_count=1)
-        return results[0] if results else None
+        parameters: list[dict[str, Any]] = [{"name": "@ticket_number", "value": ticket_number}]
+
+        try:
+            items = self._container.query_items(
+                query=_TICKET_NUMBER_EXISTS_QUERY,
+                parameters=parameters,
+                partition_key=partition_key,
+                max_item_count=1,
+            )
+            async for _ in items:
+                return True
+        except CosmosHttpResponseError:
+            logger.exception("ticket_number_exists query failed for %s", ticket_number)
+            raise
+        return False
 
     async def get_unassigned_tickets(
         self,
         partition_key: str,
         *,
         limit: int = 100,
-        _offset_token: str | None = None,
-    ) -> list[Ticket]:
+        continuation: str | None = None,
+    ) -> tuple[list[Ticket], str | None]:
         """
-        Get tickets not yet assigned to a cluster.
+        Get one page of tickets not yet assigned to a cluster.
 
         Args:
             partition_key: Partition key for scoped query.
-            limit: Maximum tickets to return.
-            offset_token: Continuation token for pagination.
+            limit: Page size.
+            continuation: Token from the previous page, or None for the first.
 
         Returns:
-            List of unassigned tickets.
+            Tuple of (unassigned tickets, token for the next page or None).
         """
-        query = "SELECT * FROM c WHERE c.clusterId = null ORDER BY c.createdAt DESC"
-        return await self.query(query, partition_key=partition_key, max_item_count=limit)
+        return await self.query_page(
+            _UNASSIGNED_QUERY,
+            partition_key=partition_key,
+            max_item_count=limit,
+            continuation=continuation,
+        )
 
     async def get_by_cluster_id(
         self,
@@ -103,9 +126,8 @@ class TicketRepository(BaseRepository[Ticket]):
         Returns:
             List of tickets in the cluster.
         """
-        query = "SELECT * FROM c WHERE c.clusterId = @cluster_id"
         parameters = [{"name": "@cluster_id", "value": str(cluster_id)}]
-        return await self.query(query, parameters, partition_key, max_item_count=limit)
+        return await self.query(_BY_CLUSTER_QUERY, parameters, partition_key, max_item_count=limit)
 
     async def assign_to_cluster(
         self,
@@ -124,13 +146,7 @@ class TicketRepository(BaseRepository[Ticket]):
         Returns:
             Updated ticket or None if not found.
         """
-        ticket = await self.get_by_id(ticket_id, partition_key)
-        if not ticket:
-            return None
-
-        ticket.cluster_id = cluster_id
-        ticket.updated_at = datetime.now(UTC)
-        return await self.update(ticket, partition_key)
+        return await self._set_cluster_id(ticket_id, cluster_id, partition_key)
 
     async def remove_from_cluster(
         self,
@@ -147,10 +163,103 @@ class TicketRepository(BaseRepository[Ticket]):
         Returns:
             Updated ticket or None if not found.
         """
-        ticket = await self.get_by_id(ticket_id, partition_key)
-        if not ticket:
-            return None
+        return await self._set_cluster_id(ticket_id, None, partition_key)
 
-        ticket.cluster_id = None
-        ticket.updated_at = datetime.now(UTC)
-        return await self.update(ticket, partition_key)
+    async def _set_cluster_id(
+        self,
+        ticket_id: UUID,
+        cluster_id: UUID | None,
+        partition_key: str,
+    ) -> Ticket | None:
+        """
+        Patch the cluster assignment in place instead of reading and rewriting the ticket.
+
+        The predicate makes the server skip the write when the ticket already
+        holds the target assignment; that case costs a point read instead.
+        """
+        operations: list[dict[str, Any]] = [
+            {"op": "set", "path": "/clusterId", "value": str(cluster_id) if cluster_id else None},
+            {"op": "set", "path": "/updatedAt", "value": to_json_timestamp(utc_now())},
+        ]
+        # cluster_id is a UUID, so inlining it in the predicate is safe
+        if cluster_id is None:
+            filter_predicate = "FROM c WHERE IS_DEFINED(c.clusterId) AND NOT IS_NULL(c.clusterId)"
+        else:
+            filter_predicate = (
+                "FROM c WHERE NOT IS_DEFINED(c.clusterId) OR IS_NULL(c.clusterId) "
+                f'OR c.clusterId != "{cluster_id}"'
+            )
+        try:
+            return await self.patch(
+                ticket_id, partition_key, operations, filter_predicate=filter_predicate
+            )
+        except CosmosAccessConditionFailedError:
+            # Already assigned as requested: nothing to write
+            return await self.get_by_id(ticket_id, partition_key)
+
+    async def mark_merged(
+        self,
+        ticket_ids: Sequence[UUID],
+        merged_into_id: UUID,
+        partition_key: str,
+        *,
+        updated_at: datetime,
+    ) -> None:
+        """
+        Point tickets at the canonical ticket they were merged into.
+
+        Args:
+            ticket_ids: IDs of existing tickets in the partition.
+            merged_into_id: Canonical ticket ID.
+            partition_key: Partition key value.
+            updated_at: Timestamp to stamp on every ticket.
+        """
+        stamp = to_json_timestamp(updated_at)
+        await self.patch_many(
+            [
+                (
+                    ticket_id,
+                    [
+                        {"op": "set", "path": "/mergedIntoId", "value": str(merged_into_id)},
+                        {"op": "set", "path": "/updatedAt", "value": stamp},
+                    ],
+                )
+                for ticket_id in ticket_ids
+            ],
+            partition_key,
+        )
+
+    async def restore_unmerged(
+        self,
+        cluster_ids: Mapping[UUID, UUID | None],
+        partition_key: str,
+        *,
+        updated_at: datetime,
+    ) -> None:
+        """
+        Clear the merge reference on tickets and restore their cluster assignment.
+
+        Args:
+            cluster_ids: Existing ticket ID -> cluster ID to restore (None for none).
+            partition_key: Partition key value.
+            updated_at: Timestamp to stamp on every ticket.
+        """
+        stamp = to_json_timestamp(updated_at)
+        await self.patch_many(
+            [
+                (
+                    ticket_id,
+                    [
+                        {"op": "set", "path": "/mergedIntoId", "value": None},
+                        {
+                            "op": "set",
+                            "path": "/clusterId",
+                            "value": str(cluster_id) if cluster_id else None,
+                        },
+                        {"op": "set", "path": "/updatedAt", "value": stamp},
+                    ],
+                )
+                for ticket_id, cluster_id in cluster_ids.items()
+            ],
+            partition_key,
+        )
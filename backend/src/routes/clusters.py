@@ -6,10 +6,12 @@ Provides operations for viewing and managing duplicate clusters.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from dependencies import (
     ApiKeyDep,
@@ -22,12 +24,8 @@ from schemas.cluster import (
     ClusterDetail,
     ClusterDismissRequest,
     ClusterListResponse,
-    ClusterMemberResponse,
     ClusterResponse,
 )
-from schemas.cluster import (
-    ClusterStatus as SchemaClusterStatus,
-)
 from schemas.common import PaginationMeta
 
 router = APIRouter()
@@ -35,6 +33,9 @@ router = APIRouter()
 # Fields on the Cluster model that are internal-only (not exposed in API responses).
 _CLUSTER_INTERNAL_FIELDS = {"pk", "centroid_vector", "members", "etag"}
 
+# The detail view embeds members, so only the remaining internal fields are dropped.
+_CLUSTER_DETAIL_INTERNAL_FIELDS = _CLUSTER_INTERNAL_FIELDS - {"members"}
+
 
 def _cluster_to_response(c: Cluster) -> ClusterResponse:
     """Convert a Cluster model to a ClusterResponse schema.
@@ -44,12 +45,26 @@ def _cluster_to_response(c: Cluster) -> ClusterResponse:
     """
     data = c.model_dump(exclude=_CLUSTER_INTERNAL_FIELDS)
 
-    # Normalize enum from model StrEnum → schema str Enum
-    data["status"] = SchemaClusterStatus(c.status.value)
-
+    # status stays the model StrEnum (a str); validation coerces it to the
+    # schema enum by value, so no explicit Enum(value) round trip is needed.
     return ClusterResponse.model_validate(data)
 
 
+# Compiled once; a listing page converts in one dump and one validation
+_CLUSTER_LIST_ADAPTER: TypeAdapter[list[Cluster]] = TypeAdapter(list[Cluster])
+_CLUSTER_RESPONSE_LIST_ADAPTER: TypeAdapter[list[ClusterResponse]] = TypeAdapter(
+    list[ClusterResponse]
+)
+
+
+def _clusters_to_responses(clusters: list[Cluster]) -> list[ClusterResponse]:
+    """Convert a page of clusters like _cluster_to_response(), in two batched calls."""
+    data = _CLUSTER_LIST_ADAPTER.dump_python(
+        clusters, exclude={"__all__": _CLUSTER_INTERNAL_FIELDS}
+    )
+    return _CLUSTER_RESPONSE_LIST_ADAPTER.validate_python(data)
+
+
 @router.get(
     "",
     response_model=ClusterListResponse,
@@ -63,24 +78,55 @@ async def list_clusters(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     status_filter: Annotated[ClusterStatus | None, Query(alias="status")] = None,
+    continuation: Annotated[
+        str | None,
+        Query(description="continuationToken from the previous page's meta"),
+    ] = None,
 ) -> ClusterListResponse:
     """List clusters with filtering."""
     partition_key = month
-
-    if status_filter:
-        clusters = await cluster_repo.get_by_status(status_filter, partition_key, limit=page_size)
+    offset = (page - 1) * page_size
+    list_status = status_filter or ClusterStatus.PENDING
+
+    # Server-side total, fetched alongside the page
+    count_query = cluster_repo.count_by_status(list_status, partition_key)
+
+    # Listing never returns members or centroids, so don't load them. As for
+    # tickets, token-driven pages cost the same at any depth; OFFSET is only
+    # the fallback for jumping straight to a page number.
+    next_token: str | None = None
+    paged_by_token = page == 1 or continuation is not None
+    if paged_by_token:
+        (clusters, next_token), total = await asyncio.gather(
+            cluster_repo.get_by_status_page(
+                list_status,
+                partition_key,
+                limit=page_size,
+                continuation=continuation,
+                summary_only=True,
+            ),
+            count_query,
+        )
     else:
-        clusters = await cluster_repo.get_pending_clusters(partition_key, limit=page_size)
+        clusters, total = await asyncio.gather(
+            cluster_repo.get_by_status(
+                list_status, partition_key, limit=page_size, offset=offset, summary_only=True
+            ),
+            count_query,
+        )
 
-    items = [_cluster_to_response(c) for c in clusters]
+    items = _clusters_to_responses(clusters)
+    # Token pages may not start at offset; the token alone says whether more follow
+    has_more = next_token is not None if paged_by_token else (offset + len(items)) < total
 
     return ClusterListResponse(
         data=items,
         meta=PaginationMeta(
-            total=len(items),
-            offset=(page - 1) * page_size,
+            total=total,
+            offset=offset,
             limit=page_size,
-            has_more=False,
+            has_more=has_more,
+            continuation_token=next_token,
         ),
     )
 
@@ -110,15 +156,9 @@ async def get_cluster(
             detail=f"Cluster {cluster_id} not found",
         )
 
-    member_responses = [
-        ClusterMemberResponse.model_validate(m.model_dump()) for m in cluster.members
-    ]
-
-    resp = _cluster_to_response(cluster)
-    return ClusterDetail(
-        **resp.model_dump(),
-        members=member_responses,
-    )
+    # One dump and one validate, with members converted inside pydantic-core,
+    # instead of building a ClusterResponse and re-dumping it into ClusterDetail.
+    return ClusterDetail.model_validate(cluster.model_dump(exclude=_CLUSTER_DETAIL_INTERNAL_FIELDS))
 
 
 @router.post(
@@ -6,11 +6,14 @@ Provides operations for merging duplicate tickets and reverting merges.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+from contextlib import aclosing
+from datetime import UTC, timedelta
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from dependencies import (
     ApiKeyDep,
@@ -19,12 +22,10 @@ from dependencies import (
     MergeRepoDep,
     TicketRepoDep,
 )
+from lib.clock import utc_now
 from models.cluster import ClusterStatus
 from models.merge_operation import MergeBehavior, MergeOperation, MergeStatus
 from schemas.common import PaginationMeta
-from schemas.merge import (
-    MergeBehavior as SchemaMergeBehavior,
-)
 from schemas.merge import (
     MergeListResponse,
     MergeRequest,
@@ -33,9 +34,6 @@ from schemas.merge import (
     RevertConflictResponse,
     RevertRequest,
 )
-from schemas.merge import (
-    MergeStatus as SchemaMergeStatus,
-)
 
 router = APIRouter()
 
@@ -51,13 +49,22 @@ def _merge_to_response(m: MergeOperation) -> MergeResponse:
     """
     data = m.model_dump(exclude=_MERGE_INTERNAL_FIELDS)
 
-    # Normalize enums from model StrEnum → schema str Enum
-    data["merge_behavior"] = SchemaMergeBehavior(m.merge_behavior.value)
-    data["status"] = SchemaMergeStatus(m.status.value)
-
+    # merge_behavior/status stay model StrEnums (strs); validation coerces them
+    # to the schema enums by value, so no explicit Enum(value) round trip.
     return MergeResponse.model_validate(data)
 
 
+# Compiled once; a listing page converts in one dump and one validation
+_MERGE_LIST_ADAPTER: TypeAdapter[list[MergeOperation]] = TypeAdapter(list[MergeOperation])
+_MERGE_RESPONSE_LIST_ADAPTER: TypeAdapter[list[MergeResponse]] = TypeAdapter(list[MergeResponse])
+
+
+def _merges_to_responses(merges: list[MergeOperation]) -> list[MergeResponse]:
+    """Convert a page of merges like _merge_to_response(), in two batched calls."""
+    data = _MERGE_LIST_ADAPTER.dump_python(merges, exclude={"__all__": _MERGE_INTERNAL_FIELDS})
+    return _MERGE_RESPONSE_LIST_ADAPTER.validate_python(data)
+
+
 @router.post(
     "",
     response_model=MergeResponse,
@@ -86,8 +93,13 @@ async def create_merge(
     """
     partition_key = month
 
+    # The two point reads are independent; overlap them, then validate in order
+    cluster, canonical_ticket = await asyncio.gather(
+        cluster_repo.get_by_id(merge_request.cluster_id, partition_key),
+        ticket_repo.get_by_id(merge_request.primary_ticket_id, partition_key),
+    )
+
     # Validate cluster exists and is pending
-    cluster = await cluster_repo.get_by_id(merge_request.cluster_id, partition_key)
     if not cluster:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -101,24 +113,20 @@ async def create_merge(
         )
 
     # Validate canonical ticket exists and is in cluster
-    canonical_ticket = await ticket_repo.get_by_id(merge_request.primary_ticket_id, partition_key)
     if not canonical_ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Primary ticket {merge_request.primary_ticket_id} not found",
         )
 
-    if merge_request.primary_ticket_id not in cluster.ticket_ids:
+    # Membership check and merged ticket IDs (all except canonical) in one pass
+    in_cluster, merged_ticket_ids = cluster.split_on_primary(merge_request.primary_ticket_id)
+    if not in_cluster:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Primary ticket is not in the cluster",
         )
 
-    # Get merged ticket IDs (all tickets in cluster except canonical)
-    merged_ticket_ids = [
-        tid for tid in cluster.ticket_ids if tid != merge_request.primary_ticket_id
-    ]
-
     if not merged_ticket_ids:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -126,7 +134,7 @@ async def create_merge(
         )
 
     # Create merge operation
-    now = datetime.utcnow()
+    now = utc_now()
     merge = MergeOperation(
         cluster_id=merge_request.cluster_id,
         primary_ticket_id=merge_request.primary_ticket_id,
@@ -141,9 +149,10 @@ async def create_merge(
         pk=partition_key,
     )
 
-    created = await merge_repo.create(merge, partition_key)
+    # Nothing server-set to read back; respond from the model we wrote
+    created = await merge_repo.create(merge, partition_key, return_content=False)
 
-    # Update cluster status to merged
+    # Update cluster status to merged only once the merge is recorded
     await cluster_repo.update_status(
         merge_request.cluster_id,
         ClusterStatus.MERGED,
@@ -166,27 +175,56 @@ async def list_merges(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     revertible_only: Annotated[bool, Query(description="Only revertible merges")] = False,
+    continuation: Annotated[
+        str | None,
+        Query(description="continuationToken from the previous page's meta"),
+    ] = None,
 ) -> MergeListResponse:
     """List merge operations."""
     partition_key = month
-
-    if revertible_only:
-        merges = await merge_repo.get_revertible_merges(partition_key, limit=page_size)
+    offset = (page - 1) * page_size
+
+    # Server-side total, fetched alongside the page
+    count_query = merge_repo.count_merges(partition_key, revertible_only=revertible_only)
+
+    # Listing never returns ticket snapshots, so don't load them. Token-driven
+    # pages cost the same at any depth; OFFSET is only the fallback for
+    # jumping straight to a page number.
+    next_token: str | None = None
+    paged_by_token = page == 1 or continuation is not None
+    if paged_by_token:
+        if revertible_only:
+            page_query = merge_repo.get_revertible_merges_page(
+                partition_key, limit=page_size, continuation=continuation, include_snapshots=False
+            )
+        else:
+            page_query = merge_repo.get_recent_merges_page(
+                partition_key, limit=page_size, continuation=continuation
+            )
+        (merges, next_token), total = await asyncio.gather(page_query, count_query)
     else:
-        query = "SELECT * FROM c ORDER BY c.performedAt DESC"
-        merges = await merge_repo.query(
-            query, partition_key=partition_key, max_item_count=page_size
-        )
-
-    items = [_merge_to_response(m) for m in merges]
+        if revertible_only:
+            offset_query = merge_repo.get_revertible_merges(
+                partition_key, limit=page_size, offset=offset, include_snapshots=False
+            )
+        else:
+            offset_query = merge_repo.get_recent_merges(
+                partition_key, limit=page_size, offset=offset
+            )
+        merges, total = await asyncio.gather(offset_query, count_query)
+
+    items = _merges_to_responses(merges)
+    # Token pages may not start at offset; the token alone says whether more follow
+    has_more = next_token is not None if paged_by_token else (offset + len(items)) < total
 
     return MergeListResponse(
         data=items,
         meta=PaginationMeta(
-            total=len(items),
-            offset=(page - 1) * page_size,
+            total=total,
+            offset=offset,
             limit=page_size,
-            has_more=False,
+            has_more=has_more,
+            continuation_token=next_token,
         ),
     )
 
@@ -261,16 +299,22 @@ async def revert_merge(
         )
 
     # Check revert deadline
-    now = datetime.utcnow()
-    if merge.revert_deadline and now > merge.revert_deadline:
+    # Deadlines written before timestamps were tz-aware load as naive UTC
+    now = utc_now()
+    revert_deadline = merge.revert_deadline
+    if revert_deadline and revert_deadline.tzinfo is None:
+        revert_deadline = revert_deadline.replace(tzinfo=UTC)
+    if revert_deadline and now > revert_deadline:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Revert window has expired",
         )
 
-    # Check for conflicts
-    conflicts = await merge_repo.check_revert_conflicts(merge_id, partition_key)
-    if conflicts:
+    # Check for conflicts; the first one settles it, so stop reading there and
+    # close the stream rather than leaving it to the garbage collector
+    async with aclosing(merge_repo.iter_revert_conflicts(merge, partition_key)) as conflicts:
+        first_conflict = await anext(conflicts, None)
+    if first_conflict is not None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Cannot revert: conflicts with subsequent merges",
@@ -327,21 +371,22 @@ async def check_conflicts(
             detail=f"Merge {merge_id} not found",
         )
 
-    conflicts = await merge_repo.check_revert_conflicts(merge_id, partition_key)
+    # Response items are built as the conflicting merges stream in
+    conflicts = [
+        RevertConflict(
+            ticket_id=c.primary_ticket_id,
+            field="merge_status",
+            original_value=None,
+            current_value=c.status.value,
+        )
+        async for c in merge_repo.iter_revert_conflicts(merge, partition_key)
+    ]
 
     if conflicts:
         return RevertConflictResponse(
             error="CONFLICT",
             message=f"Cannot revert merge {merge_id}: conflicts with subsequent merges",
-            conflicts=[
-                RevertConflict(
-                    ticket_id=c.primary_ticket_id,
-                    field="merge_status",
-                    original_value=None,
-                    current_value=c.status.value,
-                )
-                for c in conflicts
-            ],
+            conflicts=conflicts,
         )
 
     return RevertConflictResponse(
@@ -6,10 +6,12 @@ Provides CRUD operations for support tickets with clustering integration.
 
 from __future__ import annotations
 
-from typing import Annotated
+import asyncio
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from dependencies import (
     ApiKeyDep,
@@ -29,15 +31,6 @@ from schemas.ticket import (
     TicketListResponse,
     TicketResponse,
 )
-from schemas.ticket import (
-    TicketPriority as SchemaPriority,
-)
-from schemas.ticket import (
-    TicketSeverity as SchemaSeverity,
-)
-from schemas.ticket import (
-    TicketStatus as SchemaStatus,
-)
 
 # Mapping for channel values from database to schema enum
 _CHANNEL_MAP = {
@@ -50,15 +43,6 @@ _CHANNEL_MAP = {
     "phone": SchemaChannel.PHONE,
 }
 
-# Mapping for status values from database to schema enum
-_STATUS_MAP = {
-    "open": SchemaStatus.OPEN,
-    "pending": SchemaStatus.PENDING,
-    "resolved": SchemaStatus.RESOLVED,
-    "closed": SchemaStatus.CLOSED,
-    "merged": SchemaStatus.MERGED,
-}
-
 
 def _normalize_channel(channel: str | None) -> SchemaChannel:
     """Normalize channel value to schema enum."""
@@ -68,14 +52,17 @@ def _normalize_channel(channel: str | None) -> SchemaChannel:
     return _CHANNEL_MAP.get(normalized, SchemaChannel.IN_APP)
 
 
-def _normalize_status(status_value: str) -> SchemaStatus:
-    """Normalize status value to schema enum."""
-    return _STATUS_MAP.get(status_value.lower(), SchemaStatus.OPEN)
-
-
 # Fields on the Ticket model that are internal-only (not exposed in API responses).
 _TICKET_INTERNAL_FIELDS = {"pk", "content_vector", "dedup_text", "dedup", "raw_metadata"}
 
+# The listing projects away the embedding (1536 floats), the embedding input
+# text and the raw payload; dedup stays because dedup_decision is read from it.
+_LIST_PROJECTION = ", ".join(
+    f"c.{field.alias}"
+    for name, field in Ticket.model_fields.items()
+    if name not in {"content_vector", "dedup_text", "raw_metadata"}
+)
+
 
 def _ticket_to_response(t: Ticket) -> TicketResponse:
     """Convert Ticket model to TicketResponse schema.
@@ -84,11 +71,17 @@ def _ticket_to_response(t: Ticket) -> TicketResponse:
     flow through automatically without manual mapping.
     """
     data = t.model_dump(exclude=_TICKET_INTERNAL_FIELDS)
+    _set_response_only_fields(t, data)
+    return TicketResponse.model_validate(data)
+
 
-    # Normalize enums from model values → schema enum values
-    data["status"] = _normalize_status(t.status.value)
-    data["priority"] = SchemaPriority(t.priority.value) if t.priority else None
-    data["severity"] = SchemaSeverity(t.severity) if t.severity else None
+def _set_response_only_fields(t: Ticket, data: dict[str, Any]) -> None:
+    """Fill in the fields a dumped ticket needs before TicketResponse validation."""
+    # status/priority stay model StrEnums (strs) and severity a plain str;
+    # validation coerces them to the schema enums by value, so no per-row
+    # Enum(value) constructor calls. Only channel needs real normalization.
+    if not t.severity:
+        data["severity"] = None
     data["channel"] = _normalize_channel(t.channel)
 
     # Derived field: extract decision from dedup metadata dict
@@ -96,7 +89,18 @@ def _ticket_to_response(t: Ticket) -> TicketResponse:
         t.dedup.get("decision") if t.dedup and isinstance(t.dedup, dict) else None
     )
 
-    return TicketResponse.model_validate(data)
+
+# Compiled once; a listing page converts in one dump and one validation
+_TICKET_LIST_ADAPTER: TypeAdapter[list[Ticket]] = TypeAdapter(list[Ticket])
+_TICKET_RESPONSE_LIST_ADAPTER: TypeAdapter[list[TicketResponse]] = TypeAdapter(list[TicketResponse])
+
+
+def _tickets_to_responses(tickets: list[Ticket]) -> list[TicketResponse]:
+    """Convert a page of tickets like _ticket_to_response(), in two batched calls."""
+    rows = _TICKET_LIST_ADAPTER.dump_python(tickets, exclude={"__all__": _TICKET_INTERNAL_FIELDS})
+    for t, data in zip(tickets, rows, strict=True):
+        _set_response_only_fields(t, data)
+    return _TICKET_RESPONSE_LIST_ADAPTER.validate_python(rows)
 
 
 router = APIRouter()
@@ -129,8 +133,7 @@ async def create_ticket(
     partition_key = ticket_repo.build_partition_key(created_at)
 
     # Check for existing ticket with same ticket_number
-    existing = await ticket_repo.get_by_ticket_number(ticket_data.ticket_number, partition_key)
-    if existing:
+    if await ticket_repo.ticket_number_exists(ticket_data.ticket_number, partition_key):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Ticket with ticket_number '{ticket_data.ticket_number}' already exists",
@@ -185,8 +188,10 @@ async def create_ticket(
     ticket.cluster_id = cluster.id
     ticket.dedup = dedup_meta
 
-    # Step 4: Single write — persist ticket with vector + cluster + dedup
-    created = await ticket_repo.create(ticket, partition_key)
+    # Step 4: Single write — persist ticket with vector + cluster + dedup.
+    # Tickets carry no server-set fields, so skip echoing back (and re-validating)
+    # the document we just sent, embedding included.
+    created = await ticket_repo.create(ticket, partition_key, return_content=False)
 
     return _ticket_to_response(created)
 
@@ -237,6 +242,10 @@ async def list_tickets(
         str, Query(description="Field to sort by (createdAt, priority, status)")
     ] = "createdAt",
     sort_order: Annotated[str, Query(description="Sort order (asc, desc)")] = "desc",
+    continuation: Annotated[
+        str | None,
+        Query(description="continuationToken from the previous page's meta"),
+    ] = None,
 ) -> TicketListResponse:
     """List tickets with pagination, filtering, and sorting."""
     partition_key = month
@@ -263,28 +272,50 @@ async def list_tickets(
     sort_direction = "DESC" if sort_order.lower() == "desc" else "ASC"
     order_by = f"c.{sort_by} {sort_direction}"
 
-    # Get total count for pagination
-    total = await ticket_repo.count(
-        query=where_clause,
-        parameters=parameters if parameters else None,
-        partition_key=partition_key,
-    )
-
     # Query tickets with pagination
     if where_clause:
-        query = f"SELECT * FROM c WHERE {where_clause} ORDER BY {order_by}"  # noqa: S608  # nosec B608
+        query = f"SELECT {_LIST_PROJECTION} FROM c WHERE {where_clause} ORDER BY {order_by}"  # noqa: S608  # nosec B608
     else:
-        query = f"SELECT * FROM c ORDER BY {order_by}"  # noqa: S608  # nosec B608
+        query = f"SELECT {_LIST_PROJECTION} FROM c ORDER BY {order_by}"  # noqa: S608  # nosec B608
 
-    tickets = await ticket_repo.query(
-        query,
+    # The server-side total for pagination runs alongside the page query
+    count_query = ticket_repo.count(
+        query=where_clause,
         parameters=parameters if parameters else None,
         partition_key=partition_key,
-        max_item_count=page_size,
-        offset=offset,
     )
 
-    items = [_ticket_to_response(t) for t in tickets]
+    # First pages and token-driven pages resume from a continuation token at a
+    # flat cost; OFFSET (re-reading every skipped row) is only the fallback
+    # for clients that jump straight to a page number.
+    next_token: str | None = None
+    paged_by_token = page == 1 or continuation is not None
+    if paged_by_token:
+        (tickets, next_token), total = await asyncio.gather(
+            ticket_repo.query_page(
+                query,
+                parameters=parameters if parameters else None,
+                partition_key=partition_key,
+                max_item_count=page_size,
+                continuation=continuation,
+            ),
+            count_query,
+        )
+    else:
+        tickets, total = await asyncio.gather(
+            ticket_repo.query(
+                query,
+                parameters=parameters if parameters else None,
+                partition_key=partition_key,
+                max_item_count=page_size,
+                offset=offset,
+            ),
+            count_query,
+        )
+
+    items = _tickets_to_responses(tickets)
+    # Token pages may not start at offset; the token alone says whether more follow
+    has_more = next_token is not None if paged_by_token else (offset + len(items)) < total
 
     return TicketListResponse(
         data=items,
@@ -292,6 +323,7 @@ async def list_tickets(
             total=total,
             offset=offset,
             limit=page_size,
-            has_more=(offset + len(items)) < total,
+            has_more=has_more,
+            continuation_token=next_token,
         ),
     )
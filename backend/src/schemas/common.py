@@ -6,11 +6,13 @@ Aligned with openapi.yaml components/schemas section.
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 
+from lib.clock import utc_now
+
 
 class CamelCaseModel(BaseModel):
     """Base schema with camelCase JSON aliases.
@@ -36,6 +38,9 @@ class PaginationMeta(CamelCaseModel):
     offset: int = Field(ge=0, description="Current offset")
     limit: int = Field(ge=1, le=100, description="Items per page")
     has_more: bool = Field(description="Whether more items exist")
+    continuation_token: str | None = Field(
+        default=None, description="Opaque token for fetching the next page, if supported"
+    )
 
 
 class ErrorResponse(CamelCaseModel):
@@ -51,5 +56,5 @@ class HealthResponse(CamelCaseModel):
 
     status: str = Field(default="healthy")
     version: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
     cosmos: str | None = Field(default=None, description="Cosmos DB connection status")
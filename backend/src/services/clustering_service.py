@@ -17,9 +17,9 @@ from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from azure.cosmos.exceptions import CosmosHttpResponseError
-
 from config import get_settings
+from lib.clock import to_json_timestamp
+from lib.partition import partition_key_window
 from models.cluster import (
     Cluster,
     ClusterMember,
@@ -34,14 +34,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Maximum retries for ETag conflict during centroid update
-_MAX_ETAG_RETRIES = 3
-
 _DECISION_REASON_NO_CANDIDATES = "no_candidates"
 _DECISION_REASON_ABOVE_AUTO_THRESHOLD = "above_auto_threshold"
 _DECISION_REASON_REVIEW_BAND = "review_band"
 _DECISION_REASON_BELOW_REVIEW_THRESHOLD = "below_review_threshold"
 
+# (decision, decision_reason) per tier, built once and unpacked per candidate
+_TIER_AUTO = ("auto", _DECISION_REASON_ABOVE_AUTO_THRESHOLD)
+_TIER_REVIEW = ("review", _DECISION_REASON_REVIEW_BAND)
+_TIER_NEW_CLUSTER = ("new_cluster", _DECISION_REASON_BELOW_REVIEW_THRESHOLD)
+
 
 def _compute_confidence_score(
     *,
@@ -103,12 +105,7 @@ def _generate_partition_keys(reference: datetime, months: int) -> list[str]:
     Returns:
         List of YYYY-MM strings, newest first.
     """
-    keys: list[str] = []
-    dt = reference.replace(day=1)
-    for _ in range(months):
-        keys.append(dt.strftime("%Y-%m"))
-        dt = (dt - timedelta(days=1)).replace(day=1)
-    return keys
+    return list(partition_key_window(reference.year, reference.month, months))
 
 
 def _update_centroid(
@@ -119,7 +116,8 @@ def _update_centroid(
     """
     Incrementally update centroid vector.
 
-    new_centroid[i] = (old_centroid[i] * n + new_vector[i]) / (n + 1)
+    Uses the Welford running-mean form with the weight computed once:
+    new_centroid[i] = old_centroid[i] + (new_vector[i] - old_centroid[i]) / (n + 1)
 
     Args:
         old_centroid: Current centroid.
@@ -129,7 +127,8 @@ def _update_centroid(
     Returns:
         Updated centroid vector.
     """
-    return [(old * n + new) / (n + 1) for old, new in zip(old_centroid, new_vector, strict=True)]
+    weight = 1.0 / (n + 1)
+    return [old + (new - old) * weight for old, new in zip(old_centroid, new_vector, strict=True)]
 
 
 class ClusteringService:
@@ -184,8 +183,11 @@ class ClusteringService:
             settings.cluster_search_months,
         )
 
-        # Time window lower bound
-        min_updated = (ticket.created_at - timedelta(days=settings.dedup_window_days)).isoformat()
+        # Time window lower bound, in the stored format so the string range
+        # comparison on updatedAt is exact
+        min_updated = to_json_timestamp(
+            ticket.created_at - timedelta(days=settings.dedup_window_days)
+        )
 
         # Step 1: Vector search for cluster candidates (excludes full clusters)
         candidates = await self._cluster_repo.find_cluster_candidates(
@@ -318,6 +320,19 @@ class ClusteringService:
         settings = get_settings()
         scored: list[tuple[dict[str, Any], float, str, str, dict[str, Any]]] = []
 
+        # Loop invariants: bind weights/thresholds once and normalize the
+        # ticket timestamp once instead of per candidate.
+        w_semantic = settings.dedup_weight_semantic
+        w_subcategory = settings.dedup_weight_subcategory
+        w_category = settings.dedup_weight_category
+        w_time = settings.dedup_weight_time
+        auto_threshold = settings.cluster_auto_threshold
+        review_threshold = settings.cluster_review_threshold
+        ticket_created = ticket.created_at
+        if ticket_created.tzinfo is None:
+            ticket_created = ticket_created.replace(tzinfo=UTC)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         for cand in candidates:
             semantic = cand.get("similarityScore", 0.0)
 
@@ -331,10 +346,10 @@ class ClusteringService:
             try:
                 cluster_updated = datetime.fromisoformat(updated_str)
             except (ValueError, TypeError):
-                cluster_updated = ticket.created_at
+                cluster_updated = ticket_created
 
             time_prox = _compute_time_proximity(
-                ticket.created_at,
+                ticket_created,
                 cluster_updated,
                 window_days,
             )
@@ -344,33 +359,31 @@ class ClusteringService:
                 subcategory_match=subcategory_match,
                 category_match=category_match,
                 time_proximity=time_prox,
-                w_semantic=settings.dedup_weight_semantic,
-                w_subcategory=settings.dedup_weight_subcategory,
-                w_category=settings.dedup_weight_category,
-                w_time=settings.dedup_weight_time,
+                w_semantic=w_semantic,
+                w_subcategory=w_subcategory,
+                w_category=w_category,
+                w_time=w_time,
             )
 
-            logger.debug(
-                "Candidate cluster %s: semantic=%.4f subcategory_match=%s "
-                "category_match=%s time_proximity=%.4f => confidence=%.4f",
-                cand.get("id"),
-                semantic,
-                subcategory_match,
-                category_match,
-                time_prox,
-                score,
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Candidate cluster %s: semantic=%.4f subcategory_match=%s "
+                    "category_match=%s time_proximity=%.4f => confidence=%.4f",
+                    cand.get("id"),
+                    semantic,
+                    subcategory_match,
+                    category_match,
+                    time_prox,
+                    score,
+                )
 
             # Three-tier decision
-            if score >= settings.cluster_auto_threshold:
-                decision = "auto"
-                decision_reason = _DECISION_REASON_ABOVE_AUTO_THRESHOLD
-            elif score >= settings.cluster_review_threshold:
-                decision = "review"
-                decision_reason = _DECISION_REASON_REVIEW_BAND
+            if score >= auto_threshold:
+                decision, decision_reason = _TIER_AUTO
+            elif score >= review_threshold:
+                decision, decision_reason = _TIER_REVIEW
             else:
-                decision = "new_cluster"
-                decision_reason = _DECISION_REASON_BELOW_REVIEW_THRESHOLD
+                decision, decision_reason = _TIER_NEW_CLUSTER
 
             signal_breakdown = {
                 "semanticScore": semantic,
@@ -401,8 +414,8 @@ class ClusteringService:
                 best_signals["subcategoryMatch"],
                 best_signals["categoryMatch"],
                 best_signals["timeProximity"],
-                settings.cluster_auto_threshold,
-                settings.cluster_review_threshold,
+                auto_threshold,
+                review_threshold,
             )
 
         return scored
@@ -415,7 +428,9 @@ class ClusteringService:
         decision_context: dict[str, Any] | None = None,
     ) -> tuple[Cluster, dict[str, Any]]:
         """Create a new CANDIDATE cluster with a single ticket."""
-        member = ClusterMember(
+        # Every field comes from the already-validated ticket (same types and
+        # summary limit), so skip re-validating the member.
+        member = ClusterMember.model_construct(
             ticket_id=ticket.id,
             ticket_number=ticket.ticket_number,
             summary=ticket.summary,
@@ -425,7 +440,7 @@ class ClusteringService:
             confidence_score=None,
         )
 
-        is_open = ticket.status.value in get_settings().dedup_open_statuses
+        is_open = ticket.status in get_settings().dedup_open_statuses
 
         cluster = Cluster(
             id=uuid4(),
@@ -443,7 +458,8 @@ class ClusteringService:
         )
 
         logger.info("Creating CANDIDATE cluster %s for ticket %s", cluster.id, ticket.id)
-        created = await self._cluster_repo.create(cluster, partition_key)
+        # ETag comes from the response headers; the centroid isn't echoed back
+        created = await self._cluster_repo.create(cluster, partition_key, return_content=False)
 
         # Assign ticket to cluster
         await self._ticket_repo.assign_to_cluster(ticket.id, created.id, partition_key)
@@ -489,13 +505,9 @@ class ClusteringService:
         cluster_id = UUID(candidate["id"])
         cluster_pk = candidate["pk"]
 
-        cluster = await self._cluster_repo.get_by_id(cluster_id, cluster_pk)
-        if not cluster:
-            msg = f"Cluster {cluster_id} not found during add"
-            raise ValueError(msg)
+        is_open = ticket.status in get_settings().dedup_open_statuses
 
-        # Update centroid with ETag retry loop
-        for attempt in range(_MAX_ETAG_RETRIES):
+        def add_with_centroid(cluster: Cluster) -> None:
             # Add member
             cluster.add_member(
                 ticket.id,
@@ -519,7 +531,6 @@ class ClusteringService:
                 cluster.centroid_vector = embedding
 
             # Update open count
-            is_open = ticket.status.value in get_settings().dedup_open_statuses
             if is_open:
                 cluster.open_count += 1
 
@@ -528,25 +539,13 @@ class ClusteringService:
                 cluster.status = ClusterStatus.PENDING
                 logger.info("Promoting cluster %s from CANDIDATE to PENDING", cluster_id)
 
-            try:
-                cluster = await self._cluster_repo.update_cluster_with_etag(
-                    cluster,
-                )
-                break
-            except CosmosHttpResponseError as exc:
-                if exc.status_code == 412 and attempt < _MAX_ETAG_RETRIES - 1:
-                    logger.warning(
-                        "ETag conflict on cluster %s (attempt %d), retrying",
-                        cluster_id,
-                        attempt + 1,
-                    )
-                    # Re-fetch to get fresh ETag
-                    cluster = await self._cluster_repo.get_by_id(cluster_id, cluster_pk)
-                    if not cluster:
-                        msg = f"Cluster {cluster_id} disappeared during retry"
-                        raise ValueError(msg) from exc
-                else:
-                    raise
+        # Applied to the latest copy under its ETag; re-applied on conflict
+        cluster = await self._cluster_repo.update_with_retry(
+            cluster_id, cluster_pk, add_with_centroid
+        )
+        if not cluster:
+            msg = f"Cluster {cluster_id} not found during add"
+            raise ValueError(msg)
 
         # Assign ticket to cluster
         await self._ticket_repo.assign_to_cluster(ticket.id, cluster.id, ticket_partition_key)
@@ -624,7 +623,7 @@ class ClusteringService:
         if not cluster:
             raise ValueError(f"Cluster {cluster_id} not found")
 
-        if ticket_id not in cluster.ticket_ids:
+        if not cluster.has_member(ticket_id):
             raise ValueError(f"Ticket {ticket_id} is not in cluster {cluster_id}")
 
         if cluster.status not in (ClusterStatus.PENDING, ClusterStatus.CANDIDATE):
@@ -633,16 +632,19 @@ class ClusteringService:
         logger.info("Removing ticket %s from cluster %s", ticket_id, cluster_id)
 
         # Remove ticket from cluster
+        # Reuse the cluster read above; the repository's guarded patch makes
+        # this a single round trip unless membership changed in between.
         updated_cluster = await self._cluster_repo.remove_ticket(
             cluster_id,
             ticket_id,
             partition_key,
+            current=cluster,
         )
         if not updated_cluster:
             msg = "Failed to remove ticket from cluster"
             raise ValueError(msg)
 
-        # Update ticket
+        # Clear the ticket's assignment only once the cluster no longer lists it
         await self._ticket_repo.remove_from_cluster(ticket_id, partition_key)
 
         # Demote to CANDIDATE if only 1 member remains
@@ -19,8 +19,10 @@ from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+from lib.clock import utc_now
 from models.cluster import ClusterStatus
 from models.merge_operation import MergeOperation, MergeStatus, TicketSnapshot
+from models.ticket import TicketStatus
 
 if TYPE_CHECKING:
     from repositories.cluster import ClusterRepository
@@ -30,6 +32,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Statuses that count toward a cluster's open_count. StrEnum members hash and
+# compare as their str values, so membership needs no per-ticket .value lookup.
+_OPEN_STATUSES = frozenset({TicketStatus.OPEN, TicketStatus.PENDING})
+
+# Ticket fields captured for revert; the JSON-mode dump stringifies UUIDs and
+# datetimes and keeps explicit nulls, matching the camelCase snapshot keys.
+_SNAPSHOT_FIELDS = {"cluster_id", "merged_into_id", "updated_at"}
+
 
 class MergeConflictError(Exception):
     """Raised when merge or revert has conflicts."""
@@ -132,13 +142,11 @@ class MergeService:
         if cluster.status != ClusterStatus.PENDING:
             raise ValueError(f"Cluster status is {cluster.status.value}, expected pending")
 
-        # Validate canonical ticket is in cluster
-        if canonical_ticket_id not in cluster.ticket_ids:
+        # Validate canonical ticket is in cluster and collect the rest in one pass
+        in_cluster, merged_ticket_ids = cluster.split_on_primary(canonical_ticket_id)
+        if not in_cluster:
             raise ValueError("Canonical ticket is not in the cluster")
 
-        # Get merged ticket IDs (all except canonical)
-        merged_ticket_ids = [tid for tid in cluster.ticket_ids if tid != canonical_ticket_id]
-
         if not merged_ticket_ids:
             raise ValueError("No tickets to merge")
 
@@ -149,7 +157,7 @@ class MergeService:
         )
 
         # Create merge operation
-        now = datetime.now(UTC)
+        now = utc_now()
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=cluster_id,
@@ -163,8 +171,10 @@ class MergeService:
             pk=partition_key,
         )
 
-        # Save merge operation
-        created_merge = await self._merge_repo.create(merge, partition_key)
+        # Save merge operation; the snapshots we just sent needn't be echoed back.
+        # The cluster is only marked merged once the record exists, so a failed
+        # write leaves it pending.
+        created_merge = await self._merge_repo.create(merge, partition_key, return_content=False)
 
         # Update cluster status
         await self._cluster_repo.update_status(
@@ -175,21 +185,27 @@ class MergeService:
 
         # Update merged tickets to reference canonical and adjust open_count
         open_count_delta = 0
+        merged_ids: list[UUID] = []
+        tickets = await self._ticket_repo.get_many(merged_ticket_ids, partition_key)
         for ticket_id in merged_ticket_ids:
-            ticket = await self._ticket_repo.get_by_id(ticket_id, partition_key)
+            ticket = tickets.get(ticket_id)
             if ticket:
-                if ticket.status.value in ("open", "pending"):
+                if ticket.status in _OPEN_STATUSES:
                     open_count_delta -= 1
-                ticket.merged_into_id = canonical_ticket_id
-                ticket.updated_at = now
-                await self._ticket_repo.update(ticket, partition_key)
+                merged_ids.append(ticket.id)
+        # All tickets share the merge's partition: patch just the merge
+        # reference in batches rather than rewriting each whole document
+        if merged_ids:
+            await self._ticket_repo.mark_merged(
+                merged_ids, canonical_ticket_id, partition_key, updated_at=now
+            )
 
         # Decrement cluster open_count for merged tickets
         if open_count_delta:
             refreshed = await self._cluster_repo.get_by_id(cluster_id, partition_key)
             if refreshed:
                 refreshed.open_count = max(0, refreshed.open_count + open_count_delta)
-                await self._cluster_repo.update(refreshed, partition_key)
+                await self._cluster_repo.update(refreshed, partition_key, return_content=False)
 
         logger.info(
             "Merge %s completed: %d tickets merged into %s",
@@ -208,21 +224,16 @@ class MergeService:
         """Capture current state of tickets for potential revert."""
         snapshots: list[TicketSnapshot] = []
 
+        tickets = await self._ticket_repo.get_many(ticket_ids, partition_key)
         for ticket_id in ticket_ids:
-            ticket = await self._ticket_repo.get_by_id(ticket_id, partition_key)
+            ticket = tickets.get(ticket_id)
             if ticket:
                 snapshots.append(
                     TicketSnapshot(
                         ticket_id=ticket_id,
-                        snapshot={
-                            "clusterId": str(ticket.cluster_id) if ticket.cluster_id else None,
-                            "mergedIntoId": (
-                                str(ticket.merged_into_id) if ticket.merged_into_id else None
-                            ),
-                            "updatedAt": (
-                                ticket.updated_at.isoformat() if ticket.updated_at else None
-                            ),
-                        },
+                        snapshot=ticket.model_dump(
+                            mode="json", by_alias=True, include=_SNAPSHOT_FIELDS
+                        ),
                     )
                 )
 
@@ -270,7 +281,7 @@ class MergeService:
             raise MergeAlreadyRevertedError("Merge is already reverted")
 
         # Check revert window
-        now = datetime.now(UTC)
+        now = utc_now()
         revert_deadline = merge.revert_deadline
         if revert_deadline and revert_deadline.tzinfo is None:
             revert_deadline = revert_deadline.replace(tzinfo=UTC)
@@ -286,7 +297,7 @@ class MergeService:
             )
 
         # Restore tickets to original state
-        await self._restore_ticket_states(merge, partition_key)
+        await self._restore_ticket_states(merge, partition_key, now)
 
         # Update merge status
         updated_merge = await self._merge_repo.update_status(
@@ -298,18 +309,20 @@ class MergeService:
             revert_reason=reason,
         )
 
-        # Restore cluster to pending status and recalculate open_count
-        await self._cluster_repo.update_status(
-            merge.cluster_id,
-            ClusterStatus.PENDING,
-            partition_key,
-        )
+        # Restore cluster to pending status once the merge is marked reverted
+        if updated_merge is not None:
+            await self._cluster_repo.update_status(
+                merge.cluster_id,
+                ClusterStatus.PENDING,
+                partition_key,
+            )
 
         # Increment open_count for reverted tickets that are open
         open_count_delta = 0
+        tickets = await self._ticket_repo.get_many(merge.secondary_ticket_ids, partition_key)
         for ticket_id in merge.secondary_ticket_ids:
-            ticket = await self._ticket_repo.get_by_id(ticket_id, partition_key)
-            if ticket and ticket.status.value in ("open", "pending"):
+            ticket = tickets.get(ticket_id)
+            if ticket and ticket.status in _OPEN_STATUSES:
                 open_count_delta += 1
 
         if open_count_delta:
@@ -319,7 +332,7 @@ class MergeService:
             )
             if refreshed:
                 refreshed.open_count += open_count_delta
-                await self._cluster_repo.update(refreshed, partition_key)
+                await self._cluster_repo.update(refreshed, partition_key, return_content=False)
 
         logger.info("Merge %s reverted successfully", merge_id)
         return updated_merge or merge
@@ -330,41 +343,35 @@ class MergeService:
         partition_key: str,
     ) -> list[dict[str, Any]]:
         """Check for conflicts that would prevent clean revert."""
-        conflicts: list[dict[str, Any]] = []
-
-        # Check for subsequent merges involving the canonical ticket
-        subsequent_merges = await self._merge_repo.check_revert_conflicts(
-            merge.id,
-            partition_key,
-        )
-
-        for subsequent in subsequent_merges:
-            conflicts.append(
-                {
-                    "type": "subsequent_merge",
-                    "merge_id": str(subsequent.id),
-                    "merged_at": subsequent.performed_at.isoformat(),
-                }
-            )
+        # Subsequent merges involving the canonical ticket, built as they stream in
+        conflicts: list[dict[str, Any]] = [
+            {
+                "type": "subsequent_merge",
+                "merge_id": str(subsequent.id),
+                "merged_at": subsequent.performed_at.isoformat(),
+            }
+            async for subsequent in self._merge_repo.iter_revert_conflicts(merge, partition_key)
+        ]
 
         # Check if any merged tickets have been modified
+        # Normalize to aware UTC for safe comparison
+        performed_at = merge.performed_at
+        if performed_at.tzinfo is None:
+            performed_at = performed_at.replace(tzinfo=UTC)
+        tickets = await self._ticket_repo.get_many(merge.secondary_ticket_ids, partition_key)
         for ticket_id in merge.secondary_ticket_ids:
-            ticket = await self._ticket_repo.get_by_id(ticket_id, partition_key)
+            ticket = tickets.get(ticket_id)
             if ticket:
                 original_state = merge.get_snapshot(ticket_id) or {}
                 original_updated = original_state.get("updatedAt")
 
                 if ticket.updated_at and original_updated:
                     original_dt = datetime.fromisoformat(original_updated)
-                    # Normalize to aware UTC for safe comparison
                     if original_dt.tzinfo is None:
                         original_dt = original_dt.replace(tzinfo=UTC)
                     updated_at = ticket.updated_at
                     if updated_at.tzinfo is None:
                         updated_at = updated_at.replace(tzinfo=UTC)
-                    performed_at = merge.performed_at
-                    if performed_at.tzinfo is None:
-                        performed_at = performed_at.replace(tzinfo=UTC)
                     if updated_at > original_dt and updated_at > performed_at:
                         conflicts.append(
                             {
@@ -380,22 +387,20 @@ class MergeService:
         self,
         merge: MergeOperation,
         partition_key: str,
+        now: datetime,
     ) -> None:
-        """Restore tickets to their pre-merge state."""
-        now = datetime.now(UTC)
-
+        """Restore tickets to their pre-merge state, stamping them with the revert time."""
+        restored: dict[UUID, UUID | None] = {}
+        tickets = await self._ticket_repo.get_many(merge.secondary_ticket_ids, partition_key)
         for ticket_id in merge.secondary_ticket_ids:
-            ticket = await self._ticket_repo.get_by_id(ticket_id, partition_key)
-            if ticket:
+            if ticket_id in tickets:
                 # Restore cluster assignment
                 original_state = merge.get_snapshot(ticket_id) or {}
                 original_cluster_id = original_state.get("clusterId")
+                restored[ticket_id] = UUID(original_cluster_id) if original_cluster_id else None
 
-                ticket.merged_into_id = None
-                ticket.cluster_id = UUID(original_cluster_id) if original_cluster_id else None
-                ticket.updated_at = now
-
-                await self._ticket_repo.update(ticket, partition_key)
+        if restored:
+            await self._ticket_repo.restore_unmerged(restored, partition_key, updated_at=now)
 
     async def get_merge_history(
         self,
@@ -436,7 +441,7 @@ class MergeService:
         if merge.status == MergeStatus.REVERTED:
             return {"eligible": False, "reason": "Already reverted"}
 
-        now = datetime.now(UTC)
+        now = utc_now()
         revert_deadline = merge.revert_deadline
         if revert_deadline and revert_deadline.tzinfo is None:
             revert_deadline = revert_deadline.replace(tzinfo=UTC)
@@ -19,6 +19,7 @@ from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
 from config import Settings
+from repositories.cluster import clear_pending_count_cache
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
@@ -36,6 +37,12 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def _clear_pending_count_cache() -> None:
+    """Start every test without pending counts cached by an earlier one."""
+    clear_pending_count_cache()
+
+
 # =============================================================================
 # Settings Fixtures
 # =============================================================================
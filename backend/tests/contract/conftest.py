@@ -7,9 +7,9 @@ All contract tests validate HTTP response structure against the actual API imple
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -37,6 +37,11 @@ REVERTED_MERGE_ID = uuid4()
 NOW = datetime(2025, 1, 15, 10, 0, 0)
 
 
+async def _async_iter(items: list[Any]) -> AsyncGenerator[Any, None]:
+    for item in items:
+        yield item
+
+
 def _build_test_cluster(
     cluster_id: UUID = CLUSTER_ID,
     status: ClusterStatus = ClusterStatus.PENDING,
@@ -89,7 +94,7 @@ def _build_test_merge(
         performed_by="test-user",
         performed_at=NOW,
         status=status,
-        revert_deadline=datetime.utcnow() + timedelta(hours=24),
+        revert_deadline=datetime.now(UTC) + timedelta(hours=24),
     )
     if status == MergeStatus.REVERTED:
         m.reverted_at = NOW
@@ -136,10 +141,12 @@ def _make_cluster_repo() -> AsyncMock:
 
     repo.get_pending_clusters = AsyncMock(return_value=[cluster])
     repo.get_by_status = AsyncMock(return_value=[cluster])
+    repo.get_by_status_page = AsyncMock(return_value=([cluster], "next-token"))
     repo.get_by_id = AsyncMock(side_effect=_get_by_id)
     repo.update_status = AsyncMock(side_effect=_update_status)
     repo.remove_ticket = AsyncMock(side_effect=_remove_ticket)
     repo.get_pending_review_count = AsyncMock(return_value=5)
+    repo.count_by_status = AsyncMock(return_value=3)
     return repo
 
 
@@ -170,7 +177,7 @@ def _make_merge_repo() -> AsyncMock:
             return _build_test_merge(merge_id=REVERTED_MERGE_ID, status=MergeStatus.REVERTED)
         return None
 
-    async def _create(entity: MergeOperation, partition_key: str) -> MergeOperation:
+    async def _create(entity: MergeOperation, partition_key: str, **_: Any) -> MergeOperation:
         return entity
 
     async def _update_status(
@@ -184,11 +191,16 @@ def _make_merge_repo() -> AsyncMock:
         return None
 
     repo.get_revertible_merges = AsyncMock(return_value=[merge])
+    repo.get_recent_merges = AsyncMock(return_value=[merge])
+    repo.get_revertible_merges_page = AsyncMock(return_value=([merge], "next-token"))
+    repo.get_recent_merges_page = AsyncMock(return_value=([merge], "next-token"))
+    repo.count_merges = AsyncMock(return_value=3)
     repo.query = AsyncMock(return_value=[merge])
     repo.get_by_id = AsyncMock(side_effect=_get_by_id)
     repo.create = AsyncMock(side_effect=_create)
     repo.update_status = AsyncMock(side_effect=_update_status)
     repo.check_revert_conflicts = AsyncMock(return_value=[])
+    repo.iter_revert_conflicts = MagicMock(side_effect=lambda *_: _async_iter([]))
     return repo
 
 
@@ -198,7 +210,21 @@ def _make_merge_repo() -> AsyncMock:
 
 
 @pytest.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
+def mock_cluster_repo() -> AsyncMock:
+    """Cluster repository mock behind client, for per-test overrides."""
+    return _make_cluster_repo()
+
+
+@pytest.fixture
+def mock_merge_repo() -> AsyncMock:
+    """Merge repository mock behind client, for per-test overrides."""
+    return _make_merge_repo()
+
+
+@pytest.fixture
+async def client(
+    mock_cluster_repo: AsyncMock, mock_merge_repo: AsyncMock
+) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client with mocked deps via FastAPI overrides."""
     import os  # noqa: PLC0415
 
@@ -244,8 +270,6 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
         log_level="DEBUG",
     )
 
-    mock_cluster_repo = _make_cluster_repo()
-    mock_merge_repo = _make_merge_repo()
     mock_ticket_repo = _make_ticket_repo()
 
     with (
@@ -9,11 +9,14 @@ Tests focus on:
 - Pagination structure
 """
 
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
 
+from exceptions import InvalidOperationError
+
 MONTH = "2025-01"
 
 
@@ -37,6 +40,9 @@ class TestClustersAPIContract:
         assert "total" in meta
         assert "offset" in meta
         assert "limit" in meta
+        # Total comes from the server-side count, not the page length
+        assert meta["total"] == 3
+        assert meta["hasMore"] is True
         assert "hasMore" in meta
 
     @pytest.mark.asyncio
@@ -88,6 +94,49 @@ class TestClustersAPIContract:
         assert data["meta"]["limit"] == 5
         assert len(data["data"]) <= 5
 
+    @pytest.mark.asyncio
+    async def test_list_clusters_returns_continuation_token(self, client: AsyncClient) -> None:
+        """First pages come from a continuation-token query and return the next token."""
+        response = await client.get("/api/v1/clusters", params={"month": MONTH})
+        assert response.json()["meta"]["continuationToken"] == "next-token"
+
+    @pytest.mark.asyncio
+    async def test_list_clusters_last_token_page_has_no_more(
+        self, client: AsyncClient, mock_cluster_repo: AsyncMock
+    ) -> None:
+        """A short last token page reports no more, whatever the total count."""
+        page, _ = mock_cluster_repo.get_by_status_page.return_value
+        mock_cluster_repo.get_by_status_page.return_value = (page, None)
+        mock_cluster_repo.count_by_status.return_value = 5
+        response = await client.get(
+            "/api/v1/clusters", params={"month": MONTH, "page": 2, "continuation": "t1"}
+        )
+        meta = response.json()["meta"]
+        assert meta["continuationToken"] is None
+        assert meta["hasMore"] is False
+
+    @pytest.mark.asyncio
+    async def test_list_clusters_rejects_bad_continuation(
+        self, client: AsyncClient, mock_cluster_repo: AsyncMock
+    ) -> None:
+        """A token Cosmos rejects is the client's error (400), not an outage (503)."""
+        mock_cluster_repo.get_by_status_page.side_effect = InvalidOperationError(
+            "Invalid continuation token"
+        )
+        response = await client.get(
+            "/api/v1/clusters", params={"month": MONTH, "page": 2, "continuation": "garbage"}
+        )
+        assert response.status_code == 400
+        assert response.json()["error"] == "INVALID_OPERATION"
+
+    @pytest.mark.asyncio
+    async def test_list_clusters_deep_page_without_token_uses_offset(
+        self, client: AsyncClient
+    ) -> None:
+        response = await client.get("/api/v1/clusters", params={"month": MONTH, "page": 3})
+        assert response.status_code == 200
+        assert response.json()["meta"]["continuationToken"] is None
+
 
 class TestClusterDetailAPIContract:
     """Contract tests for GET /api/v1/clusters/{id} endpoint."""
@@ -112,6 +161,11 @@ class TestClusterDetailAPIContract:
         assert "ticketCount" in data
         assert "createdAt" in data
         assert "members" in data
+        assert data["members"]
+        member = data["members"][0]
+        assert "ticketId" in member
+        assert "ticketNumber" in member
+        assert "addedAt" in member
 
     @pytest.mark.asyncio
     async def test_get_cluster_not_found(self, client: AsyncClient) -> None:
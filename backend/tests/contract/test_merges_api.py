@@ -9,11 +9,16 @@ Tests focus on:
 - Revert functionality
 """
 
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
 
+from exceptions import InvalidOperationError
+
 MONTH = "2025-01"
 
 
@@ -78,6 +83,44 @@ class TestMergesAPIContract:
         data = response.json()
         assert isinstance(data["data"], list)
 
+    @pytest.mark.asyncio
+    async def test_list_merges_resumes_from_continuation(self, client: AsyncClient) -> None:
+        """A continuation token is honoured and the next one returned."""
+        response = await client.get(
+            "/api/v1/merges", params={"month": MONTH, "page": 2, "continuation": "t1"}
+        )
+        assert response.status_code == 200
+        assert response.json()["meta"]["continuationToken"] == "next-token"
+
+    @pytest.mark.asyncio
+    async def test_list_merges_rejects_bad_continuation(
+        self, client: AsyncClient, mock_merge_repo: AsyncMock
+    ) -> None:
+        """A token Cosmos rejects is the client's error (400), not an outage (503)."""
+        mock_merge_repo.get_recent_merges_page.side_effect = InvalidOperationError(
+            "Invalid continuation token"
+        )
+        response = await client.get(
+            "/api/v1/merges", params={"month": MONTH, "page": 2, "continuation": "garbage"}
+        )
+        assert response.status_code == 400
+        assert response.json()["error"] == "INVALID_OPERATION"
+
+    @pytest.mark.asyncio
+    async def test_list_merges_last_token_page_has_no_more(
+        self, client: AsyncClient, mock_merge_repo: AsyncMock
+    ) -> None:
+        """A short last token page reports no more, whatever the total count."""
+        page, _ = mock_merge_repo.get_recent_merges_page.return_value
+        mock_merge_repo.get_recent_merges_page.return_value = (page, None)
+        mock_merge_repo.count_merges.return_value = 5
+        response = await client.get(
+            "/api/v1/merges", params={"month": MONTH, "page": 2, "continuation": "t1"}
+        )
+        meta = response.json()["meta"]
+        assert meta["continuationToken"] is None
+        assert meta["hasMore"] is False
+
 
 class TestMergeDetailAPIContract:
     """Contract tests for GET /api/v1/merges/{id} endpoint."""
@@ -177,6 +220,29 @@ class TestMergeCreateAPIContract:
         assert "status" in data
         assert data["status"] == "completed"
 
+    @pytest.mark.asyncio
+    async def test_create_merge_failure_leaves_cluster_status(
+        self,
+        client: AsyncClient,
+        mock_merge_repo: AsyncMock,
+        mock_cluster_repo: AsyncMock,
+        created_cluster_id: str,
+        created_ticket_ids: list[str],
+    ) -> None:
+        """The cluster is not marked merged when the merge record fails to write."""
+        mock_merge_repo.create.side_effect = RuntimeError("write failed")
+        with pytest.raises(RuntimeError):
+            await client.post(
+                "/api/v1/merges",
+                params={"month": MONTH},
+                json={
+                    "clusterId": created_cluster_id,
+                    "primaryTicketId": created_ticket_ids[0],
+                    "mergeBehavior": "keep_latest",
+                },
+            )
+        mock_cluster_repo.update_status.assert_not_awaited()
+
 
 class TestMergeRevertAPIContract:
     """Contract tests for POST /api/v1/merges/{id}/revert endpoint."""
@@ -222,6 +288,50 @@ class TestMergeRevertAPIContract:
         assert "id" in data
         assert data["status"] == "reverted"
 
+    @pytest.mark.asyncio
+    async def test_revert_conflict_closes_conflict_stream(
+        self, client: AsyncClient, mock_merge_repo: AsyncMock, created_merge_id: str
+    ) -> None:
+        """The conflict stream is closed once the first conflict is read."""
+        closed = []
+
+        async def conflicts(*_: Any) -> AsyncGenerator[str, None]:
+            try:
+                yield "first"
+                yield "second"
+            finally:
+                closed.append(True)
+
+        mock_merge_repo.iter_revert_conflicts.side_effect = conflicts
+        response = await client.post(
+            f"/api/v1/merges/{created_merge_id}/revert",
+            params={"month": MONTH},
+            json={"reason": "testing revert"},
+        )
+
+        assert response.status_code == 409
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_revert_failure_leaves_cluster_status(
+        self,
+        client: AsyncClient,
+        mock_merge_repo: AsyncMock,
+        mock_cluster_repo: AsyncMock,
+        created_merge_id: str,
+    ) -> None:
+        """The cluster is not reopened when the merge cannot be marked reverted."""
+        mock_merge_repo.update_status.side_effect = None
+        mock_merge_repo.update_status.return_value = None
+        response = await client.post(
+            f"/api/v1/merges/{created_merge_id}/revert",
+            params={"month": MONTH},
+            json={"reason": "testing revert"},
+        )
+
+        assert response.status_code == 500
+        mock_cluster_repo.update_status.assert_not_awaited()
+
 
 class TestMergeConflictCheckAPIContract:
     """Contract tests for GET /api/v1/merges/{id}/conflicts endpoint."""
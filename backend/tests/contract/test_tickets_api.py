@@ -16,6 +16,7 @@ from uuid import uuid4
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from exceptions import InvalidOperationError
 from models.cluster import Cluster, ClusterStatus
 from models.ticket import Ticket, TicketPriority, TicketStatus
 
@@ -72,7 +73,22 @@ def _build_cluster() -> Cluster:
 
 
 @pytest.fixture
-async def ticket_client() -> AsyncGenerator[AsyncClient, None]:
+def mock_ticket_repo() -> AsyncMock:
+    """Ticket repository mock behind ticket_client, for per-test overrides."""
+    ticket = _build_ticket()
+    repo = AsyncMock()
+    repo.build_partition_key = lambda _: MONTH
+    repo.ticket_number_exists = AsyncMock(return_value=False)
+    repo.create = AsyncMock(return_value=ticket)
+    repo.get_by_id = AsyncMock(return_value=ticket)
+    repo.query = AsyncMock(return_value=[ticket])
+    repo.query_page = AsyncMock(return_value=([ticket], "next-token"))
+    repo.count = AsyncMock(return_value=1)
+    return repo
+
+
+@pytest.fixture
+async def ticket_client(mock_ticket_repo: AsyncMock) -> AsyncGenerator[AsyncClient, None]:
     """Test client with mocked ticket, clustering, and embedding deps."""
     import os  # noqa: PLC0415
 
@@ -113,17 +129,8 @@ async def ticket_client() -> AsyncGenerator[AsyncClient, None]:
         azure_openai_embedding_deployment="text-embedding-3-small",
     )
 
-    ticket = _build_ticket()
     cluster = _build_cluster()
 
-    mock_ticket_repo = AsyncMock()
-    mock_ticket_repo.build_partition_key = lambda _: MONTH
-    mock_ticket_repo.get_by_ticket_number = AsyncMock(return_value=None)
-    mock_ticket_repo.create = AsyncMock(return_value=ticket)
-    mock_ticket_repo.get_by_id = AsyncMock(return_value=ticket)
-    mock_ticket_repo.query = AsyncMock(return_value=[ticket])
-    mock_ticket_repo.count = AsyncMock(return_value=1)
-
     mock_clustering_service = AsyncMock()
     mock_clustering_service.find_or_create_cluster = AsyncMock(
         return_value=(cluster, {"decision": "auto", "confidence": 0.9})
@@ -183,6 +190,9 @@ class TestGetTicketAPI:
         assert "ticketNumber" in data
         assert "status" in data
         assert "category" in data
+        assert data["status"] == "open"
+        assert data["priority"] == "medium"
+        assert data["severity"] is None
 
     async def test_get_ticket_not_found(self) -> None:
         # Override so this specific ID returns None
@@ -394,6 +404,60 @@ class TestListTicketsAPI:
         )
         assert response.status_code == 200
 
+    async def test_list_tickets_returns_continuation_token(
+        self, ticket_client: AsyncClient
+    ) -> None:
+        response = await ticket_client.get("/api/v1/tickets", params={"month": MONTH})
+        assert response.json()["meta"]["continuationToken"] == "next-token"
+
+    async def test_list_tickets_last_token_page_has_no_more(
+        self, ticket_client: AsyncClient, mock_ticket_repo: AsyncMock
+    ) -> None:
+        """A short final page reached by token ends the listing, whatever the offset."""
+        mock_ticket_repo.query_page.return_value = ([_build_ticket()], None)
+        mock_ticket_repo.count.return_value = 5
+        response = await ticket_client.get(
+            "/api/v1/tickets", params={"month": MONTH, "continuation": "page-2-token"}
+        )
+        meta = response.json()["meta"]
+        assert meta["continuationToken"] is None
+        assert meta["hasMore"] is False
+
+    async def test_list_tickets_rejects_bad_continuation(
+        self, ticket_client: AsyncClient, mock_ticket_repo: AsyncMock
+    ) -> None:
+        """A token Cosmos rejects is the client's error (400), not an outage (503)."""
+        mock_ticket_repo.query_page.side_effect = InvalidOperationError(
+            "Invalid continuation token"
+        )
+        response = await ticket_client.get(
+            "/api/v1/tickets", params={"month": MONTH, "continuation": "garbage"}
+        )
+        assert response.status_code == 400
+        assert response.json()["error"] == "INVALID_OPERATION"
+
+    async def test_list_tickets_deep_page_without_token_uses_offset(
+        self, ticket_client: AsyncClient
+    ) -> None:
+        response = await ticket_client.get("/api/v1/tickets", params={"month": MONTH, "page": 3})
+        assert response.status_code == 200
+        assert response.json()["meta"]["continuationToken"] is None
+
+    async def test_list_items_match_single_ticket_response(
+        self, ticket_client: AsyncClient
+    ) -> None:
+        """The batched page conversion yields the same body as the single-ticket path."""
+        listed = await ticket_client.get("/api/v1/tickets", params={"month": MONTH})
+        single = await ticket_client.get(f"/api/v1/tickets/{TICKET_ID}", params={"month": MONTH})
+        assert listed.json()["data"] == [single.json()]
+
+    def test_list_projection_skips_heavy_fields(self) -> None:
+        from routes.tickets import _LIST_PROJECTION  # noqa: PLC0415
+
+        columns = set(_LIST_PROJECTION.split(", "))
+        assert {"c.id", "c.ticketNumber", "c.dedup"} <= columns
+        assert not columns & {"c.contentVector", "c.dedupText", "c.rawMetadata"}
+
 
 # ---------------------------------------------------------------------------
 # POST /tickets
@@ -455,10 +519,9 @@ class TestCreateTicketAPI:
             azure_openai_embedding_deployment="text-embedding-3-small",
         )
 
-        existing_ticket = _build_ticket()
         dup_repo = AsyncMock()
         dup_repo.build_partition_key = lambda _: MONTH
-        dup_repo.get_by_ticket_number = AsyncMock(return_value=existing_ticket)
+        dup_repo.ticket_number_exists = AsyncMock(return_value=True)
 
         with (
             patch("config.get_settings", return_value=ts),
@@ -539,7 +602,7 @@ class TestCreateTicketAPI:
 
         ok_repo = AsyncMock()
         ok_repo.build_partition_key = lambda _: MONTH
-        ok_repo.get_by_ticket_number = AsyncMock(return_value=None)
+        ok_repo.ticket_number_exists = AsyncMock(return_value=False)
 
         with (
             patch("config.get_settings", return_value=ts),
@@ -620,7 +683,7 @@ class TestCreateTicketAPI:
 
         ok_repo = AsyncMock()
         ok_repo.build_partition_key = lambda _: MONTH
-        ok_repo.get_by_ticket_number = AsyncMock(return_value=None)
+        ok_repo.ticket_number_exists = AsyncMock(return_value=False)
 
         with (
             patch("config.get_settings", return_value=ts),
@@ -8,7 +8,8 @@ decisions, centroid updates, and cluster lifecycle management.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
@@ -20,6 +21,7 @@ from models.cluster import (
     ClusterStatus,
 )
 from models.ticket import Ticket
+from repositories.cluster import ClusterRepository
 from services.clustering_service import (
     ClusteringService,
     _compute_confidence_score,
@@ -73,6 +75,8 @@ def mock_cluster_repo() -> AsyncMock:
     repo.update_status = AsyncMock()
     repo.find_cluster_candidates = AsyncMock(return_value=[])
     repo.update_cluster_with_etag = AsyncMock()
+    # Run the real retry loop so mutations reach update_cluster_with_etag
+    repo.update_with_retry = partial(ClusterRepository.update_with_retry, repo)
     return repo
 
 
@@ -87,7 +91,7 @@ def mock_embedding_service() -> AsyncMock:
 @pytest.fixture
 def sample_ticket() -> Ticket:
     """Create sample ticket with embedding for testing."""
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
     return Ticket(
         id=uuid4(),
         pk="2025-01",
@@ -185,26 +189,26 @@ class TestComputeTimeProximity:
     """Tests for time proximity calculation."""
 
     def test_identical_times(self) -> None:
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         assert _compute_time_proximity(now, now, 14) == pytest.approx(1.0)
 
     def test_edge_of_window(self) -> None:
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         edge = now + timedelta(days=14)
         assert _compute_time_proximity(now, edge, 14) == pytest.approx(0.0)
 
     def test_beyond_window(self) -> None:
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         beyond = now + timedelta(days=20)
         assert _compute_time_proximity(now, beyond, 14) == pytest.approx(0.0)
 
     def test_half_window(self) -> None:
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         half = now + timedelta(days=7)
         assert _compute_time_proximity(now, half, 14) == pytest.approx(0.5)
 
     def test_symmetric(self) -> None:
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         later = now + timedelta(days=3)
         assert _compute_time_proximity(now, later, 14) == pytest.approx(
             _compute_time_proximity(later, now, 14)
@@ -229,6 +233,12 @@ class TestGeneratePartitionKeys:
         keys = _generate_partition_keys(dt, 3)
         assert keys == ["2025-01", "2024-12", "2024-11"]
 
+    def test_cached_window_returns_independent_lists(self) -> None:
+        dt = datetime(2025, 3, 15)
+        first = _generate_partition_keys(dt, 2)
+        first.append("mutated")
+        assert _generate_partition_keys(dt, 2) == ["2025-03", "2025-02"]
+
 
 class TestUpdateCentroid:
     """Tests for incremental centroid update."""
@@ -247,6 +257,10 @@ class TestUpdateCentroid:
         # (2*3 + 5) / 4 = 2.75, (2*3 + 5) / 4 = 2.75
         assert result == pytest.approx([2.75, 2.75])
 
+    def test_empty_centroid_takes_new_vector(self) -> None:
+        result = _update_centroid([0.0, 0.0], [0.3, -0.7], 0)
+        assert result == pytest.approx([0.3, -0.7])
+
 
 # =============================================================================
 # ClusteringService tests
@@ -543,8 +557,8 @@ class TestClusteringService:
             id=uuid4(),
             pk="2025-01",
             ticket_number="TICKET-X",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
             channel="chat",
             customer_id="CUST-001",
             category="Test",
@@ -602,6 +616,7 @@ class TestClusteringService:
         self,
         clustering_service: ClusteringService,
         mock_cluster_repo: AsyncMock,
+        mock_ticket_repo: AsyncMock,
     ) -> None:
         """Should demote cluster to CANDIDATE when only 1 member remains."""
         cluster_id = uuid4()
@@ -650,6 +665,43 @@ class TestClusteringService:
             ClusterStatus.CANDIDATE,
             "2025-01",
         )
+        # The cluster already read for validation is handed to the repository
+        mock_cluster_repo.remove_ticket.assert_awaited_once_with(
+            cluster_id,
+            ticket_id,
+            "2025-01",
+            current=mock_cluster_repo.get_by_id.return_value,
+        )
+        mock_ticket_repo.remove_from_cluster.assert_awaited_once_with(ticket_id, "2025-01")
+
+    @pytest.mark.asyncio
+    async def test_remove_ticket_failure_keeps_ticket_assignment(
+        self,
+        clustering_service: ClusteringService,
+        mock_cluster_repo: AsyncMock,
+        mock_ticket_repo: AsyncMock,
+    ) -> None:
+        """Should leave the ticket assigned when the cluster patch fails."""
+        cluster_id = uuid4()
+        ticket_id = uuid4()
+
+        mock_cluster_repo.get_by_id.return_value = Cluster(
+            id=cluster_id,
+            pk="2025-01",
+            members=[
+                ClusterMember(ticket_id=ticket_id, ticket_number="T-001"),
+                ClusterMember(ticket_id=uuid4(), ticket_number="T-002"),
+            ],
+            ticket_count=2,
+            summary="Test",
+            status=ClusterStatus.PENDING,
+        )
+        mock_cluster_repo.remove_ticket.return_value = None
+
+        with pytest.raises(ValueError, match="Failed to remove ticket"):
+            await clustering_service.remove_ticket_from_cluster(cluster_id, ticket_id, "2025-01")
+
+        mock_ticket_repo.remove_from_cluster.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_full_cluster_fallback_to_next_candidate(
@@ -7,13 +7,23 @@ read-modify-write patterns, vector search helpers) using mocked containers.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
-from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
-
+import pytest
+from azure.core import MatchConditions
+from azure.core.utils import CaseInsensitiveDict
+from azure.cosmos import CosmosDict
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosHttpResponseError,
+    CosmosResourceNotFoundError,
+)
+
+from exceptions import InvalidOperationError
 from models.cluster import Cluster, ClusterMember, ClusterStatus
 from models.merge_operation import MergeBehavior, MergeOperation, MergeStatus
 from models.ticket import Ticket, TicketPriority, TicketStatus
@@ -41,6 +51,7 @@ def _make_container() -> MagicMock:
     c.upsert_item = AsyncMock()
     c.delete_item = AsyncMock()
     c.replace_item = AsyncMock()
+    c.patch_item = AsyncMock()
     c.query_items = MagicMock(return_value=_async_gen_items([]))
     return c
 
@@ -113,6 +124,13 @@ class TestTicketRepository:
         repo = TicketRepository(container)
         assert repo is not None
 
+    def test_shared_partitioned_base(self) -> None:
+        repo = TicketRepository(_make_container())
+        assert repo._container_name == "tickets"
+        assert repo.build_partition_key(NOW) == MONTH
+        ticket = _build_ticket()
+        assert repo._from_documents([ticket.to_cosmos_document()]) == [ticket]
+
     def test_to_document(self) -> None:
         repo = TicketRepository(_make_container())
         ticket = _build_ticket()
@@ -120,6 +138,19 @@ class TestTicketRepository:
         assert isinstance(doc, dict)
         assert "id" in doc
 
+    def test_to_document_passes_raw_metadata_through(self) -> None:
+        repo = TicketRepository(_make_container())
+        raw = {"source": {"id": 42, "tags": ["a", "b"]}}
+        ticket = _build_ticket().model_copy(update={"raw_metadata": raw})
+        doc = repo._to_document(ticket)
+        assert doc["rawMetadata"] is raw
+        assert repo._from_document(doc).raw_metadata == raw
+
+    def test_to_document_keeps_null_raw_metadata(self) -> None:
+        doc = TicketRepository(_make_container())._to_document(_build_ticket())
+        assert "rawMetadata" in doc
+        assert doc["rawMetadata"] is None
+
     def test_from_document(self) -> None:
         repo = TicketRepository(_make_container())
         ticket = _build_ticket()
@@ -149,15 +180,30 @@ class TestTicketRepository:
         result = await repo.get_by_ticket_number("TKT-999", MONTH)
         assert result is None
 
-    async def test_get_unassigned_tickets(self) -> None:
+    async def test_ticket_number_exists_projects_id_only(self) -> None:
         container = _make_container()
-        ticket = _build_ticket()
-        container.query_items = MagicMock(
-            return_value=_async_gen_items([ticket.to_cosmos_document()])
-        )
+        container.query_items = MagicMock(return_value=_async_gen_items(["some-id"]))
         repo = TicketRepository(container)
-        results = await repo.get_unassigned_tickets(MONTH)
-        assert len(results) == 1
+        assert await repo.ticket_number_exists("TKT-001", MONTH) is True
+        kwargs = container.query_items.call_args.kwargs
+        assert kwargs["query"].startswith("SELECT TOP 1 VALUE c.id FROM c")
+        assert kwargs["partition_key"] == MONTH
+
+    async def test_ticket_number_exists_false_when_absent(self) -> None:
+        container = _make_container()
+        repo = TicketRepository(container)
+        assert await repo.ticket_number_exists("TKT-999", MONTH) is False
+
+    async def test_get_unassigned_tickets_pages_with_continuation(self) -> None:
+        ticket = _build_ticket()
+        repo = TicketRepository(_make_container())
+        repo.query_page = AsyncMock(return_value=([ticket], "next-page"))
+        results, next_page = await repo.get_unassigned_tickets(MONTH, limit=5, continuation="t1")
+        assert [t.id for t in results] == [ticket.id]
+        assert next_page == "next-page"
+        kwargs = repo.query_page.call_args.kwargs
+        assert kwargs["max_item_count"] == 5
+        assert kwargs["continuation"] == "t1"
 
     async def test_get_by_cluster_id(self) -> None:
         container = _make_container()
@@ -170,39 +216,95 @@ class TestTicketRepository:
         assert len(results) == 1
 
     async def test_assign_to_cluster_found(self) -> None:
+        ticket = _build_ticket()
+        cluster_id = uuid4()
+        container = _make_container()
+        patched = ticket.to_cosmos_document() | {"clusterId": str(cluster_id)}
+        container.patch_item.return_value = patched
+        repo = TicketRepository(container)
+        result = await repo.assign_to_cluster(ticket.id, cluster_id, MONTH)
+        assert result is not None
+        assert result.cluster_id == cluster_id
+        # One patch round trip; the ticket is never read and rewritten
+        container.read_item.assert_not_called()
+        container.upsert_item.assert_not_called()
+        ops = {
+            op["path"]: op["value"]
+            for op in container.patch_item.call_args.kwargs["patch_operations"]
+        }
+        assert ops["/clusterId"] == str(cluster_id)
+        assert ops["/updatedAt"].endswith("Z")
+
+    async def test_assign_to_cluster_already_assigned_skips_write(self) -> None:
+        cluster_id = uuid4()
         ticket = _build_ticket()
         container = _make_container()
-        container.read_item.return_value = ticket.to_cosmos_document()
-        updated_doc = ticket.to_cosmos_document()
-        container.upsert_item.return_value = updated_doc
+        container.patch_item.side_effect = CosmosAccessConditionFailedError(message="412")
+        container.read_item.return_value = ticket.to_cosmos_document() | {
+            "clusterId": str(cluster_id)
+        }
         repo = TicketRepository(container)
-        result = await repo.assign_to_cluster(ticket.id, uuid4(), MONTH)
+        result = await repo.assign_to_cluster(ticket.id, cluster_id, MONTH)
         assert result is not None
+        assert result.cluster_id == cluster_id
+        predicate = container.patch_item.call_args.kwargs["filter_predicate"]
+        assert f'c.clusterId != "{cluster_id}"' in predicate
 
     async def test_assign_to_cluster_not_found(self) -> None:
         container = _make_container()
-        container.read_item.side_effect = CosmosResourceNotFoundError(message="not found")
+        container.patch_item.side_effect = CosmosResourceNotFoundError(message="not found")
         repo = TicketRepository(container)
         result = await repo.assign_to_cluster(uuid4(), uuid4(), MONTH)
         assert result is None
 
     async def test_remove_from_cluster_found(self) -> None:
         ticket = _build_ticket()
-        ticket.cluster_id = uuid4()
         container = _make_container()
-        container.read_item.return_value = ticket.to_cosmos_document()
-        container.upsert_item.return_value = ticket.to_cosmos_document()
+        container.patch_item.return_value = ticket.to_cosmos_document() | {"clusterId": None}
         repo = TicketRepository(container)
         result = await repo.remove_from_cluster(ticket.id, MONTH)
         assert result is not None
+        assert result.cluster_id is None
+        ops = {
+            op["path"]: op["value"]
+            for op in container.patch_item.call_args.kwargs["patch_operations"]
+        }
+        assert ops["/clusterId"] is None
 
     async def test_remove_from_cluster_not_found(self) -> None:
         container = _make_container()
-        container.read_item.side_effect = CosmosResourceNotFoundError(message="not found")
+        container.patch_item.side_effect = CosmosResourceNotFoundError(message="not found")
         repo = TicketRepository(container)
         result = await repo.remove_from_cluster(uuid4(), MONTH)
         assert result is None
 
+    async def test_mark_merged_batches_patches(self) -> None:
+        container = _make_container()
+        container.execute_item_batch = AsyncMock()
+        repo = TicketRepository(container)
+        ids, canonical = [uuid4(), uuid4()], uuid4()
+        await repo.mark_merged(ids, canonical, MONTH, updated_at=NOW)
+        container.execute_item_batch.assert_awaited_once()
+        kwargs = container.execute_item_batch.await_args.kwargs
+        assert kwargs["partition_key"] == MONTH
+        batch = kwargs["batch_operations"]
+        assert [args[0] for _, args in batch] == [str(i) for i in ids]
+        ops = {op["path"]: op["value"] for op in batch[0][1][1]}
+        assert ops["/mergedIntoId"] == str(canonical)
+        assert ops["/updatedAt"].startswith("2025-01-15T10:00:00")
+
+    async def test_restore_unmerged_resets_merge_and_cluster(self) -> None:
+        container = _make_container()
+        container.execute_item_batch = AsyncMock()
+        repo = TicketRepository(container)
+        kept, cleared, cluster_id = uuid4(), uuid4(), uuid4()
+        await repo.restore_unmerged({kept: cluster_id, cleared: None}, MONTH, updated_at=NOW)
+        batch = container.execute_item_batch.await_args.kwargs["batch_operations"]
+        by_id = {args[0]: {op["path"]: op["value"] for op in args[1]} for _, args in batch}
+        assert by_id[str(kept)]["/clusterId"] == str(cluster_id)
+        assert by_id[str(cleared)]["/clusterId"] is None
+        assert all(ops["/mergedIntoId"] is None for ops in by_id.values())
+
 
 # ===========================================================================
 # ClusterRepository
@@ -248,6 +350,77 @@ class TestClusterRepository:
         count = await repo.get_pending_review_count(MONTH)
         assert count == 5
 
+    async def test_create_without_content_takes_etag_from_headers(self) -> None:
+        cluster = _build_cluster()
+        container = _make_container()
+        container.create_item.return_value = CosmosDict(
+            None, response_headers=CaseInsensitiveDict({"etag": '"etag-1"'})
+        )
+        repo = ClusterRepository(container)
+        result = await repo.create(cluster, MONTH, return_content=False)
+        assert result is cluster
+        assert result.etag == '"etag-1"'
+        assert container.create_item.call_args.kwargs["no_response"] is True
+
+    async def test_get_pending_review_count_is_cached(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(side_effect=lambda **_: _async_gen_items([5]))
+        repo = ClusterRepository(container)
+        assert await repo.get_pending_review_count(MONTH) == 5
+        assert await repo.get_pending_review_count(MONTH) == 5
+        assert container.query_items.call_count == 1
+
+    async def test_update_status_invalidates_pending_count(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(side_effect=lambda **_: _async_gen_items([5]))
+        container.patch_item.return_value = _build_cluster().to_cosmos_document()
+        repo = ClusterRepository(container)
+        await repo.get_pending_review_count(MONTH)
+        await repo.update_status(uuid4(), ClusterStatus.DISMISSED, MONTH)
+        await repo.get_pending_review_count(MONTH)
+        assert container.query_items.call_count == 2
+
+    async def test_etag_update_invalidates_pending_count(self) -> None:
+        cluster = _build_cluster()
+        cluster.etag = '"etag-1"'
+        container = _make_container()
+        container.query_items = MagicMock(side_effect=lambda **_: _async_gen_items([5]))
+        container.replace_item.return_value = cluster.to_cosmos_document()
+        repo = ClusterRepository(container)
+        await repo.get_pending_review_count(MONTH)
+        await repo.update_cluster_with_etag(cluster)
+        await repo.get_pending_review_count(MONTH)
+        assert container.query_items.call_count == 2
+
+    async def test_count_by_status(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([2]))
+        repo = ClusterRepository(container)
+        assert await repo.count_by_status(ClusterStatus.DISMISSED, MONTH) == 2
+        kwargs = container.query_items.call_args.kwargs
+        assert kwargs["parameters"] == [{"name": "@status", "value": "dismissed"}]
+
+    async def test_get_by_status_page_uses_continuation(self) -> None:
+        cluster = _build_cluster()
+        repo = ClusterRepository(_make_container())
+        repo.query_page = AsyncMock(return_value=([cluster], None))
+        clusters, next_page = await repo.get_by_status_page(
+            ClusterStatus.PENDING, MONTH, limit=10, continuation="t1", summary_only=True
+        )
+        assert [c.id for c in clusters] == [cluster.id]
+        assert next_page is None
+        args, kwargs = repo.query_page.call_args
+        assert "centroidVector" not in args[0]
+        assert kwargs == {"max_item_count": 10, "continuation": "t1"}
+
+    async def test_get_by_status_page_rejects_bad_continuation(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock()
+        container.query_items.return_value.by_page.side_effect = _make_cosmos_error(400)
+        repo = ClusterRepository(container)
+        with pytest.raises(InvalidOperationError):
+            await repo.get_by_status_page(ClusterStatus.PENDING, MONTH, continuation="garbage")
+
     async def test_get_by_status(self) -> None:
         cluster = _build_cluster()
         container = _make_container()
@@ -257,6 +430,24 @@ class TestClusterRepository:
         repo = ClusterRepository(container)
         results = await repo.get_by_status(ClusterStatus.PENDING, MONTH)
         assert len(results) == 1
+        assert "SELECT * FROM c" in container.query_items.call_args.kwargs["query"]
+
+    async def test_get_pending_clusters_summary_only(self) -> None:
+        cluster = _build_cluster()
+        doc = cluster.to_cosmos_document()
+        doc.pop("members")
+        doc.pop("centroidVector", None)
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([doc]))
+        repo = ClusterRepository(container)
+        results = await repo.get_pending_clusters(MONTH, summary_only=True)
+        assert [c.id for c in results] == [cluster.id]
+        assert results[0].members == []
+        kwargs = container.query_items.call_args.kwargs
+        assert "c.ticketCount" in kwargs["query"]
+        assert "members" not in kwargs["query"]
+        assert "centroidVector" not in kwargs["query"]
+        assert kwargs["parameters"] == [{"name": "@status", "value": "pending"}]
 
     async def test_get_clusters_with_ticket(self) -> None:
         cluster = _build_cluster()
@@ -267,21 +458,30 @@ class TestClusterRepository:
         repo = ClusterRepository(container)
         results = await repo.get_clusters_with_ticket(uuid4(), MONTH)
         assert len(results) == 1
+        # Filters on the member ticket ID path that the clusters container indexes
+        assert "m.ticketId = @ticket_id" in container.query_items.call_args.kwargs["query"]
 
-    async def test_update_status_found(self) -> None:
+    async def test_update_status_patches_without_reading(self) -> None:
         cluster = _build_cluster()
         container = _make_container()
-        container.read_item.return_value = cluster.to_cosmos_document()
-        container.upsert_item.return_value = cluster.to_cosmos_document()
+        container.patch_item.return_value = cluster.to_cosmos_document()
         repo = ClusterRepository(container)
-        result = await repo.update_status(cluster.id, ClusterStatus.DISMISSED, MONTH)
+        result = await repo.update_status(cluster.id, ClusterStatus.MERGED, MONTH)
         assert result is not None
+        container.read_item.assert_not_called()
+        container.upsert_item.assert_not_called()
+        kwargs = container.patch_item.call_args.kwargs
+        assert kwargs["item"] == str(cluster.id)
+        assert kwargs["partition_key"] == MONTH
+        ops = {op["path"]: op for op in kwargs["patch_operations"]}
+        assert ops["/status"] == {"op": "set", "path": "/status", "value": "merged"}
+        assert ops["/updatedAt"]["value"].endswith("Z")
+        assert "/dismissedBy" not in ops
 
     async def test_update_status_with_dismissed_sets_fields(self) -> None:
         cluster = _build_cluster()
         container = _make_container()
-        container.read_item.return_value = cluster.to_cosmos_document()
-        container.upsert_item.return_value = cluster.to_cosmos_document()
+        container.patch_item.return_value = cluster.to_cosmos_document()
         repo = ClusterRepository(container)
         result = await repo.update_status(
             cluster.id,
@@ -291,10 +491,16 @@ class TestClusterRepository:
             dismissal_reason="false positive",
         )
         assert result is not None
+        ops = {
+            op["path"]: op["value"]
+            for op in container.patch_item.call_args.kwargs["patch_operations"]
+        }
+        assert ops["/dismissedBy"] == "admin"
+        assert ops["/dismissalReason"] == "false positive"
 
     async def test_update_status_not_found(self) -> None:
         container = _make_container()
-        container.read_item.side_effect = CosmosResourceNotFoundError(message="not found")
+        container.patch_item.side_effect = CosmosResourceNotFoundError(message="not found")
         repo = ClusterRepository(container)
         result = await repo.update_status(uuid4(), ClusterStatus.DISMISSED, MONTH)
         assert result is None
@@ -303,26 +509,48 @@ class TestClusterRepository:
         cluster = _build_cluster()
         ticket_id = uuid4()
         container = _make_container()
-        container.read_item.return_value = cluster.to_cosmos_document()
-        container.upsert_item.return_value = cluster.to_cosmos_document()
+        container.patch_item.return_value = cluster.to_cosmos_document()
         repo = ClusterRepository(container)
-        result = await repo.add_ticket(cluster.id, ticket_id, MONTH, ticket_number="TKT-X")
+        result = await repo.add_ticket(
+            cluster.id, ticket_id, MONTH, ticket_number="TKT-X", max_members=50
+        )
         assert result is not None
+        container.read_item.assert_not_called()
+        kwargs = container.patch_item.call_args.kwargs
+        add_op, incr_op, _ = kwargs["patch_operations"]
+        assert add_op["op"] == "add"
+        assert add_op["path"] == "/members/-"
+        assert add_op["value"]["ticketId"] == str(ticket_id)
+        assert add_op["value"]["ticketNumber"] == "TKT-X"
+        assert incr_op == {"op": "incr", "path": "/ticketCount", "value": 1}
+        assert f'"ticketId": "{ticket_id}"' in kwargs["filter_predicate"]
+        assert "ARRAY_LENGTH(c.members) < 50" in kwargs["filter_predicate"]
 
     async def test_add_ticket_already_exists(self) -> None:
         ticket_id = uuid4()
         cluster = _build_cluster()
         cluster.members.append(ClusterMember(ticket_id=ticket_id, ticket_number="TKT-X"))
         container = _make_container()
+        container.patch_item.side_effect = CosmosAccessConditionFailedError(message="412")
         container.read_item.return_value = cluster.to_cosmos_document()
         repo = ClusterRepository(container)
         result = await repo.add_ticket(cluster.id, ticket_id, MONTH)
-        # Should return cluster unchanged (no update call)
+        # Precondition failed because it is already a member: no write
         assert result is not None
+        container.upsert_item.assert_not_called()
+
+    async def test_add_ticket_at_capacity_raises(self) -> None:
+        cluster = _build_cluster()
+        container = _make_container()
+        container.patch_item.side_effect = CosmosAccessConditionFailedError(message="412")
+        container.read_item.return_value = cluster.to_cosmos_document()
+        repo = ClusterRepository(container)
+        with pytest.raises(ValueError, match="limit"):
+            await repo.add_ticket(cluster.id, uuid4(), MONTH, max_members=len(cluster.members))
 
     async def test_add_ticket_cluster_not_found(self) -> None:
         container = _make_container()
-        container.read_item.side_effect = CosmosResourceNotFoundError(message="not found")
+        container.patch_item.side_effect = CosmosResourceNotFoundError(message="not found")
         repo = ClusterRepository(container)
         result = await repo.add_ticket(uuid4(), uuid4(), MONTH)
         assert result is None
@@ -331,21 +559,56 @@ class TestClusterRepository:
         ticket_id = uuid4()
         cluster = _build_cluster()
         cluster.members.append(ClusterMember(ticket_id=ticket_id, ticket_number="TKT-X"))
+        index = len(cluster.members) - 1
         container = _make_container()
         container.read_item.return_value = cluster.to_cosmos_document()
-        container.upsert_item.return_value = cluster.to_cosmos_document()
+        container.patch_item.return_value = cluster.to_cosmos_document()
         repo = ClusterRepository(container)
         result = await repo.remove_ticket(cluster.id, ticket_id, MONTH)
         assert result is not None
+        container.upsert_item.assert_not_called()
+        kwargs = container.patch_item.call_args.kwargs
+        assert kwargs["patch_operations"][0] == {"op": "remove", "path": f"/members/{index}"}
+        assert kwargs["patch_operations"][1] == {"op": "incr", "path": "/ticketCount", "value": -1}
+        assert kwargs["filter_predicate"] == (
+            f'FROM c WHERE c.members[{index}].ticketId = "{ticket_id}"'
+        )
+
+    async def test_remove_ticket_reuses_current_copy(self) -> None:
+        ticket_id = uuid4()
+        cluster = _build_cluster()
+        cluster.members.append(ClusterMember(ticket_id=ticket_id, ticket_number="TKT-X"))
+        container = _make_container()
+        container.patch_item.return_value = cluster.to_cosmos_document()
+        repo = ClusterRepository(container)
+        result = await repo.remove_ticket(cluster.id, ticket_id, MONTH, current=cluster)
+        assert result is not None
+        container.read_item.assert_not_called()
+        container.patch_item.assert_awaited_once()
+
+    async def test_remove_ticket_falls_back_when_members_shift(self) -> None:
+        ticket_id = uuid4()
+        cluster = _build_cluster()
+        cluster.members.append(ClusterMember(ticket_id=ticket_id, ticket_number="TKT-X"))
+        container = _make_container()
+        container.read_item.return_value = cluster.to_cosmos_document()
+        container.patch_item.side_effect = CosmosAccessConditionFailedError(message="412")
+        container.replace_item.return_value = cluster.to_cosmos_document()
+        repo = ClusterRepository(container)
+        result = await repo.remove_ticket(cluster.id, ticket_id, MONTH)
+        assert result is not None
+        container.upsert_item.assert_not_called()
+        replaced = container.replace_item.call_args.kwargs["body"]
+        assert str(ticket_id) not in [m["ticketId"] for m in replaced["members"]]
 
     async def test_remove_ticket_not_in_cluster(self) -> None:
         cluster = _build_cluster()
         container = _make_container()
         container.read_item.return_value = cluster.to_cosmos_document()
-        container.upsert_item.return_value = cluster.to_cosmos_document()
         repo = ClusterRepository(container)
         result = await repo.remove_ticket(cluster.id, uuid4(), MONTH)
         assert result is not None
+        container.patch_item.assert_not_called()
 
     async def test_remove_ticket_cluster_not_found(self) -> None:
         container = _make_container()
@@ -366,6 +629,48 @@ class TestClusterRepository:
             end_date=datetime(2025, 1, 31),
         )
         assert len(results) == 1
+        kwargs = container.query_items.call_args.kwargs
+        assert kwargs["partition_key"] == "2025-01"
+        assert "c.pk IN" not in kwargs["query"]
+
+    async def test_get_by_date_range_spanning_months_queries_each_partition(self) -> None:
+        newest = _build_cluster()
+        newest.created_at = datetime(2025, 2, 3)
+        middle = _build_cluster()
+        middle.created_at = datetime(2025, 1, 10)
+        oldest = _build_cluster()
+        oldest.created_at = datetime(2024, 12, 25)
+        by_pk = {"2025-02": [newest], "2025-01": [middle], "2024-12": [oldest]}
+        container = _make_container()
+        container.query_items = MagicMock(
+            side_effect=lambda **kw: _async_gen_items(
+                [c.to_cosmos_document() for c in by_pk[kw["partition_key"]]]
+            )
+        )
+        repo = ClusterRepository(container)
+        results = await repo.get_by_date_range(
+            start_date=datetime(2024, 12, 20),
+            end_date=datetime(2025, 2, 5),
+            limit=2,
+        )
+        # One single-partition query per covered month, merged newest first
+        queried = [call.kwargs["partition_key"] for call in container.query_items.call_args_list]
+        assert sorted(queried) == ["2024-12", "2025-01", "2025-02"]
+        assert all(
+            "c.pk IN" not in call.kwargs["query"] for call in container.query_items.call_args_list
+        )
+        assert [c.id for c in results] == [newest.id, middle.id]
+
+    async def test_get_by_date_range_beyond_cap_runs_one_cross_partition_query(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([]))
+        repo = ClusterRepository(container)
+        await repo.get_by_date_range(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2025, 12, 31),
+        )
+        container.query_items.assert_called_once()
+        assert "partition_key" not in container.query_items.call_args.kwargs
 
     async def test_find_cluster_candidates_with_customer_filter(self) -> None:
         container = _make_container()
@@ -381,6 +686,9 @@ class TestClusterRepository:
             partition_keys=[MONTH],
         )
         assert isinstance(results, list)
+        kwargs = container.query_items.call_args.kwargs
+        assert "c.customerId = @customerId AND" in kwargs["query"]
+        assert {"name": "@customerId", "value": "CUST-1"} in kwargs["parameters"]
 
     async def test_find_cluster_candidates_no_customer_filter(self) -> None:
         container = _make_container()
@@ -395,6 +703,9 @@ class TestClusterRepository:
             filter_by_customer=False,
         )
         assert results == []
+        kwargs = container.query_items.call_args.kwargs
+        assert "@customerId" not in kwargs["query"]
+        assert all(p["name"] != "@customerId" for p in kwargs["parameters"])
 
     async def test_find_cluster_candidates_cosmos_error_skipped(self) -> None:
         container = _make_container()
@@ -409,6 +720,56 @@ class TestClusterRepository:
         )
         assert results == []
 
+    async def test_find_cluster_candidates_queries_partitions_concurrently(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def _slow_gen(items: list[dict[str, Any]]):  # type: ignore[no-untyped-def]
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            for item in items:
+                yield item
+
+        by_pk = {
+            "2025-01": [{"id": "a", "similarityScore": 0.7}],
+            "2024-12": [{"id": "b", "similarityScore": 0.9}],
+        }
+        container = _make_container()
+        container.query_items = MagicMock(
+            side_effect=lambda **kw: _slow_gen(by_pk[kw["partition_key"]])
+        )
+        repo = ClusterRepository(container)
+        results = await repo.find_cluster_candidates(
+            customer_id="CUST-1",
+            min_updated_at="2025-01-01T00:00:00",
+            query_vector=[0.1] * 10,
+            top_k=5,
+            partition_keys=["2025-01", "2024-12"],
+        )
+        assert peak == 2
+        assert [r["id"] for r in results] == ["b", "a"]
+
+    async def test_find_cluster_candidates_keeps_healthy_partitions(self) -> None:
+        def _query(**kw: Any):  # type: ignore[no-untyped-def]
+            if kw["partition_key"] == "2024-12":
+                raise _make_cosmos_error(503)
+            return _async_gen_items([{"id": "a", "similarityScore": 0.5}])
+
+        container = _make_container()
+        container.query_items = MagicMock(side_effect=_query)
+        repo = ClusterRepository(container)
+        results = await repo.find_cluster_candidates(
+            customer_id="CUST-1",
+            min_updated_at="2025-01-01T00:00:00",
+            query_vector=[0.1] * 10,
+            top_k=5,
+            partition_keys=["2025-01", "2024-12"],
+        )
+        assert [r["id"] for r in results] == ["a"]
+
     async def test_update_cluster_with_etag(self) -> None:
         cluster = _build_cluster()
         cluster.etag = '"abc123"'
@@ -418,6 +779,44 @@ class TestClusterRepository:
         result = await repo.update_cluster_with_etag(cluster)
         assert result is not None
         container.replace_item.assert_awaited_once()
+        kwargs = container.replace_item.await_args.kwargs
+        assert kwargs["item"] == str(cluster.id)
+        assert kwargs["etag"] == '"abc123"'
+        assert kwargs["match_condition"] == MatchConditions.IfNotModified
+
+    async def test_update_with_retry_reapplies_mutator_on_conflict(self) -> None:
+        cluster = _build_cluster()
+        container = _make_container()
+        container.read_item.return_value = cluster.to_cosmos_document()
+        container.replace_item.side_effect = [
+            _make_cosmos_error(412),
+            cluster.to_cosmos_document(),
+        ]
+        repo = ClusterRepository(container)
+        seen: list[Cluster] = []
+        result = await repo.update_with_retry(cluster.id, MONTH, seen.append)
+        assert result is not None
+        # First attempt on the initial read, second on the re-read copy
+        assert len(seen) == 2
+        assert seen[0] is not seen[1]
+        assert container.read_item.await_count == 2
+
+    async def test_update_with_retry_gives_up_after_max_attempts(self) -> None:
+        cluster = _build_cluster()
+        container = _make_container()
+        container.read_item.return_value = cluster.to_cosmos_document()
+        container.replace_item.side_effect = _make_cosmos_error(412)
+        repo = ClusterRepository(container)
+        with pytest.raises(CosmosHttpResponseError):
+            await repo.update_with_retry(cluster.id, MONTH, lambda _: None, max_attempts=2)
+        assert container.replace_item.await_count == 2
+
+    async def test_update_with_retry_missing_cluster(self) -> None:
+        container = _make_container()
+        container.read_item.side_effect = CosmosResourceNotFoundError(message="not found")
+        repo = ClusterRepository(container)
+        assert await repo.update_with_retry(uuid4(), MONTH, lambda _: None) is None
+        container.replace_item.assert_not_called()
 
 
 # ===========================================================================
@@ -476,6 +875,41 @@ class TestMergeRepository:
         repo = MergeRepository(container)
         results = await repo.get_revertible_merges(MONTH)
         assert len(results) == 1
+        assert "SELECT * FROM c" in container.query_items.call_args.kwargs["query"]
+
+    async def test_get_revertible_merges_now_matches_stored_format(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([]))
+        repo = MergeRepository(container)
+        await repo.get_revertible_merges(MONTH)
+        params = {
+            p["name"]: p["value"] for p in container.query_items.call_args.kwargs["parameters"]
+        }
+        # Compared as a string against revertDeadline, which is stored with "Z"
+        assert params["@now"].endswith("Z")
+
+    async def test_get_revertible_merges_without_snapshots(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([]))
+        repo = MergeRepository(container)
+        await repo.get_revertible_merges(MONTH, include_snapshots=False)
+        query = container.query_items.call_args.kwargs["query"]
+        assert "c.primaryTicketId" in query
+        assert "originalStates" not in query
+
+    async def test_get_recent_merges_projects_out_snapshots(self) -> None:
+        merge = _build_merge()
+        doc = merge.to_cosmos_document()
+        doc.pop("originalStates", None)
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([doc]))
+        repo = MergeRepository(container)
+        results = await repo.get_recent_merges(MONTH, limit=5)
+        assert [m.id for m in results] == [merge.id]
+        assert results[0].original_states == []
+        kwargs = container.query_items.call_args.kwargs
+        assert "originalStates" not in kwargs["query"]
+        assert kwargs["partition_key"] == MONTH
 
     async def test_get_pending_merges(self) -> None:
         merge = _build_merge()
@@ -490,17 +924,18 @@ class TestMergeRepository:
     async def test_update_status_found(self) -> None:
         merge = _build_merge()
         container = _make_container()
-        container.read_item.return_value = merge.to_cosmos_document()
-        container.upsert_item.return_value = merge.to_cosmos_document()
+        container.patch_item.return_value = merge.to_cosmos_document()
         repo = MergeRepository(container)
-        result = await repo.update_status(merge.id, MergeStatus.REVERTED, MONTH)
+        result = await repo.update_status(merge.id, MergeStatus.COMPLETED, MONTH)
         assert result is not None
+        container.read_item.assert_not_called()
+        ops = container.patch_item.call_args.kwargs["patch_operations"]
+        assert ops == [{"op": "set", "path": "/status", "value": "completed"}]
 
     async def test_update_status_reverted_sets_fields(self) -> None:
         merge = _build_merge()
         container = _make_container()
-        container.read_item.return_value = merge.to_cosmos_document()
-        container.upsert_item.return_value = merge.to_cosmos_document()
+        container.patch_item.return_value = merge.to_cosmos_document()
         repo = MergeRepository(container)
         result = await repo.update_status(
             merge.id,
@@ -511,10 +946,23 @@ class TestMergeRepository:
             revert_reason="error",
         )
         assert result is not None
+        container.read_item.assert_not_called()
+        container.upsert_item.assert_not_called()
+        ops = {
+            op["path"]: op["value"]
+            for op in container.patch_item.call_args.kwargs["patch_operations"]
+        }
+        assert ops["/status"] == "reverted"
+        assert ops["/revertedBy"] == "admin"
+        assert ops["/revertReason"] == "error"
+        assert (
+            ops["/revertedAt"]
+            == merge.model_copy(update={"reverted_at": NOW}).to_cosmos_document()["revertedAt"]
+        )
 
     async def test_update_status_not_found(self) -> None:
         container = _make_container()
-        container.read_item.side_effect = CosmosResourceNotFoundError(message="not found")
+        container.patch_item.side_effect = CosmosResourceNotFoundError(message="not found")
         repo = MergeRepository(container)
         result = await repo.update_status(uuid4(), MergeStatus.REVERTED, MONTH)
         assert result is None
@@ -526,6 +974,56 @@ class TestMergeRepository:
         result = await repo.get_merged_ticket_ids(uuid4(), MONTH)
         assert result == []
 
+    async def test_get_merged_ticket_ids_parses_flat_id_stream(self) -> None:
+        first, second, third = uuid4(), uuid4(), uuid4()
+        container = _make_container()
+        container.query_items = MagicMock(
+            return_value=_async_gen_items([str(first), str(second), str(third)])
+        )
+        repo = MergeRepository(container)
+        result = await repo.get_merged_ticket_ids(uuid4(), MONTH)
+        assert result == [first, second, third]
+        # Flattening happens in the query, not in Python
+        assert "JOIN t IN c.secondaryTicketIds" in container.query_items.call_args.kwargs["query"]
+
+    async def test_get_merged_ticket_ids_propagates_cosmos_error(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(side_effect=_make_cosmos_error(503))
+        repo = MergeRepository(container)
+        with pytest.raises(CosmosHttpResponseError):
+            await repo.get_merged_ticket_ids(uuid4(), MONTH)
+
+    async def test_get_revertible_merges_page_uses_continuation(self) -> None:
+        repo = MergeRepository(_make_container())
+        repo.query_page = AsyncMock(return_value=([], "t2"))
+        merges, next_page = await repo.get_revertible_merges_page(
+            MONTH, limit=10, continuation="t1", include_snapshots=False
+        )
+        assert merges == []
+        assert next_page == "t2"
+        args, kwargs = repo.query_page.call_args
+        assert "originalStates" not in args[0]
+        assert kwargs["continuation"] == "t1"
+
+    async def test_get_recent_merges_page_rejects_bad_continuation(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock()
+        container.query_items.return_value.by_page.side_effect = _make_cosmos_error(400)
+        repo = MergeRepository(container)
+        with pytest.raises(InvalidOperationError):
+            await repo.get_recent_merges_page(MONTH, continuation="garbage")
+
+    async def test_count_merges_revertible_uses_same_filter(self) -> None:
+        container = _make_container()
+        container.query_items = MagicMock(return_value=_async_gen_items([4]))
+        repo = MergeRepository(container)
+        assert await repo.count_merges(MONTH, revertible_only=True) == 4
+        kwargs = container.query_items.call_args.kwargs
+        assert kwargs["query"] == (
+            "SELECT VALUE COUNT(1) FROM c WHERE c.status = @status AND c.revertDeadline > @now"
+        )
+        assert kwargs["partition_key"] == MONTH
+
     async def test_get_merge_count_by_user(self) -> None:
         container = _make_container()
         container.query_items = MagicMock(return_value=_async_gen_items([3]))
@@ -552,3 +1050,19 @@ class TestMergeRepository:
         repo = MergeRepository(container)
         result = await repo.check_revert_conflicts(merge.id, MONTH)
         assert len(result) == 1
+
+    async def test_iter_revert_conflicts_streams_without_rereading(self) -> None:
+        merge = _build_merge()
+        conflict = _build_merge()
+        container = _make_container()
+        container.query_items = MagicMock(
+            return_value=_async_gen_items([conflict.to_cosmos_document()])
+        )
+        repo = MergeRepository(container)
+        result = [m async for m in repo.iter_revert_conflicts(merge, MONTH)]
+        assert [m.id for m in result] == [conflict.id]
+        container.read_item.assert_not_called()
+        params = {
+            p["name"]: p["value"] for p in container.query_items.call_args.kwargs["parameters"]
+        }
+        assert params["@merge_id"] == str(merge.id)
@@ -0,0 +1,51 @@
+"""
+Unit tests for CosmosClientManager.
+
+Covers:
+- health_check: database read cached for HEALTH_CHECK_TTL_SECONDS
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from cosmos.client import HEALTH_CHECK_TTL_SECONDS, CosmosClientManager
+
+
+def _connected_manager() -> CosmosClientManager:
+    """Build a connected manager outside the process-wide singleton."""
+    manager = object.__new__(CosmosClientManager)
+    manager._settings = MagicMock()
+    manager._client = MagicMock()
+    manager._database = MagicMock()
+    manager._database.read = AsyncMock()
+    manager._initialized = True
+    return manager
+
+
+class TestHealthCheck:
+    async def test_reuses_result_within_ttl(self) -> None:
+        manager = _connected_manager()
+        with patch("cosmos.client.time.monotonic", return_value=100.0):
+            assert await manager.health_check() == {"cosmos": "healthy"}
+            assert await manager.health_check() == {"cosmos": "healthy"}
+        manager._database.read.assert_awaited_once()
+
+    async def test_reads_again_after_ttl(self) -> None:
+        manager = _connected_manager()
+        with patch("cosmos.client.time.monotonic", return_value=100.0):
+            await manager.health_check()
+        with patch(
+            "cosmos.client.time.monotonic", return_value=100.0 + HEALTH_CHECK_TTL_SECONDS + 0.1
+        ):
+            await manager.health_check()
+        assert manager._database.read.await_count == 2
+
+    async def test_close_drops_cached_result(self) -> None:
+        manager = _connected_manager()
+        manager._client.close = AsyncMock()
+        manager._credential = None
+        manager._session = None
+        await manager.health_check()
+        await manager.close()
+        assert manager._health_cache is None
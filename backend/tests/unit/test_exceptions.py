@@ -11,6 +11,7 @@ from unittest.mock import MagicMock
 
 from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
 from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
 
 from exceptions import (
     DedupTicketsError,
@@ -24,6 +25,7 @@ from exceptions import (
     generic_exception_handler,
     http_exception_handler,
     register_exception_handlers,
+    validation_exception_handler,
 )
 
 # ---------------------------------------------------------------------------
@@ -32,9 +34,9 @@ from exceptions import (
 
 
 def _make_request(path: str = "/test/path") -> MagicMock:
-    """Build a minimal mock Request with a .url.path attribute."""
+    """Build a minimal mock Request carrying the ASGI scope path."""
     req = MagicMock()
-    req.url.path = path
+    req.scope = {"path": path}
     return req
 
 
@@ -104,6 +106,12 @@ class TestDedupTicketsExceptionHandler:
         assert "id-1" in body["message"]
         assert body["path"] == "/api/tickets"
 
+    async def test_uses_orjson_response(self) -> None:
+        req = _make_request("/api/tickets")
+        exc = EntityNotFoundError("Ticket", "id-1")
+        response = await deduptickets_exception_handler(req, exc)
+        assert isinstance(response, ORJSONResponse)
+
     async def test_returns_500_for_base_error(self) -> None:
         req = _make_request("/clusters")
         exc = DedupTicketsError("internal failure")
@@ -153,6 +161,32 @@ class TestHttpExceptionHandler:
         assert response.status_code == 500
 
 
+# ---------------------------------------------------------------------------
+# validation_exception_handler
+# ---------------------------------------------------------------------------
+
+
+class TestValidationExceptionHandler:
+    async def test_returns_422_with_details(self) -> None:
+        req = _make_request("/tickets")
+        exc = MagicMock()
+        exc.errors.return_value = [{"loc": ["body", "summary"], "msg": "Field required"}]
+        response = await validation_exception_handler(req, exc)
+        assert response.status_code == 422
+        import json  # noqa: PLC0415
+
+        body = json.loads(response.body)
+        assert body["error"] == "VALIDATION_ERROR"
+        assert body["details"] == [{"loc": ["body", "summary"], "msg": "Field required"}]
+
+    async def test_builds_errors_once(self) -> None:
+        req = _make_request("/tickets")
+        exc = MagicMock()
+        exc.errors.return_value = []
+        await validation_exception_handler(req, exc)
+        exc.errors.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # cosmos_not_found_handler
 # ---------------------------------------------------------------------------
@@ -204,6 +238,20 @@ class TestCosmosErrorHandler:
         assert body["error"] == "RATE_LIMITED"
         assert "Retry-After" in response.headers
 
+    async def test_429_body_and_headers_are_precise(self) -> None:
+        req = _make_request("/tickets")
+        exc = self._make_cosmos_error(429)
+        response = await cosmos_error_handler(req, exc)
+        import json  # noqa: PLC0415
+
+        assert json.loads(response.body) == {
+            "error": "RATE_LIMITED",
+            "message": "Too many requests, please retry later",
+            "path": "/tickets",
+        }
+        assert response.headers["retry-after"] == "1"
+        assert response.headers["content-type"] == "application/json"
+
     async def test_503_for_other_status(self) -> None:
         req = _make_request("/clusters")
         exc = self._make_cosmos_error(500)
@@ -238,6 +286,14 @@ class TestGenericExceptionHandler:
         assert body["error"] == "INTERNAL_ERROR"
         assert body["path"] == "/api/unknown"
 
+    async def test_path_is_json_escaped(self) -> None:
+        req = _make_request('/api/"quoted"\\path')
+        response = await generic_exception_handler(req, RuntimeError("boom"))
+        import json  # noqa: PLC0415
+
+        body = json.loads(response.body)
+        assert body["path"] == '/api/"quoted"\\path'
+
     async def test_returns_500_for_value_error(self) -> None:
         req = _make_request("/merge")
         exc = ValueError("bad value")
@@ -269,3 +325,9 @@ class TestRegisterExceptionHandlers:
         register_exception_handlers(app)
         registered_types = [call.args[0] for call in app.add_exception_handler.call_args_list]
         assert CosmosHttpResponseError in registered_types
+
+    def test_generic_handler_registered_last(self) -> None:
+        app = MagicMock()
+        register_exception_handlers(app)
+        last_call = app.add_exception_handler.call_args_list[-1]
+        assert last_call.args == (Exception, generic_exception_handler)
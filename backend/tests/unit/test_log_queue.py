@@ -0,0 +1,160 @@
+"""
+Unit tests for queue-backed logging.
+
+Covers:
+- LogQueue.start/stop: handler swap, delivery, restore
+- DropOnFullQueueHandler: records dropped instead of blocking when full
+- BoundedQueueListener: stop() gets its sentinel into a full queue
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from unittest.mock import patch
+from uuid import uuid4
+
+from lib.log_queue import BoundedQueueListener, DropOnFullQueueHandler, LogQueue
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+class _BlockingHandler(_ListHandler):
+    """Holds the listener thread in emit() until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.unblocked.wait(timeout=5)
+        super().emit(record)
+
+
+def _make_logger() -> tuple[logging.Logger, _ListHandler]:
+    """Build an isolated, non-propagating logger with a capturing handler."""
+    test_logger = logging.getLogger(f"tests.log_queue.{uuid4().hex}")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    capture = _ListHandler()
+    test_logger.addHandler(capture)
+    return test_logger, capture
+
+
+# ---------------------------------------------------------------------------
+# LogQueue
+# ---------------------------------------------------------------------------
+
+
+class TestLogQueue:
+    def test_start_swaps_handlers_for_queue_handler(self) -> None:
+        test_logger, _ = _make_logger()
+        log_queue = LogQueue(logger_name=test_logger.name)
+        log_queue.start()
+        try:
+            assert len(test_logger.handlers) == 1
+            assert isinstance(test_logger.handlers[0], DropOnFullQueueHandler)
+            assert log_queue.is_running
+        finally:
+            log_queue.stop()
+
+    def test_records_reach_original_handler_after_stop(self) -> None:
+        test_logger, capture = _make_logger()
+        log_queue = LogQueue(logger_name=test_logger.name)
+        log_queue.start()
+        test_logger.info("queued %s", "message")
+        log_queue.stop()
+        assert capture.messages == ["queued message"]
+
+    def test_stop_restores_original_handlers(self) -> None:
+        test_logger, capture = _make_logger()
+        log_queue = LogQueue(logger_name=test_logger.name)
+        log_queue.start()
+        log_queue.stop()
+        assert test_logger.handlers == [capture]
+        assert not log_queue.is_running
+
+    def test_start_twice_is_noop(self) -> None:
+        test_logger, _ = _make_logger()
+        log_queue = LogQueue(logger_name=test_logger.name)
+        log_queue.start()
+        log_queue.start()
+        try:
+            assert len(test_logger.handlers) == 1
+        finally:
+            log_queue.stop()
+
+    def test_start_without_handlers_is_noop(self) -> None:
+        bare_logger = logging.getLogger(f"tests.log_queue.{uuid4().hex}")
+        log_queue = LogQueue(logger_name=bare_logger.name)
+        log_queue.start()
+        assert not log_queue.is_running
+        assert bare_logger.handlers == []
+
+    def test_stop_with_full_queue_restores_handlers(self) -> None:
+        test_logger = logging.getLogger(f"tests.log_queue.{uuid4().hex}")
+        test_logger.propagate = False
+        test_logger.setLevel(logging.INFO)
+        blocking = _BlockingHandler()
+        test_logger.addHandler(blocking)
+        log_queue = LogQueue(max_size=1, logger_name=test_logger.name)
+        log_queue.start()
+        for i in range(3):
+            test_logger.info("record %d", i)
+
+        releaser = threading.Timer(0.1, blocking.unblocked.set)
+        releaser.start()
+        with patch("lib.log_queue.SENTINEL_PUT_TIMEOUT_SECONDS", 0.01):
+            log_queue.stop()
+        releaser.join()
+
+        assert test_logger.handlers == [blocking]
+        assert not log_queue.is_running
+
+    def test_stop_without_start_is_noop(self) -> None:
+        test_logger, capture = _make_logger()
+        LogQueue(logger_name=test_logger.name).stop()
+        assert test_logger.handlers == [capture]
+
+
+# ---------------------------------------------------------------------------
+# DropOnFullQueueHandler
+# ---------------------------------------------------------------------------
+
+
+class TestDropOnFullQueueHandler:
+    def test_drops_when_full(self) -> None:
+        bounded: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+        handler = DropOnFullQueueHandler(bounded)
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        handler.enqueue(record)
+        handler.enqueue(record)
+        assert bounded.qsize() == 1
+
+
+# ---------------------------------------------------------------------------
+# BoundedQueueListener
+# ---------------------------------------------------------------------------
+
+
+class TestBoundedQueueListener:
+    def test_sentinel_replaces_oldest_record_when_full(self) -> None:
+        bounded: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=1)
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        bounded.put_nowait(record)
+        listener = BoundedQueueListener(bounded)
+        with patch("lib.log_queue.SENTINEL_PUT_TIMEOUT_SECONDS", 0.01):
+            listener.enqueue_sentinel()
+        assert bounded.get_nowait() is None
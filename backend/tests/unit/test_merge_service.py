@@ -6,8 +6,9 @@ Tests merge operations, revert logic, and conflict detection.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -31,13 +32,35 @@ from services.merge_service import (
     RevertWindowExpiredError,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+def _conflicts(merges: list[MergeOperation]) -> Any:
+    """Side effect streaming the given merges from iter_revert_conflicts()."""
+
+    async def stream(*_: Any) -> AsyncIterator[MergeOperation]:
+        for merge in merges:
+            yield merge
+
+    return stream
+
 
 @pytest.fixture
 def mock_ticket_repo() -> AsyncMock:
     """Create mock ticket repository."""
     repo = AsyncMock()
     repo.get_by_id = AsyncMock()
+
+    # Tests stub get_by_id per ticket; the batched read resolves through it
+    async def get_many(ticket_ids: list, pk: str) -> dict[str, Ticket]:
+        found = [await repo.get_by_id(tid, pk) for tid in ticket_ids]
+        return {t.id: t for t in found if t}
+
+    repo.get_many = AsyncMock(side_effect=get_many)
     repo.update = AsyncMock()
+    repo.mark_merged = AsyncMock()
+    repo.restore_unmerged = AsyncMock()
     return repo
 
 
@@ -57,7 +80,7 @@ def mock_merge_repo() -> AsyncMock:
     repo.get_by_id = AsyncMock()
     repo.create = AsyncMock()
     repo.update_status = AsyncMock()
-    repo.check_revert_conflicts = AsyncMock(return_value=[])
+    repo.iter_revert_conflicts = MagicMock(side_effect=_conflicts([]))
     repo.get_by_cluster_id = AsyncMock(return_value=[])
     return repo
 
@@ -68,7 +91,7 @@ def sample_cluster() -> Cluster:
     ticket1_id = uuid4()
     ticket2_id = uuid4()
     ticket3_id = uuid4()
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
 
     return Cluster(
         id=uuid4(),
@@ -89,7 +112,7 @@ def sample_cluster() -> Cluster:
 def sample_tickets(sample_cluster: Cluster) -> list[Ticket]:
     """Create sample tickets for testing."""
     ticket_ids = sample_cluster.ticket_ids
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
 
     return [
         Ticket(
@@ -167,9 +190,9 @@ class TestMergeCluster:
             primary_ticket_id=canonical_id,
             secondary_ticket_ids=[t.id for t in sample_tickets[1:]],
             performed_by="user@example.com",
-            performed_at=datetime.utcnow(),
+            performed_at=datetime.now(UTC),
             status=MergeStatus.COMPLETED,
-            revert_deadline=datetime.utcnow() + timedelta(hours=24),
+            revert_deadline=datetime.now(UTC) + timedelta(hours=24),
             pk="2025-01",
         )
 
@@ -184,6 +207,41 @@ class TestMergeCluster:
         assert result.primary_ticket_id == canonical_id
         assert len(result.secondary_ticket_ids) == 2
         mock_cluster_repo.update_status.assert_called_once()
+        mock_ticket_repo.mark_merged.assert_awaited_once()
+        written, merged_into, pk = mock_ticket_repo.mark_merged.await_args.args
+        assert pk == "2025-01"
+        assert written == [t.id for t in sample_tickets[1:]]
+        assert merged_into == canonical_id
+        # One batched read for the snapshots and one for the ticket updates
+        assert mock_ticket_repo.get_many.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_merge_failure_leaves_cluster_status(
+        self,
+        mock_ticket_repo: AsyncMock,
+        mock_cluster_repo: AsyncMock,
+        mock_merge_repo: AsyncMock,
+        sample_cluster: Cluster,
+        sample_tickets: list[Ticket],
+    ) -> None:
+        """Should not mark the cluster merged when the merge record fails to write."""
+        service = MergeService(
+            mock_ticket_repo,
+            mock_cluster_repo,
+            mock_merge_repo,
+        )
+        mock_cluster_repo.get_by_id.return_value = sample_cluster
+        mock_merge_repo.create.side_effect = RuntimeError("write failed")
+
+        with pytest.raises(RuntimeError):
+            await service.merge_cluster(
+                sample_cluster.id,
+                sample_tickets[0].id,
+                "2025-01",
+                merged_by="user@example.com",
+            )
+
+        mock_cluster_repo.update_status.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_merge_cluster_not_found(
@@ -287,6 +345,33 @@ class TestMergeCluster:
             )
 
 
+class TestCaptureTicketStates:
+    """Tests for the revert snapshot captured at merge time."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_uses_camel_case_json_values(
+        self,
+        mock_ticket_repo: AsyncMock,
+        mock_cluster_repo: AsyncMock,
+        mock_merge_repo: AsyncMock,
+        sample_cluster: Cluster,
+        sample_tickets: list[Ticket],
+    ) -> None:
+        """Snapshot keeps only revert fields, with string IDs and explicit nulls."""
+        service = MergeService(mock_ticket_repo, mock_cluster_repo, mock_merge_repo)
+        ticket = sample_tickets[1]
+        mock_ticket_repo.get_by_id.return_value = ticket
+
+        snapshots = await service._capture_ticket_states([ticket.id], "2025-01")
+
+        assert len(snapshots) == 1
+        snapshot = snapshots[0].snapshot
+        assert set(snapshot) == {"clusterId", "mergedIntoId", "updatedAt"}
+        assert snapshot["clusterId"] == str(sample_cluster.id)
+        assert snapshot["mergedIntoId"] is None
+        assert datetime.fromisoformat(snapshot["updatedAt"]) == ticket.updated_at
+
+
 class TestRevertMerge:
     """Tests for revert_merge method."""
 
@@ -306,7 +391,7 @@ class TestRevertMerge:
             mock_merge_repo,
         )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=sample_cluster.id,
@@ -330,7 +415,6 @@ class TestRevertMerge:
         )
 
         mock_merge_repo.get_by_id.return_value = merge
-        mock_merge_repo.check_revert_conflicts.return_value = []
         mock_merge_repo.update_status.return_value = MergeOperation(
             **{**merge.model_dump(), "status": MergeStatus.REVERTED}
         )
@@ -349,6 +433,44 @@ class TestRevertMerge:
 
         assert result.status == MergeStatus.REVERTED
         mock_cluster_repo.update_status.assert_called_once()
+        restored, pk = mock_ticket_repo.restore_unmerged.await_args.args
+        assert pk == "2025-01"
+        assert restored == {t.id: sample_cluster.id for t in sample_tickets[1:]}
+
+    @pytest.mark.asyncio
+    async def test_revert_missing_merge_leaves_cluster_status(
+        self,
+        mock_ticket_repo: AsyncMock,
+        mock_cluster_repo: AsyncMock,
+        mock_merge_repo: AsyncMock,
+        sample_cluster: Cluster,
+        sample_tickets: list[Ticket],
+    ) -> None:
+        """Should not reopen the cluster when the merge cannot be marked reverted."""
+        service = MergeService(
+            mock_ticket_repo,
+            mock_cluster_repo,
+            mock_merge_repo,
+        )
+        now = datetime.now(UTC)
+        merge = MergeOperation(
+            id=uuid4(),
+            cluster_id=sample_cluster.id,
+            primary_ticket_id=sample_tickets[0].id,
+            secondary_ticket_ids=[t.id for t in sample_tickets[1:]],
+            performed_by="user@example.com",
+            performed_at=now - timedelta(hours=1),
+            status=MergeStatus.COMPLETED,
+            revert_deadline=now + timedelta(hours=23),
+            pk="2025-01",
+        )
+        mock_merge_repo.get_by_id.return_value = merge
+        mock_merge_repo.update_status.return_value = None
+        mock_ticket_repo.get_by_id.return_value = None
+
+        await service.revert_merge(merge.id, "2025-01", reverted_by="admin@example.com")
+
+        mock_cluster_repo.update_status.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_revert_not_found(
@@ -393,7 +515,7 @@ class TestRevertMerge:
             primary_ticket_id=uuid4(),
             secondary_ticket_ids=[uuid4()],
             performed_by="user@example.com",
-            performed_at=datetime.utcnow(),
+            performed_at=datetime.now(UTC),
             status=MergeStatus.REVERTED,  # Already reverted
             pk="2025-01",
         )
@@ -421,7 +543,7 @@ class TestRevertMerge:
             mock_merge_repo,
         )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=uuid4(),
@@ -457,7 +579,7 @@ class TestRevertMerge:
             mock_merge_repo,
         )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=uuid4(),
@@ -482,7 +604,7 @@ class TestRevertMerge:
         )
 
         mock_merge_repo.get_by_id.return_value = merge
-        mock_merge_repo.check_revert_conflicts.return_value = [conflicting_merge]
+        mock_merge_repo.iter_revert_conflicts.side_effect = _conflicts([conflicting_merge])
 
         with pytest.raises(MergeConflictError) as exc_info:
             await service.revert_merge(
@@ -508,7 +630,7 @@ class TestRevertMerge:
             mock_merge_repo,
         )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=uuid4(),
@@ -534,7 +656,7 @@ class TestRevertMerge:
         )
 
         mock_merge_repo.get_by_id.return_value = merge
-        mock_merge_repo.check_revert_conflicts.return_value = [conflicting_merge]
+        mock_merge_repo.iter_revert_conflicts.side_effect = _conflicts([conflicting_merge])
         mock_merge_repo.update_status.return_value = MergeOperation(
             **{**merge.model_dump(), "status": MergeStatus.REVERTED}
         )
@@ -571,7 +693,7 @@ class TestCheckRevertEligible:
             mock_merge_repo,
         )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=uuid4(),
@@ -585,7 +707,6 @@ class TestCheckRevertEligible:
         )
 
         mock_merge_repo.get_by_id.return_value = merge
-        mock_merge_repo.check_revert_conflicts.return_value = []
 
         result = await service.check_revert_eligible(merge.id, "2025-01")
 
@@ -606,7 +727,7 @@ class TestCheckRevertEligible:
             mock_merge_repo,
         )
 
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         merge = MergeOperation(
             id=uuid4(),
             cluster_id=uuid4(),
@@ -620,18 +741,20 @@ class TestCheckRevertEligible:
         )
 
         mock_merge_repo.get_by_id.return_value = merge
-        mock_merge_repo.check_revert_conflicts.return_value = [
-            MergeOperation(
-                id=uuid4(),
-                cluster_id=uuid4(),
-                primary_ticket_id=merge.primary_ticket_id,
-                secondary_ticket_ids=[],
-                performed_by="other",
-                performed_at=now,
-                status=MergeStatus.COMPLETED,
-                pk="2025-01",
-            )
-        ]
+        mock_merge_repo.iter_revert_conflicts.side_effect = _conflicts(
+            [
+                MergeOperation(
+                    id=uuid4(),
+                    cluster_id=uuid4(),
+                    primary_ticket_id=merge.primary_ticket_id,
+                    secondary_ticket_ids=[],
+                    performed_by="other",
+                    performed_at=now,
+                    status=MergeStatus.COMPLETED,
+                    pk="2025-01",
+                )
+            ]
+        )
 
         result = await service.check_revert_eligible(merge.id, "2025-01")
 
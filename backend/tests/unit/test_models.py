@@ -7,10 +7,12 @@ that are not yet exercised by the service-layer tests.
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from models.cluster import (
     Cluster,
@@ -84,9 +86,9 @@ class TestClusterAddMember:
         cluster = _make_cluster()
         import time  # noqa: PLC0415
 
-        time.sleep(0)  # yield to ensure utcnow advances
+        time.sleep(0)  # yield to ensure the clock advances
         cluster.add_member(uuid4(), "TKT-NEW")
-        # updated_at is set to DateTime.utcnow() inside add_member
+        # updated_at is set to utc_now() inside add_member
         assert isinstance(cluster.updated_at, datetime)
 
     def test_add_member_at_limit_raises(self) -> None:
@@ -166,6 +168,77 @@ class TestClusterRemoveMember:
         cluster.remove_member(tid1)
         assert cluster.ticket_count == 1
 
+    def test_remove_preserves_member_order_and_list_identity(self) -> None:
+        cluster = _make_cluster()
+        tids = [uuid4(), uuid4(), uuid4()]
+        cluster.members = [
+            ClusterMember(ticket_id=tid, ticket_number=f"TKT-{i}", added_at=NOW)
+            for i, tid in enumerate(tids)
+        ]
+        members = cluster.members
+        cluster.remove_member(tids[1])
+        assert cluster.members is members
+        assert cluster.ticket_ids == [tids[0], tids[2]]
+
+
+# ---------------------------------------------------------------------------
+# Immutable value models
+# ---------------------------------------------------------------------------
+
+
+class TestFrozenValueModels:
+    def test_cluster_member_is_frozen(self) -> None:
+        member = ClusterMember(ticket_id=uuid4(), ticket_number="TKT-1", added_at=NOW)
+        with pytest.raises(ValidationError):
+            member.ticket_number = "TKT-2"  # type: ignore[misc]
+
+    def test_ticket_snapshot_is_frozen(self) -> None:
+        snap = TicketSnapshot(ticket_id=uuid4(), snapshot={"clusterId": None})
+        with pytest.raises(FrozenInstanceError):
+            snap.ticket_id = uuid4()  # type: ignore[misc]
+
+    def test_ticket_snapshot_round_trips_as_camel_case_object(self) -> None:
+        tid = uuid4()
+        merge = _make_merge()
+        merge.original_states = [TicketSnapshot(ticket_id=tid, snapshot={"clusterId": None})]
+        doc = merge.to_cosmos_document()
+        assert doc["originalStates"] == [{"ticketId": str(tid), "snapshot": {"clusterId": None}}]
+        restored = MergeOperation.from_cosmos_document(doc)
+        assert restored.original_states[0] == TicketSnapshot(tid, {"clusterId": None})
+        assert not hasattr(restored.original_states[0], "__dict__")
+
+    def test_cluster_member_ignores_cosmos_system_fields(self) -> None:
+        member = ClusterMember.model_validate(
+            {"ticketId": str(uuid4()), "ticketNumber": "TKT-1", "_rid": "abc", "_ts": 1}
+        )
+        assert not hasattr(member, "_rid")
+
+
+# ---------------------------------------------------------------------------
+# Cluster.split_on_primary
+# ---------------------------------------------------------------------------
+
+
+class TestClusterSplitOnPrimary:
+    def test_primary_found_and_others_in_order(self) -> None:
+        cluster = _make_cluster()
+        tids = [uuid4(), uuid4(), uuid4()]
+        cluster.members = [
+            ClusterMember(ticket_id=tid, ticket_number=f"TKT-{i}", added_at=NOW)
+            for i, tid in enumerate(tids)
+        ]
+        found, others = cluster.split_on_primary(tids[1])
+        assert found is True
+        assert others == [tids[0], tids[2]]
+
+    def test_primary_missing(self) -> None:
+        cluster = _make_cluster()
+        tid = uuid4()
+        cluster.members = [ClusterMember(ticket_id=tid, ticket_number="TKT-1", added_at=NOW)]
+        found, others = cluster.split_on_primary(uuid4())
+        assert found is False
+        assert others == [tid]
+
 
 # ---------------------------------------------------------------------------
 # Cluster.ticket_ids property
@@ -186,6 +259,13 @@ class TestClusterTicketIds:
         ]
         assert set(cluster.ticket_ids) == set(ids)
 
+    def test_has_member(self) -> None:
+        cluster = _make_cluster()
+        tid = uuid4()
+        cluster.members = [ClusterMember(ticket_id=tid, ticket_number="TKT-1", added_at=NOW)]
+        assert cluster.has_member(tid)
+        assert not cluster.has_member(uuid4())
+
 
 # ---------------------------------------------------------------------------
 # Cluster.to_cosmos_document / from_cosmos_document
@@ -198,11 +278,28 @@ class TestClusterCosmosRoundTrip:
         doc = cluster.to_cosmos_document()
         assert isinstance(doc["id"], str)
 
+    def test_to_cosmos_document_stringifies_member_ticket_ids(self) -> None:
+        cluster = _make_cluster()
+        tid = uuid4()
+        cluster.members = [ClusterMember(ticket_id=tid, ticket_number="TKT-001", added_at=NOW)]
+        doc = cluster.to_cosmos_document()
+        assert doc["id"] == str(cluster.id)
+        assert doc["members"][0]["ticketId"] == str(tid)
+
     def test_to_cosmos_document_no_etag(self) -> None:
         cluster = _make_cluster()
         doc = cluster.to_cosmos_document()
         assert "_etag" not in doc
 
+    def test_to_cosmos_document_drops_loaded_etag(self) -> None:
+        cluster = Cluster.from_cosmos_document(
+            {**_make_cluster().to_cosmos_document(), "_etag": '"0000-etag"'}
+        )
+        assert cluster.etag == '"0000-etag"'
+        doc = cluster.to_cosmos_document()
+        assert "_etag" not in doc
+        assert "etag" not in doc
+
     def test_round_trip_preserves_status(self) -> None:
         cluster = _make_cluster(status=ClusterStatus.MERGED)
         doc = cluster.to_cosmos_document()
@@ -225,6 +322,16 @@ class TestClusterCosmosRoundTrip:
         restored = Cluster.from_cosmos_document(doc)
         assert restored.status == ClusterStatus.DISMISSED
 
+    def test_from_cosmos_documents_batch(self) -> None:
+        clusters = [_make_cluster(), _make_cluster(status=ClusterStatus.MERGED)]
+        docs = [c.to_cosmos_document() for c in clusters]
+        restored = Cluster.from_cosmos_documents(docs)
+        assert [c.id for c in restored] == [c.id for c in clusters]
+        assert restored[1].status == ClusterStatus.MERGED
+
+    def test_from_cosmos_documents_empty(self) -> None:
+        assert Cluster.from_cosmos_documents([]) == []
+
 
 # ---------------------------------------------------------------------------
 # MergeOperation.to_cosmos_document / from_cosmos_document
@@ -237,6 +344,15 @@ class TestMergeOperationCosmosRoundTrip:
         doc = merge.to_cosmos_document()
         assert isinstance(doc["id"], str)
 
+    def test_to_cosmos_document_omits_unset_revert_fields(self) -> None:
+        merge = _make_merge()
+        doc = merge.to_cosmos_document()
+        assert "revertedAt" not in doc
+        assert "revertReason" not in doc
+        restored = MergeOperation.from_cosmos_document(doc)
+        assert restored.reverted_at is None
+        assert restored.revert_reason is None
+
     def test_round_trip_preserves_status(self) -> None:
         merge = _make_merge(status=MergeStatus.COMPLETED)
         doc = merge.to_cosmos_document()
@@ -265,6 +381,22 @@ class TestMergeOperationRevert:
         assert merge.revert_reason == "test revert"
         assert merge.reverted_at is not None
 
+    def test_revert_sets_timezone_aware_timestamp(self) -> None:
+        merge = _make_merge()
+        merge.revert("user-1")
+        assert merge.reverted_at is not None
+        assert merge.reverted_at.tzinfo is not None
+
+    def test_performed_at_default_is_timezone_aware(self) -> None:
+        merge = MergeOperation(
+            pk=MONTH,
+            cluster_id=uuid4(),
+            primary_ticket_id=uuid4(),
+            secondary_ticket_ids=[uuid4()],
+            performed_by="system",
+        )
+        assert merge.performed_at.tzinfo is not None
+
     def test_revert_without_reason(self) -> None:
         merge = _make_merge()
         merge.revert("user-2")
@@ -307,3 +439,22 @@ class TestMergeOperationGetSnapshot:
         ]
         assert merge.get_snapshot(ids[1]) == {"n": 1}
         assert merge.get_snapshot(ids[2]) == {"n": 2}
+
+    def test_get_snapshot_first_entry_wins(self) -> None:
+        tid = uuid4()
+        merge = _make_merge()
+        merge.original_states = [
+            TicketSnapshot(ticket_id=tid, snapshot={"n": 0}),
+            TicketSnapshot(ticket_id=tid, snapshot={"n": 1}),
+        ]
+        assert merge.get_snapshot(tid) == {"n": 0}
+
+    def test_get_snapshot_index_tracks_list_changes(self) -> None:
+        first, second = uuid4(), uuid4()
+        merge = _make_merge()
+        merge.original_states = [TicketSnapshot(ticket_id=first, snapshot={"n": 1})]
+        assert merge.get_snapshot(second) is None
+        merge.original_states.append(TicketSnapshot(ticket_id=second, snapshot={"n": 2}))
+        assert merge.get_snapshot(second) == {"n": 2}
+        merge.original_states = []
+        assert merge.get_snapshot(first) is None
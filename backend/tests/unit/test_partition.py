@@ -0,0 +1,62 @@
+"""
+Unit tests for partition key helpers.
+
+Covers:
+- partition_key_for: zero padding and caching
+- build_partition_key: parity with strftime("%Y-%m")
+- partition_key_window: cached newest-first month window
+- partition_keys_between: month walk across year boundaries
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from lib.partition import (
+    build_partition_key,
+    partition_key_for,
+    partition_key_window,
+    partition_keys_between,
+)
+
+
+class TestPartitionKeyFor:
+    def test_zero_pads_month(self) -> None:
+        assert partition_key_for(2025, 1) == "2025-01"
+
+    def test_two_digit_month(self) -> None:
+        assert partition_key_for(2024, 12) == "2024-12"
+
+    def test_returns_cached_instance(self) -> None:
+        assert partition_key_for(2026, 3) is partition_key_for(2026, 3)
+
+
+class TestBuildPartitionKey:
+    def test_matches_strftime(self) -> None:
+        for month in range(1, 13):
+            ts = datetime(2025, month, 15, 10, 30, tzinfo=UTC)
+            assert build_partition_key(ts) == ts.strftime("%Y-%m")
+
+    def test_naive_timestamp(self) -> None:
+        assert build_partition_key(datetime(2025, 7, 1)) == "2025-07"
+
+
+class TestPartitionKeyWindow:
+    def test_spans_year_boundary_newest_first(self) -> None:
+        assert partition_key_window(2025, 1, 3) == ("2025-01", "2024-12", "2024-11")
+
+    def test_returns_cached_instance(self) -> None:
+        assert partition_key_window(2025, 6, 2) is partition_key_window(2025, 6, 2)
+
+
+class TestPartitionKeysBetween:
+    def test_same_month(self) -> None:
+        keys = partition_keys_between(datetime(2025, 3, 1), datetime(2025, 3, 31))
+        assert keys == ["2025-03"]
+
+    def test_spans_year_boundary_newest_first(self) -> None:
+        keys = partition_keys_between(datetime(2024, 11, 30), datetime(2025, 1, 2))
+        assert keys == ["2025-01", "2024-12", "2024-11"]
+
+    def test_start_after_end_is_empty(self) -> None:
+        assert partition_keys_between(datetime(2025, 4, 1), datetime(2025, 3, 1)) == []
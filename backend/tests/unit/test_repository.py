@@ -12,10 +12,16 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
-from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceNotFoundError
+from azure.core import MatchConditions
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,
+    CosmosHttpResponseError,
+    CosmosResourceNotFoundError,
+)
 from pydantic import BaseModel
 
-from repositories.base import BaseRepository
+from exceptions import InvalidOperationError
+from repositories.base import MAX_BATCH_BYTES, MAX_BATCH_OPERATIONS, BaseRepository
 
 # ---------------------------------------------------------------------------
 # Minimal domain model + concrete repo for testing
@@ -46,8 +52,11 @@ def mock_container() -> MagicMock:
     container = MagicMock()
     container.create_item = AsyncMock()
     container.read_item = AsyncMock()
+    container.read_items = AsyncMock()
     container.upsert_item = AsyncMock()
     container.delete_item = AsyncMock()
+    container.execute_item_batch = AsyncMock()
+    container.patch_item = AsyncMock()
     return container
 
 
@@ -109,6 +118,15 @@ class TestBaseRepositoryCreate:
         with pytest.raises(CosmosHttpResponseError):
             await repo.create(item, "2025-01")
 
+    async def test_create_without_content_returns_input(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        item = _make_item()
+        mock_container.create_item.return_value = {}
+        result = await repo.create(item, "2025-01", return_content=False)
+        assert result is item
+        assert mock_container.create_item.call_args.kwargs["no_response"] is True
+
 
 # ---------------------------------------------------------------------------
 # BaseRepository.get_by_id
@@ -150,6 +168,52 @@ class TestBaseRepositoryGetById:
         assert result is not None
 
 
+# ---------------------------------------------------------------------------
+# BaseRepository.get_many
+# ---------------------------------------------------------------------------
+
+
+class TestBaseRepositoryGetMany:
+    async def test_reads_all_ids_in_one_call_keyed_by_id(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        first, second = _make_item("a"), _make_item("b")
+        missing = uuid4()
+        mock_container.read_items.return_value = [first.model_dump(), second.model_dump()]
+
+        result = await repo.get_many([first.id, missing, second.id], "2025-01")
+
+        mock_container.read_items.assert_awaited_once_with(
+            items=[(first.id, "2025-01"), (str(missing), "2025-01"), (second.id, "2025-01")]
+        )
+        assert {k: v.name for k, v in result.items()} == {first.id: "a", second.id: "b"}
+
+    async def test_keys_results_by_ids_as_passed(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        item_id = uuid4()
+        mock_container.read_items.return_value = [
+            {"id": str(item_id), "pk": "2025-01", "name": "a"}
+        ]
+
+        result = await repo.get_many([item_id], "2025-01")
+
+        assert list(result) == [item_id]
+
+    async def test_empty_ids_skip_the_request(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        assert await repo.get_many([], "2025-01") == {}
+        mock_container.read_items.assert_not_awaited()
+
+    async def test_propagates_cosmos_error(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.read_items.side_effect = _make_cosmos_error(503)
+        with pytest.raises(CosmosHttpResponseError):
+            await repo.get_many([str(uuid4())], "2025-01")
+
+
 # ---------------------------------------------------------------------------
 # BaseRepository.update
 # ---------------------------------------------------------------------------
@@ -178,6 +242,150 @@ class TestBaseRepositoryUpdate:
         with pytest.raises(CosmosHttpResponseError):
             await repo.update(item, "2025-01")
 
+    async def test_update_without_content_returns_input(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        item = _make_item()
+        mock_container.upsert_item.return_value = {}
+        result = await repo.update(item, "2025-01", return_content=False)
+        assert result is item
+        assert mock_container.upsert_item.call_args.kwargs["no_response"] is True
+
+
+# ---------------------------------------------------------------------------
+# BaseRepository.patch
+# ---------------------------------------------------------------------------
+
+
+class TestBaseRepositoryPatch:
+    async def test_patch_returns_entity(self, repo: _TestRepo, mock_container: MagicMock) -> None:
+        item = _make_item("patched")
+        mock_container.patch_item.return_value = item.model_dump()
+        ops = [{"op": "set", "path": "/name", "value": "patched"}]
+        result = await repo.patch(item.id, "2025-01", ops)
+        assert result is not None
+        assert result.name == "patched"
+        mock_container.patch_item.assert_awaited_once_with(
+            item=item.id, partition_key="2025-01", patch_operations=ops
+        )
+        mock_container.read_item.assert_not_called()
+
+    async def test_patch_forwards_filter_predicate(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.patch_item.return_value = _make_item().model_dump()
+        await repo.patch("x", "2025-01", [], filter_predicate="FROM c WHERE c.name = 'a'")
+        kwargs = mock_container.patch_item.call_args.kwargs
+        assert kwargs["filter_predicate"] == "FROM c WHERE c.name = 'a'"
+
+    async def test_patch_with_etag_sends_if_match(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.patch_item.return_value = _make_item().model_dump()
+        await repo.patch("x", "2025-01", [], etag='"etag-1"')
+        kwargs = mock_container.patch_item.call_args.kwargs
+        assert kwargs["etag"] == '"etag-1"'
+        assert kwargs["match_condition"] == MatchConditions.IfNotModified
+
+    async def test_patch_not_found_returns_none(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.patch_item.side_effect = CosmosResourceNotFoundError(message="missing")
+        assert await repo.patch("x", "2025-01", []) is None
+
+    async def test_patch_precondition_failure_propagates(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.patch_item.side_effect = CosmosAccessConditionFailedError(message="412")
+        with pytest.raises(CosmosAccessConditionFailedError):
+            await repo.patch("x", "2025-01", [], filter_predicate="FROM c WHERE false")
+
+
+# ---------------------------------------------------------------------------
+# BaseRepository.upsert_many / create_many
+# ---------------------------------------------------------------------------
+
+
+class TestBaseRepositoryUpsertMany:
+    async def test_single_batch_for_small_input(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        items = [_make_item(f"n{i}") for i in range(3)]
+        await repo.upsert_many(items, "2025-01")
+        mock_container.execute_item_batch.assert_awaited_once()
+        kwargs = mock_container.execute_item_batch.await_args.kwargs
+        assert kwargs["partition_key"] == "2025-01"
+        assert kwargs["batch_operations"] == [("upsert", (i.model_dump(),)) for i in items]
+
+    async def test_splits_at_batch_limit(self, repo: _TestRepo, mock_container: MagicMock) -> None:
+        items = [_make_item() for _ in range(MAX_BATCH_OPERATIONS + 1)]
+        await repo.upsert_many(items, "2025-01")
+        sizes = [
+            len(call.kwargs["batch_operations"])
+            for call in mock_container.execute_item_batch.await_args_list
+        ]
+        assert sizes == [MAX_BATCH_OPERATIONS, 1]
+
+    async def test_empty_input_makes_no_request(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        await repo.upsert_many([], "2025-01")
+        mock_container.execute_item_batch.assert_not_awaited()
+
+    async def test_propagates_cosmos_error(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.execute_item_batch.side_effect = _make_cosmos_error(429)
+        with pytest.raises(CosmosHttpResponseError):
+            await repo.upsert_many([_make_item()], "2025-01")
+
+    async def test_splits_at_payload_limit(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        big = "x" * (MAX_BATCH_BYTES // 2)
+        items = [_make_item(big) for _ in range(3)]
+        await repo.upsert_many(items, "2025-01")
+        sizes = [
+            len(call.kwargs["batch_operations"])
+            for call in mock_container.execute_item_batch.await_args_list
+        ]
+        assert sizes == [1, 1, 1]
+
+    async def test_create_many_uses_create_operations(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        items = [_make_item(f"n{i}") for i in range(2)]
+        await repo.create_many(items, "2025-01")
+        kwargs = mock_container.execute_item_batch.await_args.kwargs
+        assert kwargs["batch_operations"] == [("create", (i.model_dump(),)) for i in items]
+
+
+class TestBaseRepositoryPatchMany:
+    async def test_sends_patch_operations_in_one_batch(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        ops = [{"op": "set", "path": "/name", "value": "x"}]
+        await repo.patch_many([("a", ops), ("b", ops)], "2025-01")
+        mock_container.execute_item_batch.assert_awaited_once()
+        kwargs = mock_container.execute_item_batch.await_args.kwargs
+        assert kwargs["partition_key"] == "2025-01"
+        assert kwargs["batch_operations"] == [("patch", ("a", ops)), ("patch", ("b", ops))]
+
+    async def test_splits_at_batch_limit(self, repo: _TestRepo, mock_container: MagicMock) -> None:
+        ops = [{"op": "set", "path": "/name", "value": "x"}]
+        await repo.patch_many([(str(i), ops) for i in range(MAX_BATCH_OPERATIONS + 1)], "2025-01")
+        sizes = [
+            len(call.kwargs["batch_operations"])
+            for call in mock_container.execute_item_batch.await_args_list
+        ]
+        assert sizes == [MAX_BATCH_OPERATIONS, 1]
+
+    async def test_empty_input_makes_no_request(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        await repo.patch_many([], "2025-01")
+        mock_container.execute_item_batch.assert_not_awaited()
+
 
 # ---------------------------------------------------------------------------
 # BaseRepository.delete
@@ -266,6 +474,16 @@ class TestBaseRepositoryQuery:
         with pytest.raises(CosmosHttpResponseError):
             await repo.query("SELECT * FROM c")
 
+    async def test_query_converts_batch_via_from_documents(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        docs = [_make_item("a").model_dump(), _make_item("b").model_dump()]
+        mock_container.query_items = MagicMock(return_value=_async_gen_items(docs))
+        repo._from_documents = MagicMock(wraps=repo._from_documents)  # type: ignore[method-assign]
+        results = await repo.query("SELECT * FROM c")
+        repo._from_documents.assert_called_once_with(docs)
+        assert [r.name for r in results] == ["a", "b"]
+
     async def test_query_with_parameters(self, repo: _TestRepo, mock_container: MagicMock) -> None:
         item = _make_item()
         mock_container.query_items = MagicMock(return_value=_async_gen_items([item.model_dump()]))
@@ -276,6 +494,120 @@ class TestBaseRepositoryQuery:
         assert len(results) == 1
 
 
+class _FakePager:
+    """Stands in for the SDK page iterator returned by query_items().by_page()."""
+
+    def __init__(self, pages: list[list[dict[str, Any]]], token: str | None) -> None:
+        self._pages = iter(pages)
+        self.continuation_token = token
+
+    def __aiter__(self) -> _FakePager:
+        return self
+
+    async def __anext__(self):  # type: ignore[no-untyped-def]
+        try:
+            return _async_gen_items(next(self._pages))
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestBaseRepositoryQueryPage:
+    async def test_returns_page_and_token(self, repo: _TestRepo, mock_container: MagicMock) -> None:
+        docs = [_make_item("a").model_dump(), _make_item("b").model_dump()]
+        paged = MagicMock()
+        paged.by_page.return_value = _FakePager([docs], "token-2")
+        mock_container.query_items = MagicMock(return_value=paged)
+        items, next_page = await repo.query_page(
+            "SELECT * FROM c", partition_key="2025-01", max_item_count=2, continuation="token-1"
+        )
+        assert [i.name for i in items] == ["a", "b"]
+        assert next_page == "token-2"
+        paged.by_page.assert_called_once_with("token-1")
+        call_kwargs = mock_container.query_items.call_args.kwargs
+        # No OFFSET/LIMIT: the page size and the token drive paging
+        assert call_kwargs["query"] == "SELECT * FROM c"
+        assert call_kwargs["max_item_count"] == 2
+
+    async def test_empty_result(self, repo: _TestRepo, mock_container: MagicMock) -> None:
+        paged = MagicMock()
+        paged.by_page.return_value = _FakePager([], None)
+        mock_container.query_items = MagicMock(return_value=paged)
+        assert await repo.query_page("SELECT * FROM c") == ([], None)
+
+    async def test_rejected_continuation_is_invalid_operation(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        paged = MagicMock()
+        paged.by_page.side_effect = _make_cosmos_error(400)
+        mock_container.query_items = MagicMock(return_value=paged)
+        with pytest.raises(InvalidOperationError):
+            await repo.query_page("SELECT * FROM c", continuation="garbage")
+
+    async def test_bad_request_without_continuation_propagates(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        paged = MagicMock()
+        paged.by_page.side_effect = _make_cosmos_error(400)
+        mock_container.query_items = MagicMock(return_value=paged)
+        with pytest.raises(CosmosHttpResponseError):
+            await repo.query_page("SELECT * FROM c")
+
+
+class TestBaseRepositoryIterQuery:
+    async def test_yields_entities_as_they_arrive(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        seen: list[str] = []
+
+        async def _tracking_gen(docs: list[dict[str, Any]]):  # type: ignore[no-untyped-def]
+            for doc in docs:
+                seen.append(doc["name"])
+                yield doc
+
+        docs = [_make_item(f"item-{i}").model_dump() for i in range(3)]
+        mock_container.query_items = MagicMock(return_value=_tracking_gen(docs))
+        stream = repo.iter_query("SELECT * FROM c", partition_key="2025-01")
+        first = await anext(stream)
+        # Only the first document has been pulled from the SDK iterator
+        assert first.name == "item-0"
+        assert seen == ["item-0"]
+        assert [item.name async for item in stream] == ["item-1", "item-2"]
+
+    async def test_builds_same_query_as_query(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.query_items = MagicMock(return_value=_async_gen_items([]))
+        assert [x async for x in repo.iter_query("SELECT * FROM c", offset=5)] == []
+        call_kwargs = mock_container.query_items.call_args.kwargs
+        assert call_kwargs["query"] == "SELECT * FROM c OFFSET 5 LIMIT 100"
+        assert "partition_key" not in call_kwargs
+
+    async def test_propagates_cosmos_error(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        mock_container.query_items = MagicMock(side_effect=_make_cosmos_error(500))
+        with pytest.raises(CosmosHttpResponseError):
+            await anext(repo.iter_query("SELECT * FROM c"))
+
+    async def test_projection_yields_raw_dicts(
+        self, repo: _TestRepo, mock_container: MagicMock
+    ) -> None:
+        raw = [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+        mock_container.query_items = MagicMock(return_value=_async_gen_items(raw))
+        results = [
+            row
+            async for row in repo.iter_query_with_projection(
+                fields=["id", "name"], order_by="c.name ASC", max_item_count=2
+            )
+        ]
+        assert results == raw
+        call_kwargs = mock_container.query_items.call_args.kwargs
+        assert (
+            call_kwargs["query"]
+            == "SELECT c.id, c.name FROM c ORDER BY c.name ASC OFFSET 0 LIMIT 2"
+        )
+
+
 # ---------------------------------------------------------------------------
 # BaseRepository.query_with_projection
 # ---------------------------------------------------------------------------
@@ -339,7 +671,8 @@ class TestBaseRepositoryCount:
         result = await repo.count(query="c.status = 'open'")
         assert result == 3
         call_kwargs = mock_container.query_items.call_args.kwargs
-        assert "WHERE" in call_kwargs["query"]
+        # VALUE keeps the result a bare scalar the index can answer, not {"$1": n}
+        assert call_kwargs["query"] == "SELECT VALUE COUNT(1) FROM c WHERE c.status = 'open'"
 
     async def test_count_empty_result_returns_zero(
         self, repo: _TestRepo, mock_container: MagicMock
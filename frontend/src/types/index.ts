@@ -14,6 +14,7 @@ export interface PaginationMeta {
   offset: number;
   limit: number;
   hasMore: boolean;
+  continuationToken?: string | null;
 }
 
 export interface PaginatedResponse<T> {